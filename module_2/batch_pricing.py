@@ -0,0 +1,76 @@
+from array import array
+
+import numpy as np
+
+from main_m2 import (
+    COST_PER_FOOT,
+    COST_PER_FOOT_GREATER_100,
+    COST_PER_FOOT_GREATER_250,
+    COST_PER_FOOT_GREATER_500,
+)
+
+# Tier boundaries in feet. A length strictly greater than a boundary moves into the next tier,
+# which matches the "cable_length > 100" style checks in calculate_bulk_discount_price.
+TIER_BOUNDARIES = np.array([100.0, 250.0, 500.0])
+TIER_PRICES = np.array([COST_PER_FOOT, COST_PER_FOOT_GREATER_100, COST_PER_FOOT_GREATER_250, COST_PER_FOOT_GREATER_500])
+
+# Scaled values whose fractional part is this close to .5 are re-rounded with Python's round()
+HALF_CENT_TOLERANCE = 1e-6
+
+
+# Quote a whole batch of cable lengths in one vectorized pass.
+# Returns (cost_per_foot, total_cost) with the same container type as the input.
+def quote_cable_lengths(cable_lengths, boundaries=TIER_BOUNDARIES, prices=TIER_PRICES):
+    lengths = _as_float_array(cable_lengths)
+
+    if lengths.size and not (lengths > 0).all():
+        raise ValueError("Cable length must be a positive number")
+
+    cost_per_foot = prices[np.searchsorted(boundaries, lengths, side='left')]
+    total_cost = round_to_cents(lengths * cost_per_foot)
+
+    if isinstance(cable_lengths, array):
+        return array('d', cost_per_foot.tobytes()), array('d', total_cost.tobytes())
+
+    return cost_per_foot, total_cost
+
+
+# Round an array of dollar amounts to 2 decimal places exactly like round(value, 2) does.
+# np.rint(amount * 100) can land on the wrong side of a half cent because the multiply rounds,
+# so values sitting close to a half cent are decided again with an exact comparison.
+def round_to_cents(amounts):
+    scaled = amounts * 100
+    cents = np.rint(scaled)
+
+    floor_cents = np.floor(scaled)
+    near_half = np.flatnonzero(np.abs(scaled - floor_cents - 0.5) < HALF_CENT_TOLERANCE)
+    if near_half.size:
+        cents[near_half] = _round_half_cent_exactly(amounts[near_half], floor_cents[near_half])
+
+    return cents / 100
+
+
+# Decide which way amounts near a half cent round by comparing amount * 200 with the odd
+# number 2 * floor_cents + 1 without any rounding error, then round exact ties to even like round().
+def _round_half_cent_exactly(amounts, floor_cents):
+    # Error free product: amount * 200 == product + error exactly (Dekker's split)
+    product = amounts * 200
+    split = 134217729.0 * amounts
+    high = split - (split - amounts)
+    low = amounts - high
+    error = (high * 200 - product) + low * 200
+
+    half_cent = 2 * floor_cents + 1
+    difference = (product - half_cent) + error
+
+    ceil_cents = floor_cents + 1
+    tie_cents = np.where(floor_cents % 2 == 0, floor_cents, ceil_cents)
+    return np.where(difference > 0, ceil_cents, np.where(difference < 0, floor_cents, tie_cents))
+
+
+# View the input as a float64 NumPy array, without copying when the input already is one
+def _as_float_array(cable_lengths):
+    if isinstance(cable_lengths, array) and cable_lengths.typecode == 'd':
+        return np.frombuffer(cable_lengths, dtype=np.float64)
+
+    return np.asarray(cable_lengths, dtype=np.float64)
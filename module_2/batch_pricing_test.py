@@ -0,0 +1,52 @@
+import unittest
+from array import array
+
+import numpy as np
+
+from main_m2 import calculate_bulk_discount_price, calculate_cost_of_cable
+from batch_pricing import quote_cable_lengths, round_to_cents
+
+
+class TestBatchPricing(unittest.TestCase):
+    def test_given_tier_boundaries_then_return_same_prices_as_scalar(self):
+        lengths = np.array([1.5, 10, 100, 100.01, 101, 250, 251, 500, 500.5, 501, 10000])
+        cost_per_foot, total_cost = quote_cable_lengths(lengths)
+
+        for i, length in enumerate(lengths.tolist()):
+            expected_cost_per_foot = calculate_bulk_discount_price(length)
+            self.assertEqual(cost_per_foot[i], expected_cost_per_foot)
+            self.assertEqual(total_cost[i], calculate_cost_of_cable(length, expected_cost_per_foot))
+
+    def test_given_random_lengths_then_match_scalar_path_exactly(self):
+        rng = np.random.default_rng(7)
+        lengths = np.concatenate([np.round(rng.uniform(0.01, 1000, 50_000), 2), rng.uniform(0.01, 1000, 50_000)])
+        cost_per_foot, total_cost = quote_cable_lengths(lengths)
+
+        expected = [calculate_cost_of_cable(length, calculate_bulk_discount_price(length)) for length in lengths.tolist()]
+        self.assertEqual(total_cost.tolist(), expected)
+
+    def test_given_half_cent_amounts_then_round_like_builtin_round(self):
+        amounts = np.array([1.305, 2.675, 0.125, 0.005, 1.005, 8.7, 250.5])
+        self.assertEqual(round_to_cents(amounts).tolist(), [round(amount, 2) for amount in amounts.tolist()])
+
+    def test_given_array_of_doubles_then_return_array_of_doubles(self):
+        cost_per_foot, total_cost = quote_cable_lengths(array('d', [10, 101, 501]))
+
+        self.assertIsInstance(total_cost, array)
+        self.assertEqual(list(cost_per_foot), [0.87, 0.80, 0.50])
+        self.assertEqual(list(total_cost), [8.7, 80.8, 250.5])
+
+    def test_given_empty_batch_then_return_empty_results(self):
+        cost_per_foot, total_cost = quote_cable_lengths(np.array([]))
+        self.assertEqual(len(cost_per_foot), 0)
+        self.assertEqual(len(total_cost), 0)
+
+    def test_given_non_positive_length_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            quote_cable_lengths(np.array([10, 0, 20]))
+        with self.assertRaises(ValueError):
+            quote_cable_lengths(array('d', [-5]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+# Benchmarks for the module 2 cable pricing code.
+# Run with: python benchmark_m2.py
+
+import io
+import time
+from decimal import Decimal, ROUND_HALF_UP
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from main_m2 import COMPANY_NAME, calculate_bulk_discount_price, calculate_cost_of_cable, print_invoice
+from batch_pricing import quote_cable_lengths
+from pricing_table import PricingTable
+from invoice_writer import InvoiceWriter
+from main_discussion import does_it_fiz_buzz
+from fizz_buzz import fizz_buzz_chunks, iter_fizz_buzz, write_fizz_buzz
+from money import calculate_bulk_discount_price_cents, calculate_cost_of_cable_cents, parse_feet, quote_cable_lengths_cents
+
+
+# Time a function call and return the elapsed seconds
+def time_it(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+# Price every length with the scalar functions, one at a time
+def quote_with_scalar_loop(cable_lengths):
+    results = []
+    for length in cable_lengths:
+        cost_per_foot = calculate_bulk_discount_price(length)
+        results.append((cost_per_foot, calculate_cost_of_cable(length, cost_per_foot)))
+    return results
+
+
+def benchmark_batch_quoting(count=1_000_000):
+    rng = np.random.default_rng(42)
+    lengths = np.round(rng.uniform(0.01, 1000, count), 2)
+    length_list = lengths.tolist()
+
+    scalar_seconds = time_it(quote_with_scalar_loop, length_list)
+    batch_seconds = time_it(quote_cable_lengths, lengths)
+
+    print(f"Batch quoting of {count:,} lengths")
+    print(f"  scalar loop: {scalar_seconds:8.3f} s")
+    print(f"  vectorized:  {batch_seconds:8.3f} s  ({scalar_seconds / batch_seconds:,.1f}x faster)")
+
+
+def benchmark_pricing_table_lookup(lookups=200_000):
+    rng = np.random.default_rng(42)
+    lengths = rng.uniform(0.01, 100_000, lookups).tolist()
+
+    print(f"PricingTable lookups ({lookups:,} per tier count)")
+    for tier_count in (4, 64, 1_024, 16_384, 262_144):
+        over_feet = np.linspace(0, 100_000, tier_count, endpoint=False)
+        table = PricingTable(zip(over_feet, np.linspace(1.0, 0.1, tier_count)))
+
+        seconds = time_it(lambda: [table.calculate_bulk_discount_price(length) for length in lengths])
+        print(f"  {tier_count:>8,} tiers: {seconds / lookups * 1e9:8.1f} ns per lookup")
+
+
+# Print every invoice with print_invoice into a throwaway buffer
+def print_invoices(invoices):
+    with redirect_stdout(io.StringIO()):
+        for invoice in invoices:
+            print_invoice(COMPANY_NAME, *invoice)
+
+
+def benchmark_invoice_writer(count=100_000):
+    rng = np.random.default_rng(42)
+    lengths = np.round(rng.uniform(0.01, 1000, count), 2)
+    invoices = list(zip(lengths.tolist(), *(column.tolist() for column in quote_cable_lengths(lengths))))
+
+    print_seconds = time_it(print_invoices, invoices)
+    stats = InvoiceWriter().write(invoices, io.BytesIO())
+
+    print(f"Rendering {count:,} invoices")
+    print(f"  print_invoice:  {count / print_seconds:12,.0f} invoices/s")
+    print(f"  InvoiceWriter:  {stats['invoices_per_second']:12,.0f} invoices/s")
+
+
+# Total a batch with the float functions
+def total_with_floats(cable_lengths):
+    total = 0.0
+    for length in cable_lengths:
+        total += calculate_cost_of_cable(length, calculate_bulk_discount_price(length))
+    return total
+
+
+# Total a batch with Decimal, rounding every line half up to the cent
+def total_with_decimal(cable_lengths):
+    cent = Decimal('0.01')
+    total = Decimal(0)
+    for length in cable_lengths:
+        cost_per_foot = Decimal(str(calculate_bulk_discount_price(float(length))))
+        total += (length * cost_per_foot).quantize(cent, rounding=ROUND_HALF_UP)
+    return total
+
+
+# Total a batch with the fixed-point functions
+def total_with_cents(cable_lengths):
+    total = 0
+    for length in cable_lengths:
+        total += calculate_cost_of_cable_cents(length, calculate_bulk_discount_price_cents(length))
+    return total
+
+
+def benchmark_money_modes(count=1_000_000):
+    rng = np.random.default_rng(42)
+    length_texts = [f"{length:.3f}" for length in rng.uniform(0.01, 1000, count)]
+    float_lengths = [float(text) for text in length_texts]
+    decimal_lengths = [Decimal(text) for text in length_texts]
+    fixed_lengths = [parse_feet(text) for text in length_texts]
+    fixed_array = np.array(fixed_lengths, dtype=np.int64)
+
+    print(f"Pricing and totaling {count:,} lengths")
+    print(f"  float:               {time_it(total_with_floats, float_lengths):8.3f} s")
+    print(f"  Decimal:             {time_it(total_with_decimal, decimal_lengths):8.3f} s")
+    print(f"  fixed-point:         {time_it(total_with_cents, fixed_lengths):8.3f} s")
+    print(f"  fixed-point batch:   {time_it(lambda: quote_cable_lengths_cents(fixed_array)[1].sum()):8.3f} s")
+
+
+# Consume an iterable without keeping it
+def exhaust(iterable):
+    for _ in iterable:
+        pass
+
+
+def benchmark_fizz_buzz(n=10_000_000):
+    print(f"FizzBuzz up to {n:,}")
+    print(f"  list (does_it_fiz_buzz): {time_it(does_it_fiz_buzz, n):8.3f} s")
+    print(f"  generator:               {time_it(exhaust, iter_fizz_buzz(n)):8.3f} s")
+    print(f"  chunked lists:           {time_it(exhaust, fizz_buzz_chunks(n)):8.3f} s")
+    print(f"  streamed bytes:          {time_it(write_fizz_buzz, n, io.BytesIO()):8.3f} s")
+
+
+def main():
+    benchmark_batch_quoting()
+    benchmark_pricing_table_lookup()
+    benchmark_invoice_writer()
+    benchmark_money_modes()
+    benchmark_fizz_buzz()
+
+
+if __name__ == "__main__":
+    main()
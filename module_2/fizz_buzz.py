@@ -0,0 +1,88 @@
+# Fast FizzBuzz sequences for very large n.
+# The sequence repeats every 15 numbers, so whole blocks of 15 are emitted from a fixed pattern
+# with no modulo work per number. The results are the same as does_it_fiz_buzz in main_discussion.py.
+
+from itertools import chain
+
+FIZZ_BUZZ_PERIOD = 15
+
+# Numbers per chunk. Always a whole number of periods.
+DEFAULT_CHUNK_SIZE = FIZZ_BUZZ_PERIOD * 4096
+
+# The value for each position in a period, None where the number itself is used
+PATTERN = (None, None, "Fizz", None, "Buzz", "Fizz", None, None, "Fizz", "Buzz", None, "Fizz", None, None, "FizzBuzz")
+
+# One period as newline delimited bytes, filled in with the 8 numbers that are not replaced
+BLOCK_BYTES_FORMAT = b"%d\n%d\nFizz\n%d\nBuzz\nFizz\n%d\n%d\nFizz\nBuzz\n%d\nFizz\n%d\n%d\nFizzBuzz\n"
+
+
+# Return the value at a 0 based index of the sequence, the same as does_it_fiz_buzz(n)[index]
+def fizz_buzz_nth(index):
+    if index < 0:
+        raise ValueError("Index must not be negative")
+
+    value = PATTERN[index % FIZZ_BUZZ_PERIOD]
+    return index + 1 if value is None else value
+
+
+# Yield the sequence for 1..n one value at a time, with constant memory
+def iter_fizz_buzz(n):
+    return chain.from_iterable(fizz_buzz_chunks(n))
+
+
+# Yield the sequence for 1..n as lists of at most chunk_size values
+def fizz_buzz_chunks(n, chunk_size=DEFAULT_CHUNK_SIZE):
+    blocks_per_chunk = _blocks_per_chunk(chunk_size)
+    full_blocks_end = n - n % FIZZ_BUZZ_PERIOD
+
+    for chunk_start in range(0, full_blocks_end, blocks_per_chunk * FIZZ_BUZZ_PERIOD):
+        chunk_end = min(chunk_start + blocks_per_chunk * FIZZ_BUZZ_PERIOD, full_blocks_end)
+        yield [value
+               for b in range(chunk_start, chunk_end, FIZZ_BUZZ_PERIOD)
+               for value in (b + 1, b + 2, "Fizz", b + 4, "Buzz", "Fizz", b + 7, b + 8, "Fizz", "Buzz",
+                             b + 11, "Fizz", b + 13, b + 14, "FizzBuzz")]
+
+    if full_blocks_end < n:
+        yield [fizz_buzz_nth(index) for index in range(full_blocks_end, n)]
+
+
+# Render the numbers first..last (inclusive) as newline delimited bytes
+def render_fizz_buzz_range(first, last):
+    if first < 1:
+        raise ValueError("The range must start at 1 or later")
+
+    # Whole periods in the middle come from the block format, the partial ends from the pattern
+    block_start = -(-(first - 1) // FIZZ_BUZZ_PERIOD) * FIZZ_BUZZ_PERIOD
+    block_end = max(last // FIZZ_BUZZ_PERIOD * FIZZ_BUZZ_PERIOD, block_start)
+
+    head = _render_values(first - 1, min(block_start, last))
+    body = b"".join([BLOCK_BYTES_FORMAT % (b + 1, b + 2, b + 4, b + 7, b + 8, b + 11, b + 13, b + 14)
+                     for b in range(block_start, block_end, FIZZ_BUZZ_PERIOD)])
+    tail = _render_values(max(block_end, first - 1), last)
+    return head + body + tail
+
+
+# Yield the sequence for 1..n as newline delimited bytes, chunk_size numbers at a time
+def iter_fizz_buzz_bytes(n, chunk_size=DEFAULT_CHUNK_SIZE):
+    chunk_size = _blocks_per_chunk(chunk_size) * FIZZ_BUZZ_PERIOD
+    for first in range(1, n + 1, chunk_size):
+        yield render_fizz_buzz_range(first, min(first + chunk_size - 1, n))
+
+
+# Stream the sequence for 1..n to a binary writable with constant memory. Returns the bytes written.
+def write_fizz_buzz(n, output, chunk_size=DEFAULT_CHUNK_SIZE):
+    written = 0
+    for data in iter_fizz_buzz_bytes(n, chunk_size):
+        output.write(data)
+        written += len(data)
+    return written
+
+
+def _render_values(start_index, end_index):
+    return b"".join([b"%s\n" % str(fizz_buzz_nth(index)).encode() for index in range(start_index, end_index)])
+
+
+def _blocks_per_chunk(chunk_size):
+    if chunk_size < FIZZ_BUZZ_PERIOD:
+        raise ValueError(f"Chunk size must be at least {FIZZ_BUZZ_PERIOD}")
+    return chunk_size // FIZZ_BUZZ_PERIOD
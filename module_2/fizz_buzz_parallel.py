@@ -0,0 +1,139 @@
+# Multi-core FizzBuzz throughput benchmark.
+# Splits 1..n into chunks aligned to the period of 15, renders each chunk in a worker process and
+# writes it straight into its place in a memory-mapped output file.
+# Run with: python fizz_buzz_parallel.py 1000000000 fizz_buzz.txt --workers 8
+
+import argparse
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from fizz_buzz import FIZZ_BUZZ_PERIOD, render_fizz_buzz_range
+
+# Numbers rendered per task. A multiple of 15 so every chunk starts on a new period.
+DEFAULT_CHUNK_NUMBERS = FIZZ_BUZZ_PERIOD * 200_000
+
+FIZZ_LINE_BYTES = len(b"Fizz\n")
+BUZZ_LINE_BYTES = len(b"Buzz\n")
+FIZZ_BUZZ_LINE_BYTES = len(b"FizzBuzz\n")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    try:
+        stats = write_fizz_buzz_parallel(args.n, args.output, args.workers, args.chunk_numbers)
+    except (OSError, ValueError) as e:
+        print(f"Error writing FizzBuzz: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Wrote {stats['bytes']:,} bytes for 1..{args.n:,} with {stats['workers']} workers "
+          f"in {stats['seconds']:,.3f} seconds ({stats['gb_per_second']:,.3f} GB/s)")
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Write the FizzBuzz sequence for 1..n to a file using every core.")
+    parser.add_argument('n', type=int, help="The last number of the sequence")
+    parser.add_argument('output', help="File to write the sequence to")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument('--chunk-numbers', type=int, default=DEFAULT_CHUNK_NUMBERS,
+                        help="Numbers rendered per task, rounded down to a multiple of 15")
+    return parser.parse_args(argv)
+
+
+# Write the sequence for 1..n to file_name in parallel. Returns the bytes written, workers, seconds and GB/s.
+def write_fizz_buzz_parallel(n, file_name, workers=None, chunk_numbers=DEFAULT_CHUNK_NUMBERS):
+    if n < 0:
+        raise ValueError("n must not be negative")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = plan_chunks(n, chunk_numbers)
+    total_bytes = fizz_buzz_byte_length(1, n)
+
+    start = time.perf_counter()
+
+    # Size the file up front so every worker can map and fill its own region
+    with open(file_name, 'wb') as file:
+        file.truncate(total_bytes)
+
+    if chunks:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Reading every result makes sure a failed chunk raises here
+            list(executor.map(render_chunk_into_file, [file_name] * len(chunks), *zip(*chunks)))
+
+    seconds = time.perf_counter() - start
+
+    return {
+        'bytes': total_bytes,
+        'workers': workers,
+        'seconds': seconds,
+        'gb_per_second': total_bytes / seconds / 1e9 if seconds else 0.0,
+    }
+
+
+# Split 1..n into (first, last, byte offset) chunks, each starting on a multiple of 15 plus one
+def plan_chunks(n, chunk_numbers=DEFAULT_CHUNK_NUMBERS):
+    if chunk_numbers < FIZZ_BUZZ_PERIOD:
+        raise ValueError(f"Chunk numbers must be at least {FIZZ_BUZZ_PERIOD}")
+
+    chunk_numbers -= chunk_numbers % FIZZ_BUZZ_PERIOD
+    chunks = []
+    offset = 0
+
+    for first in range(1, n + 1, chunk_numbers):
+        last = min(first + chunk_numbers - 1, n)
+        chunks.append((first, last, offset))
+        offset += fizz_buzz_byte_length(first, last)
+
+    return chunks
+
+
+# Worker task: render first..last and copy it into file_name at offset through a memory map
+def render_chunk_into_file(file_name, first, last, offset):
+    data = render_fizz_buzz_range(first, last)
+
+    # mmap offsets must be a multiple of the allocation granularity
+    map_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
+    start = offset - map_offset
+
+    with open(file_name, 'r+b') as file:
+        with mmap.mmap(file.fileno(), start + len(data), offset=map_offset) as mapped:
+            mapped[start:start + len(data)] = data
+
+    return len(data)
+
+
+# Return the exact number of bytes render_fizz_buzz_range(first, last) produces, without rendering it
+def fizz_buzz_byte_length(first, last):
+    if last < first:
+        return 0
+
+    fizz_buzz = _multiples(first, last, 15)
+    fizz = _multiples(first, last, 3) - fizz_buzz
+    buzz = _multiples(first, last, 5) - fizz_buzz
+
+    total = (last - first + 1) + fizz * FIZZ_LINE_BYTES + buzz * BUZZ_LINE_BYTES + fizz_buzz * FIZZ_BUZZ_LINE_BYTES
+    total -= fizz + buzz + fizz_buzz  # The newlines of the words were already counted above
+
+    # Numbers that are printed as digits, grouped by how many digits they have
+    digits = 1
+    while 10 ** (digits - 1) <= last:
+        low = max(first, 10 ** (digits - 1))
+        high = min(last, 10 ** digits - 1)
+        if low <= high:
+            replaced = _multiples(low, high, 3) + _multiples(low, high, 5) - _multiples(low, high, 15)
+            total += digits * (high - low + 1 - replaced)
+        digits += 1
+
+    return total
+
+
+def _multiples(first, last, k):
+    return last // k - (first - 1) // k
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import os
+import tempfile
+import unittest
+
+from fizz_buzz import render_fizz_buzz_range
+from fizz_buzz_parallel import fizz_buzz_byte_length, plan_chunks, write_fizz_buzz_parallel
+
+
+class TestFizzBuzzParallel(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.output_path = os.path.join(self.test_dir.name, 'fizz_buzz.txt')
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    def test_fizz_buzz_byte_length_matches_rendered_length(self):
+        for first, last in [(1, 1), (1, 15), (1, 1000), (7, 123), (95, 10_005), (999_990, 1_000_020), (5, 4)]:
+            with self.subTest(first=first, last=last):
+                self.assertEqual(fizz_buzz_byte_length(first, last), len(render_fizz_buzz_range(first, last)))
+
+    def test_plan_chunks_are_aligned_and_contiguous(self):
+        chunks = plan_chunks(1000, chunk_numbers=100)
+
+        self.assertEqual(chunks[0], (1, 90, 0))
+        self.assertEqual(chunks[-1][1], 1000)
+        for (first, last, offset), (next_first, _, next_offset) in zip(chunks, chunks[1:]):
+            self.assertEqual(first % 15, 1)
+            self.assertEqual(next_first, last + 1)
+            self.assertEqual(next_offset, offset + fizz_buzz_byte_length(first, last))
+
+    def test_write_fizz_buzz_parallel_writes_chunks_in_order(self):
+        n = 100_003
+        stats = write_fizz_buzz_parallel(n, self.output_path, workers=2, chunk_numbers=15 * 300)
+
+        with open(self.output_path, 'rb') as file:
+            self.assertEqual(file.read(), render_fizz_buzz_range(1, n))
+        self.assertEqual(stats['bytes'], os.path.getsize(self.output_path))
+        self.assertGreater(stats['gb_per_second'], 0)
+
+    def test_write_fizz_buzz_parallel_with_nothing_to_write(self):
+        stats = write_fizz_buzz_parallel(0, self.output_path, workers=1)
+        self.assertEqual(stats['bytes'], 0)
+        self.assertEqual(os.path.getsize(self.output_path), 0)
+
+    def test_given_chunk_smaller_than_a_period_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            plan_chunks(100, chunk_numbers=14)
+
+
+if __name__ == '__main__':
+    unittest.main()
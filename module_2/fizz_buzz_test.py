@@ -0,0 +1,60 @@
+import io
+import unittest
+
+from main_discussion import does_it_fiz_buzz
+from fizz_buzz import (
+    fizz_buzz_chunks,
+    fizz_buzz_nth,
+    iter_fizz_buzz,
+    iter_fizz_buzz_bytes,
+    render_fizz_buzz_range,
+    write_fizz_buzz,
+)
+
+
+def as_bytes(values):
+    return ''.join(f"{value}\n" for value in values).encode()
+
+
+class TestFizzBuzz(unittest.TestCase):
+    def test_iter_fizz_buzz_matches_list_version(self):
+        for n in [0, 1, 14, 15, 16, 20, 100, 1000]:
+            with self.subTest(n=n):
+                self.assertEqual(list(iter_fizz_buzz(n)), does_it_fiz_buzz(n))
+
+    def test_fizz_buzz_chunks(self):
+        chunks = list(fizz_buzz_chunks(100, chunk_size=30))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [30, 30, 30, 10])
+        self.assertEqual([value for chunk in chunks for value in chunk], does_it_fiz_buzz(100))
+
+    def test_fizz_buzz_nth(self):
+        expected = does_it_fiz_buzz(1000)
+        for index in range(1000):
+            self.assertEqual(fizz_buzz_nth(index), expected[index])
+
+        self.assertEqual(fizz_buzz_nth(10 ** 12 - 1), "Buzz")
+        with self.assertRaises(ValueError):
+            fizz_buzz_nth(-1)
+
+    def test_render_fizz_buzz_range(self):
+        expected = does_it_fiz_buzz(200)
+        for first, last in [(1, 200), (1, 7), (20, 50), (20, 25), (16, 30), (31, 31), (5, 3)]:
+            with self.subTest(first=first, last=last):
+                self.assertEqual(render_fizz_buzz_range(first, last), as_bytes(expected[first - 1:last]))
+
+    def test_streaming_bytes(self):
+        self.assertEqual(b''.join(iter_fizz_buzz_bytes(1000, chunk_size=45)), as_bytes(does_it_fiz_buzz(1000)))
+
+        output = io.BytesIO()
+        written = write_fizz_buzz(1000, output, chunk_size=100)
+        self.assertEqual(output.getvalue(), as_bytes(does_it_fiz_buzz(1000)))
+        self.assertEqual(written, len(output.getvalue()))
+
+    def test_given_chunk_size_smaller_than_a_period_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            list(fizz_buzz_chunks(100, chunk_size=10))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+# Non-interactive invoice generation for files of cable lengths.
+# Run with: python invoice_cli.py jobs.csv -o invoices.txt --workers 8 --stream
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+
+import numpy as np
+
+from main_m2 import COMPANY_NAME
+from batch_pricing import quote_cable_lengths
+from invoice_writer import InvoiceWriter
+from money import parse_feet, quote_cable_lengths_cents
+from pricing_table import PricingTable
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    try:
+        price_table = PricingTable.from_file(args.price_book) if args.price_book else None
+
+        if args.output == '-':
+            stats = generate_invoices(args.input, sys.stdout.buffer, args.workers, args.chunk_size,
+                                      args.stream, args.max_pending, price_table, exact=args.exact)
+        else:
+            with _replace_on_success(args.output) as output:
+                stats = generate_invoices(args.input, output, args.workers, args.chunk_size,
+                                          args.stream, args.max_pending, price_table, exact=args.exact)
+    except (OSError, ValueError) as e:
+        print(f"Error generating invoices: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Wrote {stats['invoices']:,} invoices in {stats['seconds']:,.2f} seconds "
+          f"({stats['invoices_per_second']:,.0f} invoices/s)", file=sys.stderr)
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=f"Price and render {COMPANY_NAME} invoices for a file of cable lengths.")
+    parser.add_argument('input', help="CSV or newline separated file of cable lengths in feet (first column is used)")
+    parser.add_argument('-o', '--output', default='-', help="File to write the invoices to (default: stdout)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="Lengths priced per task")
+    parser.add_argument('--stream', action='store_true', help="Keep memory bounded by limiting the chunks in flight")
+    parser.add_argument('--max-pending', type=int, default=None, help="Chunks in flight in streaming mode (default: 2 per worker)")
+    parser.add_argument('--price-book', help="CSV price book to use instead of the built in tiers")
+    parser.add_argument('--exact', action='store_true', help="Use exact fixed-point money (totals rounded half up to the cent)")
+    return parser.parse_args(argv)
+
+
+# Price and render every length in file_name across a process pool and write the invoices in input order.
+# In streaming mode at most max_pending chunks are read ahead, so memory does not grow with the file size.
+def generate_invoices(file_name, output, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, stream=False,
+                      max_pending=None, price_table=None, company_name=COMPANY_NAME, exact=False) -> dict:
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be a positive number")
+    if exact and price_table is not None:
+        raise ValueError("Exact mode uses the built in tiers and cannot be combined with a price book")
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    count = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if stream:
+            max_pending = max_pending or 2 * workers
+            rendered_chunks = _map_in_order(executor, chunked(read_cable_lengths(file_name, exact), chunk_size),
+                                            max_pending, company_name, price_table, exact)
+        else:
+            chunks = list(chunked(read_cable_lengths(file_name, exact), chunk_size))
+            rendered_chunks = executor.map(render_invoice_chunk, chunks, [company_name] * len(chunks),
+                                           [price_table] * len(chunks), [exact] * len(chunks))
+
+        for chunk_count, data in rendered_chunks:
+            output.write(data)
+            count += chunk_count
+
+    output.flush()
+    seconds = time.perf_counter() - start
+
+    return {
+        'invoices': count,
+        'seconds': seconds,
+        'invoices_per_second': count / seconds if seconds else 0.0,
+    }
+
+
+# Like executor.map, but never submits more than max_pending chunks ahead of the one being written
+def _map_in_order(executor, chunks, max_pending, company_name, price_table, exact):
+    pending = deque()
+
+    for chunk in chunks:
+        pending.append(executor.submit(render_invoice_chunk, chunk, company_name, price_table, exact))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+# Worker task: price a chunk of lengths and render their invoices. Returns (invoice count, encoded invoices).
+# In exact mode the lengths are ints in thousandths of a foot and money is priced in cents.
+def render_invoice_chunk(cable_lengths, company_name=COMPANY_NAME, price_table=None, exact=False):
+    writer = _invoice_writer(company_name)
+
+    if exact:
+        cost_per_foot, total_cost = quote_cable_lengths_cents(cable_lengths)
+        render = writer.render_cents
+    elif price_table is None:
+        cost_per_foot, total_cost = quote_cable_lengths(np.array(cable_lengths, dtype=np.float64))
+        render = writer.render
+    else:
+        cost_per_foot, total_cost = price_table.quote(np.array(cable_lengths, dtype=np.float64))
+        render = writer.render
+
+    text = ''.join(map(render, cable_lengths, cost_per_foot.tolist(), total_cost.tolist()))
+    return len(cable_lengths), text.encode(writer.encoding)
+
+
+@lru_cache(maxsize=None)
+def _invoice_writer(company_name):
+    return InvoiceWriter(company_name)
+
+
+# Yield cable lengths from the first column of a CSV or newline separated file.
+# Blank lines are skipped, and so is a header line if the first line is not a number.
+# With exact=True the lengths are parsed into ints in thousandths of a foot instead of floats.
+def read_cable_lengths(file_name, exact=False):
+    parse_length = parse_feet if exact else float
+
+    with open(file_name, 'r', newline='') as file:
+        for line_number, row in enumerate(csv.reader(file), start=1):
+            if not row or not row[0].strip():
+                continue
+
+            try:
+                cable_length = parse_length(row[0])
+            except ValueError:
+                if line_number == 1 and not _is_number(row[0]):
+                    continue
+                raise ValueError(f"line {line_number}: '{row[0]}' is not a valid number") from None
+
+            if not cable_length > 0:
+                raise ValueError(f"line {line_number}: cable length must be a positive number")
+
+            yield cable_length
+
+
+# Check if text is a number at all, even one that parse_feet rejects for having too many decimal places
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+# Open a temporary file next to file_name and move it into place only if the block finishes,
+# so an error part way through never leaves a half written file behind
+@contextmanager
+def _replace_on_success(file_name):
+    directory = os.path.dirname(os.path.abspath(file_name))
+    descriptor, temp_name = tempfile.mkstemp(dir=directory, prefix='.invoices-', suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as output:
+            yield output
+        os.replace(temp_name, file_name)
+    except BaseException:
+        os.unlink(temp_name)
+        raise
+
+
+# Group an iterable into lists of at most size items
+def chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+if __name__ == "__main__":
+    sys.exit(main())
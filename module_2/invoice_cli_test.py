@@ -0,0 +1,109 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from main_m2 import calculate_bulk_discount_price, calculate_cost_of_cable
+from invoice_cli import chunked, generate_invoices, main, read_cable_lengths
+from invoice_writer import InvoiceWriter
+from pricing_table import PricingTable
+
+
+class TestInvoiceCli(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.jobs_path = os.path.join(self.test_dir.name, 'jobs.csv')
+        self.lengths = [float(length) for length in range(1, 1200, 7)]
+        with open(self.jobs_path, 'w') as file:
+            file.write('length,customer\n')
+            for length in self.lengths:
+                file.write(f'{length},customer {length}\n')
+            file.write('\n')
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    def expected_invoices(self):
+        writer = InvoiceWriter()
+        invoices = []
+        for length in self.lengths:
+            cost_per_foot = calculate_bulk_discount_price(length)
+            invoices.append(writer.render(length, cost_per_foot, calculate_cost_of_cable(length, cost_per_foot)))
+        return ''.join(invoices).encode('utf-8')
+
+    def test_read_cable_lengths_skips_header_and_blank_lines(self):
+        self.assertEqual(list(read_cable_lengths(self.jobs_path)), self.lengths)
+
+    def test_given_invalid_length_then_raise_value_error_with_line_number(self):
+        with open(self.jobs_path, 'a') as file:
+            file.write('-5\n')
+        with self.assertRaisesRegex(ValueError, 'line'):
+            list(read_cable_lengths(self.jobs_path))
+
+    def test_given_over_precise_first_line_then_raise_value_error_in_exact_mode(self):
+        with open(self.jobs_path, 'w') as file:
+            file.write('1.2345\n5\n')
+        with self.assertRaisesRegex(ValueError, 'line 1'):
+            list(read_cable_lengths(self.jobs_path, exact=True))
+
+    def test_chunked(self):
+        self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+
+    def test_generate_invoices_preserves_input_order(self):
+        output = io.BytesIO()
+        stats = generate_invoices(self.jobs_path, output, workers=2, chunk_size=16)
+
+        self.assertEqual(output.getvalue(), self.expected_invoices())
+        self.assertEqual(stats['invoices'], len(self.lengths))
+
+    def test_generate_invoices_streaming_mode_preserves_input_order(self):
+        output = io.BytesIO()
+        generate_invoices(self.jobs_path, output, workers=2, chunk_size=16, stream=True, max_pending=2)
+        self.assertEqual(output.getvalue(), self.expected_invoices())
+
+    def test_generate_invoices_with_price_table(self):
+        output = io.BytesIO()
+        generate_invoices(self.jobs_path, output, workers=2, price_table=PricingTable([(0, 1.0)]))
+        self.assertIn(b'$1.00 per foot', output.getvalue())
+        self.assertNotIn(b'$0.87 per foot', output.getvalue())
+
+    def test_generate_invoices_exact_mode(self):
+        output = io.BytesIO()
+        with open(self.jobs_path, 'w') as file:
+            file.write('1.5\n')
+        generate_invoices(self.jobs_path, output, workers=1, exact=True)
+
+        self.assertEqual(output.getvalue(), InvoiceWriter().render_cents(1500, 87, 131).encode('utf-8'))
+
+    def test_given_exact_mode_and_price_table_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            generate_invoices(self.jobs_path, io.BytesIO(), exact=True, price_table=PricingTable.default())
+
+    def test_main_writes_output_file(self):
+        output_path = os.path.join(self.test_dir.name, 'invoices.txt')
+        with mock.patch('sys.stderr', new=io.StringIO()) as fake_error:
+            self.assertEqual(main([self.jobs_path, '-o', output_path, '--workers', '2', '--stream']), 0)
+
+        with open(output_path, 'rb') as file:
+            self.assertEqual(file.read(), self.expected_invoices())
+        self.assertIn('invoices/s', fake_error.getvalue())
+
+    def test_given_invalid_length_then_keep_existing_output_file(self):
+        output_path = os.path.join(self.test_dir.name, 'invoices.txt')
+        with open(output_path, 'w') as file:
+            file.write('previous invoices')
+        with open(self.jobs_path, 'a') as file:
+            file.write('-5\n')
+
+        with mock.patch('sys.stderr', new=io.StringIO()):
+            self.assertEqual(main([self.jobs_path, '-o', output_path, '--workers', '1', '--stream',
+                                   '--chunk-size', '10']), 1)
+
+        with open(output_path) as file:
+            self.assertEqual(file.read(), 'previous invoices')
+        self.assertEqual(sorted(os.listdir(self.test_dir.name)), ['invoices.txt', 'jobs.csv'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import time
+
+from main_m2 import COMPANY_NAME
+from money import format_cents, format_feet
+
+# Same layout as print_invoice in main_m2.py
+INVOICE_WIDTH = 50
+COL1_WIDTH = 20
+COL2_WIDTH = 24
+BORDER_WIDTH = INVOICE_WIDTH - 2  # Width between outer borders
+
+# Number of invoices rendered into one buffer before it is written
+DEFAULT_CHUNK_SIZE = 1024
+
+
+class InvoiceWriter:
+    # Renders invoices with the print_invoice layout and streams them to a binary writable.
+    # Everything except the three values is rendered once, when the writer is created.
+    def __init__(self, company_name=COMPANY_NAME, chunk_size=DEFAULT_CHUNK_SIZE, encoding='utf-8'):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive number")
+
+        self.company_name = company_name
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self._template = _build_invoice_template(company_name)
+
+    # Render one invoice as text, exactly as print_invoice would print it
+    def render(self, length_of_cable: float, cost_per_foot: float, total_cost: float) -> str:
+        return self._template.format(
+            f'{length_of_cable:,.2f} feet',
+            f'${cost_per_foot:,.2f} per foot',
+            f'${total_cost:,.2f}',
+        )
+
+    # Render one invoice from fixed-point values: the length in thousandths of a foot and money in cents
+    def render_cents(self, length_of_cable: int, cost_per_foot: int, total_cost: int) -> str:
+        return self._template.format(
+            f'{format_feet(length_of_cable)} feet',
+            f'${format_cents(cost_per_foot)} per foot',
+            f'${format_cents(total_cost)}',
+        )
+
+    # Write (length_of_cable, cost_per_foot, total_cost) invoices from any iterable to a
+    # binary writable such as an open file, sys.stdout.buffer or a pipe, one write per chunk.
+    # With exact=True the values are fixed-point ints, as used by render_cents.
+    # Returns a dictionary with the number of invoices, the elapsed seconds and invoices per second.
+    def write(self, invoices, output, exact=False) -> dict:
+        render = self.render_cents if exact else self.render
+        start = time.perf_counter()
+        count = 0
+        chunk = []
+
+        for length_of_cable, cost_per_foot, total_cost in invoices:
+            chunk.append(render(length_of_cable, cost_per_foot, total_cost))
+            if len(chunk) == self.chunk_size:
+                output.write(''.join(chunk).encode(self.encoding))
+                count += len(chunk)
+                chunk = []
+
+        if chunk:
+            output.write(''.join(chunk).encode(self.encoding))
+            count += len(chunk)
+
+        output.flush()
+        seconds = time.perf_counter() - start
+
+        return {
+            'invoices': count,
+            'seconds': seconds,
+            'invoices_per_second': count / seconds if seconds else 0.0,
+        }
+
+
+# Build a str.format template for a whole invoice with the static parts already rendered
+def _build_invoice_template(company_name):
+    border = "+" + "-" * BORDER_WIDTH + "+"
+    column_border = "+" + "-" * (COL1_WIDTH + 2) + "+" + "-" * (COL2_WIDTH + 1) + "+"
+
+    def static(text):
+        return text.replace("{", "{{").replace("}", "}}")
+
+    def detail_row(item, field_number):
+        return static(f"| {item:<{COL1_WIDTH}} | ") + "{" + f"{field_number}:<{COL2_WIDTH - 1}" + "}" + " |"
+
+    lines = [
+        static(border),
+        static(f"|{company_name:^{BORDER_WIDTH}}|"),
+        static("|" + " " * BORDER_WIDTH + "|"),
+        static(border),
+        static(f"| {'ITEM':^{COL1_WIDTH}} | {'DETAILS':^{COL2_WIDTH - 1}} |"),
+        static(column_border),
+        detail_row('Cable Length', 0),
+        detail_row('Unit Price', 1),
+        static(column_border),
+        detail_row('TOTAL', 2),
+        static(border),
+        static(f"|{'Thank you for your business!':^{BORDER_WIDTH}}|"),
+        static(border),
+    ]
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,59 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from main_m2 import COMPANY_NAME, print_invoice
+from invoice_writer import InvoiceWriter
+
+INVOICES = [
+    (10, 0.87, 8.7),
+    (101, 0.80, 80.8),
+    (1234567.891, 0.50, 617283.95),
+]
+
+
+def printed_invoice(company_name, length_of_cable, cost_per_foot, total_cost):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        print_invoice(company_name, length_of_cable, cost_per_foot, total_cost)
+    return output.getvalue()
+
+
+class TestInvoiceWriter(unittest.TestCase):
+    def test_given_invoice_then_render_same_text_as_print_invoice(self):
+        writer = InvoiceWriter()
+        for invoice in INVOICES:
+            with self.subTest(invoice=invoice):
+                self.assertEqual(writer.render(*invoice), printed_invoice(COMPANY_NAME, *invoice))
+
+    def test_given_company_name_with_braces_then_render_it_literally(self):
+        writer = InvoiceWriter("Cables {R} Us")
+        self.assertEqual(writer.render(10, 0.87, 8.7), printed_invoice("Cables {R} Us", 10, 0.87, 8.7))
+
+    def test_given_invoices_then_write_them_in_chunks(self):
+        output = io.BytesIO()
+        writes = []
+        original_write = output.write
+        output.write = lambda data: writes.append(len(data)) or original_write(data)
+
+        stats = InvoiceWriter(chunk_size=2).write(iter(INVOICES), output)
+
+        expected = ''.join(printed_invoice(COMPANY_NAME, *invoice) for invoice in INVOICES)
+        self.assertEqual(output.getvalue().decode('utf-8'), expected)
+        self.assertEqual(len(writes), 2)
+        self.assertEqual(stats['invoices'], 3)
+        self.assertGreater(stats['invoices_per_second'], 0)
+
+    def test_given_no_invoices_then_write_nothing(self):
+        output = io.BytesIO()
+        stats = InvoiceWriter().write([], output)
+        self.assertEqual(output.getvalue(), b'')
+        self.assertEqual(stats['invoices'], 0)
+
+    def test_given_invalid_chunk_size_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            InvoiceWriter(chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
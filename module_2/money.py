@@ -0,0 +1,123 @@
+# Exact fixed-point money mode.
+# Lengths are whole thousandths of a foot and money is whole cents, both stored as Python ints,
+# so pricing and totals never pick up floating point drift. Totals are rounded half up to the cent,
+# the same as Decimal.quantize(Decimal('0.01'), ROUND_HALF_UP).
+
+from decimal import MAX_PREC, Context, DecimalException, DivisionByZero, Inexact, InvalidOperation, Overflow
+
+import numpy as np
+
+from main_m2 import (
+    COST_PER_FOOT,
+    COST_PER_FOOT_GREATER_100,
+    COST_PER_FOOT_GREATER_250,
+    COST_PER_FOOT_GREATER_500,
+)
+
+LENGTH_PLACES = 3
+LENGTH_SCALE = 10 ** LENGTH_PLACES  # Thousandths of a foot per foot
+CENTS_PLACES = 2
+
+# Decimal context for the unusual inputs: nothing is rounded, and anything that would be rounded,
+# overflow or be invalid raises a DecimalException instead
+EXACT_CONTEXT = Context(prec=MAX_PREC, Emax=999_999, Emin=-999_999,
+                        traps=[InvalidOperation, DivisionByZero, Overflow, Inexact])
+
+
+# Convert a decimal string, int or float to an int scaled by 10 ** places, without rounding.
+# Floats are converted through repr(), which gives back the shortest text for that float.
+def to_fixed(value, places: int) -> int:
+    text = value.strip() if isinstance(value, str) else repr(value)
+    sign = 1
+    if text[:1] in ('+', '-'):
+        sign = -1 if text[0] == '-' else 1
+        text = text[1:]
+        # Decimal would accept a second sign, so '--5' would be read as 5
+        if text[:1] in ('+', '-'):
+            raise ValueError(f"'{value}' is not a valid number")
+
+    whole, _, fraction = text.partition('.')
+    is_plain_decimal = (whole or fraction) and text.isascii() and \
+        (whole.isdigit() or not whole) and (fraction.isdigit() or not fraction)
+
+    if is_plain_decimal:
+        if len(fraction) > places:
+            fraction = fraction.rstrip('0')
+            if len(fraction) > places:
+                raise ValueError(f"'{value}' has more than {places} decimal places")
+        return sign * (int(whole or '0') * 10 ** places + int(fraction.ljust(places, '0') or '0'))
+
+    # Anything unusual, like exponents, goes through Decimal
+    try:
+        number = EXACT_CONTEXT.scaleb(EXACT_CONTEXT.create_decimal(text), places)
+        if not number.is_finite() or number != EXACT_CONTEXT.to_integral_value(number):
+            raise ValueError(f"'{value}' is not a valid number with at most {places} decimal places")
+    except DecimalException:
+        raise ValueError(f"'{value}' is not a valid number") from None
+    return sign * int(number)
+
+
+# Parse a cable length in feet into thousandths of a foot
+def parse_feet(value) -> int:
+    return to_fixed(value, LENGTH_PLACES)
+
+
+# Convert a dollar amount into cents
+def to_cents(dollars) -> int:
+    return to_fixed(dollars, CENTS_PLACES)
+
+
+COST_PER_FOOT_CENTS = to_cents(COST_PER_FOOT)
+COST_PER_FOOT_GREATER_100_CENTS = to_cents(COST_PER_FOOT_GREATER_100)
+COST_PER_FOOT_GREATER_250_CENTS = to_cents(COST_PER_FOOT_GREATER_250)
+COST_PER_FOOT_GREATER_500_CENTS = to_cents(COST_PER_FOOT_GREATER_500)
+
+# Tier boundaries and prices for the batch path, in thousandths of a foot and cents
+TIER_BOUNDARIES = np.array([100, 250, 500], dtype=np.int64) * LENGTH_SCALE
+TIER_PRICES_CENTS = np.array([COST_PER_FOOT_CENTS, COST_PER_FOOT_GREATER_100_CENTS,
+                              COST_PER_FOOT_GREATER_250_CENTS, COST_PER_FOOT_GREATER_500_CENTS], dtype=np.int64)
+
+
+# Returns the cost per foot in cents for a length in thousandths of a foot
+def calculate_bulk_discount_price_cents(cable_length: int) -> int:
+    if cable_length > 500 * LENGTH_SCALE:
+        return COST_PER_FOOT_GREATER_500_CENTS
+    elif cable_length > 250 * LENGTH_SCALE:
+        return COST_PER_FOOT_GREATER_250_CENTS
+    elif cable_length > 100 * LENGTH_SCALE:
+        return COST_PER_FOOT_GREATER_100_CENTS
+    else:
+        return COST_PER_FOOT_CENTS
+
+
+# Calculate the cost of the cable in cents, rounded half up to the cent
+def calculate_cost_of_cable_cents(cable_length: int, cost_of_cable_per_foot: int) -> int:
+    if cable_length <= 0:
+        raise ValueError("Cable length must be a positive number")
+
+    return (cable_length * cost_of_cable_per_foot + LENGTH_SCALE // 2) // LENGTH_SCALE
+
+
+# Quote a NumPy array of lengths in thousandths of a foot. Returns int64 arrays of
+# (cost_per_foot, total_cost) in cents. Exact while length * price fits in an int64.
+def quote_cable_lengths_cents(cable_lengths):
+    lengths = np.asarray(cable_lengths, dtype=np.int64)
+
+    if lengths.size and not (lengths > 0).all():
+        raise ValueError("Cable length must be a positive number")
+
+    cost_per_foot = TIER_PRICES_CENTS[np.searchsorted(TIER_BOUNDARIES, lengths, side='left')]
+    total_cost = (lengths * cost_per_foot + LENGTH_SCALE // 2) // LENGTH_SCALE
+    return cost_per_foot, total_cost
+
+
+# Format cents as dollars with thousands separators, for example 123456 -> "1,234.56"
+def format_cents(cents: int) -> str:
+    sign = '-' if cents < 0 else ''
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}{dollars:,}.{cents:02d}"
+
+
+# Format a length in thousandths of a foot with 2 decimal places, rounded half up
+def format_feet(cable_length: int) -> str:
+    return format_cents((cable_length + 5) // 10)
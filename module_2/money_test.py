@@ -0,0 +1,117 @@
+import random
+import unittest
+from decimal import Decimal, ROUND_HALF_UP
+
+import numpy as np
+
+from main_m2 import calculate_bulk_discount_price
+from money import (
+    calculate_bulk_discount_price_cents,
+    calculate_cost_of_cable_cents,
+    format_cents,
+    format_feet,
+    parse_feet,
+    quote_cable_lengths_cents,
+    to_cents,
+)
+from invoice_writer import InvoiceWriter
+
+CENT = Decimal('0.01')
+
+
+# Reference implementation of the exact mode using Decimal
+def decimal_cost(length_text):
+    length = Decimal(length_text)
+    cost_per_foot = Decimal(str(calculate_bulk_discount_price(float(length_text))))
+    return (length * cost_per_foot).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def random_length_texts(count, seed=3):
+    rng = random.Random(seed)
+    return [f"{rng.randint(0, 2000)}.{rng.randint(0, 999):03d}".rstrip('0').rstrip('.') or '1'
+            for _ in range(count)]
+
+
+class TestFixedPointParsing(unittest.TestCase):
+    def test_parse_feet(self):
+        self.assertEqual(parse_feet('1.5'), 1500)
+        self.assertEqual(parse_feet('100'), 100000)
+        self.assertEqual(parse_feet('.25'), 250)
+        self.assertEqual(parse_feet(' 2.125 '), 2125)
+        self.assertEqual(parse_feet('1.5000'), 1500)
+        self.assertEqual(parse_feet('1e2'), 100000)
+        self.assertEqual(parse_feet(1.005), 1005)
+        self.assertEqual(parse_feet(7), 7000)
+        self.assertEqual(parse_feet('-2.5'), -2500)
+
+    def test_given_invalid_text_then_raise_value_error(self):
+        for text in ['', 'abc', '1.2.3', '1.0001', '1.-5', 'nan', 'inf', '.', '--5', '+-5', '-+5', '++5', '--1e2']:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    parse_feet(text)
+
+    def test_given_out_of_range_exponent_then_raise_value_error(self):
+        for text in ['1e999999999', '-1e999999999', '1e-999999999']:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    parse_feet(text)
+
+    def test_exponents_are_not_rounded(self):
+        self.assertEqual(parse_feet('12345678901234567890123456789012e-2'), 123456789012345678901234567890120)
+        with self.assertRaises(ValueError):
+            parse_feet('1.0000000000000000000000000000001e0')
+
+    def test_to_cents(self):
+        self.assertEqual(to_cents(0.87), 87)
+        self.assertEqual(to_cents('1234.5'), 123450)
+        with self.assertRaises(ValueError):
+            to_cents('0.875')
+
+    def test_format(self):
+        self.assertEqual(format_cents(123456), '1,234.56')
+        self.assertEqual(format_cents(5), '0.05')
+        self.assertEqual(format_cents(-5), '-0.05')
+        self.assertEqual(format_feet(1234565), '1,234.57')
+        self.assertEqual(format_feet(1500), '1.50')
+
+
+class TestFixedPointPricing(unittest.TestCase):
+    def test_given_tier_boundaries_then_match_float_tiers(self):
+        for length in ['1', '100', '100.001', '250', '250.001', '500', '500.001', '10000']:
+            with self.subTest(length=length):
+                self.assertEqual(calculate_bulk_discount_price_cents(parse_feet(length)),
+                                 to_cents(calculate_bulk_discount_price(float(length))))
+
+    def test_given_half_cent_total_then_round_half_up(self):
+        # The float path gives 1.30 here because 1.5 * 0.87 is stored as 1.3049999...
+        self.assertEqual(calculate_cost_of_cable_cents(parse_feet('1.5'), 87), 131)
+
+    def test_given_non_positive_length_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            calculate_cost_of_cable_cents(0, 87)
+
+    def test_scalar_path_matches_decimal(self):
+        for length_text in random_length_texts(20_000):
+            length = parse_feet(length_text)
+            cents = calculate_cost_of_cable_cents(length, calculate_bulk_discount_price_cents(length))
+            self.assertEqual(Decimal(cents) / 100, decimal_cost(length_text), length_text)
+
+    def test_batch_path_matches_decimal_and_totals_are_exact(self):
+        length_texts = random_length_texts(20_000, seed=11)
+        cost_per_foot, total_cost = quote_cable_lengths_cents([parse_feet(text) for text in length_texts])
+
+        expected = [decimal_cost(text) for text in length_texts]
+        self.assertEqual([Decimal(cents) / 100 for cents in total_cost.tolist()], expected)
+        self.assertEqual(Decimal(int(total_cost.sum())) / 100, sum(expected))
+
+    def test_given_non_positive_length_in_batch_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            quote_cable_lengths_cents(np.array([1000, 0]))
+
+    def test_render_cents_matches_float_invoice_for_exact_values(self):
+        writer = InvoiceWriter()
+        self.assertEqual(writer.render_cents(parse_feet('101'), 80, 8080), writer.render(101, 0.80, 80.8))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import csv
+import os
+from bisect import bisect_left
+
+import numpy as np
+
+from main_m2 import (
+    COST_PER_FOOT,
+    COST_PER_FOOT_GREATER_100,
+    COST_PER_FOOT_GREATER_250,
+    COST_PER_FOOT_GREATER_500,
+)
+from batch_pricing import quote_cable_lengths
+
+# Column names expected in a price book file
+OVER_FEET_COLUMN = 'over_feet'
+COST_PER_FOOT_COLUMN = 'cost_per_foot'
+
+
+class PricingTable:
+    # A compiled set of bulk discount tiers. A tier applies to lengths strictly greater than its
+    # "over_feet" value, and the tier with over_feet 0 is the base price.
+    # Tiers are kept as sorted breakpoint lists so any length is resolved with one bisect.
+    def __init__(self, tiers, file_name=None):
+        self.file_name = file_name
+        self._file_signature = None
+        self._load_tiers(tiers)
+
+    @classmethod
+    def from_file(cls, file_name):
+        table = cls(read_price_book(file_name), file_name)
+        table._file_signature = _file_signature(file_name)
+        return table
+
+    @classmethod
+    def default(cls):
+        return cls([
+            (0, COST_PER_FOOT),
+            (100, COST_PER_FOOT_GREATER_100),
+            (250, COST_PER_FOOT_GREATER_250),
+            (500, COST_PER_FOOT_GREATER_500),
+        ])
+
+    def __len__(self):
+        return len(self._compiled[1])
+
+    # Drop-in replacement for main_m2.calculate_bulk_discount_price
+    def calculate_bulk_discount_price(self, cable_length: float) -> float:
+        boundaries, prices, _, _ = self._compiled
+        return prices[bisect_left(boundaries, cable_length)]
+
+    __call__ = calculate_bulk_discount_price
+
+    # Quote a batch of lengths with this table (see batch_pricing.quote_cable_lengths)
+    def quote(self, cable_lengths):
+        _, _, boundary_array, price_array = self._compiled
+        return quote_cable_lengths(cable_lengths, boundary_array, price_array)
+
+    # Reload the price book if the file changed on disk. Returns True when new tiers were loaded.
+    # Lookups running at the same time keep using the old tiers until the swap.
+    def reload_if_changed(self) -> bool:
+        if self.file_name is None:
+            return False
+
+        signature = _file_signature(self.file_name)
+        if signature == self._file_signature:
+            return False
+
+        self._load_tiers(read_price_book(self.file_name))
+        self._file_signature = signature
+        return True
+
+    def _load_tiers(self, tiers):
+        tiers = sorted((float(over_feet), float(cost_per_foot)) for over_feet, cost_per_foot in tiers)
+
+        if not tiers or tiers[0][0] != 0:
+            raise ValueError("Price book must have a base tier with over_feet 0")
+
+        boundaries = [over_feet for over_feet, _ in tiers[1:]]
+        prices = [cost_per_foot for _, cost_per_foot in tiers]
+
+        if len(set(boundaries)) != len(boundaries) or boundaries and boundaries[0] <= 0:
+            raise ValueError("Price book tiers must have unique, positive over_feet values")
+
+        # Swap everything in one assignment so a reload never exposes half-updated tiers
+        self._compiled = (boundaries, prices, np.array(boundaries, dtype=np.float64), np.array(prices))
+
+
+# Read (over_feet, cost_per_foot) tiers from a CSV price book
+def read_price_book(file_name):
+    with open(file_name, 'r', newline='') as file:
+        csv_reader = csv.DictReader(file)
+
+        try:
+            return [(float(row[OVER_FEET_COLUMN]), float(row[COST_PER_FOOT_COLUMN])) for row in csv_reader]
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid price book '{file_name}': {e}") from e
+
+
+def _file_signature(file_name):
+    stat = os.stat(file_name)
+    return stat.st_mtime_ns, stat.st_size
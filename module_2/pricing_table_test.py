@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from main_m2 import calculate_bulk_discount_price
+from pricing_table import PricingTable
+
+PRICE_BOOK = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'price_book.csv')
+
+
+class TestPricingTable(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.price_book_path = os.path.join(self.test_dir.name, 'prices.csv')
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    def write_price_book(self, rows):
+        with open(self.price_book_path, 'w') as file:
+            file.write('over_feet,cost_per_foot\n')
+            for over_feet, cost_per_foot in rows:
+                file.write(f'{over_feet},{cost_per_foot}\n')
+
+    def test_given_shipped_price_book_then_match_calculate_bulk_discount_price(self):
+        for table in (PricingTable.from_file(PRICE_BOOK), PricingTable.default()):
+            for length in [0.5, 50, 100, 100.01, 101, 250, 251, 500, 501, 100000]:
+                with self.subTest(length=length):
+                    self.assertEqual(table.calculate_bulk_discount_price(length), calculate_bulk_discount_price(length))
+                    self.assertEqual(table(length), calculate_bulk_discount_price(length))
+
+    def test_given_unsorted_price_book_then_sort_tiers(self):
+        self.write_price_book([(1000, 0.25), (0, 1.00), (10, 0.75)])
+        table = PricingTable.from_file(self.price_book_path)
+
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table(10), 1.00)
+        self.assertEqual(table(11), 0.75)
+        self.assertEqual(table(1001), 0.25)
+
+    def test_given_batch_then_quote_with_table_tiers(self):
+        self.write_price_book([(0, 1.00), (10, 0.50)])
+        table = PricingTable.from_file(self.price_book_path)
+        cost_per_foot, total_cost = table.quote(np.array([10, 20]))
+
+        self.assertEqual(cost_per_foot.tolist(), [1.00, 0.50])
+        self.assertEqual(total_cost.tolist(), [10.0, 10.0])
+
+    def test_given_changed_price_book_then_reload(self):
+        self.write_price_book([(0, 1.00)])
+        table = PricingTable.from_file(self.price_book_path)
+        self.assertFalse(table.reload_if_changed())
+
+        self.write_price_book([(0, 1.00), (100, 0.90)])
+        os.utime(self.price_book_path, ns=(0, 0))
+        self.assertTrue(table.reload_if_changed())
+        self.assertEqual(table(101), 0.90)
+
+    def test_given_price_book_without_base_tier_then_raise_value_error(self):
+        self.write_price_book([(100, 0.80)])
+        with self.assertRaises(ValueError):
+            PricingTable.from_file(self.price_book_path)
+
+    def test_given_duplicate_tiers_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            PricingTable([(0, 1.00), (100, 0.80), (100, 0.70)])
+
+    def test_given_invalid_price_then_raise_value_error(self):
+        self.write_price_book([(0, 'abc')])
+        with self.assertRaises(ValueError):
+            PricingTable.from_file(self.price_book_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
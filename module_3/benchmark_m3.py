@@ -0,0 +1,85 @@
+# Benchmarks for the module 3 investment calculator.
+# Run with: python benchmark_m3.py
+
+import os
+import time
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from main_m3 import generate_investment_schedule, print_investment_schedule
+from doubling_solver import years_to_double_batch
+from growth_projection import project_growth
+from schedule_renderer import export_binary, export_csv, write_schedule
+
+
+# Time a function call and return the elapsed seconds
+def time_it(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+# Find the years to double by building every schedule, one pair at a time
+def years_with_schedule_loop(initial_investments, interest_rates):
+    return [len(generate_investment_schedule(investment, rate))
+            for investment, rate in zip(initial_investments, interest_rates)]
+
+
+def benchmark_doubling_solver(count=20_000, batch_count=10_000_000):
+    rng = np.random.default_rng(42)
+    interest_rates = np.round(rng.uniform(0.5, 20, count), 2)
+    initial_investments = np.round(rng.uniform(100, 1_000_000, count), 2)
+
+    loop_seconds = time_it(years_with_schedule_loop, initial_investments.tolist(), interest_rates.tolist())
+    batch_seconds = time_it(years_to_double_batch, initial_investments, interest_rates)
+
+    print(f"Years to double for {count:,} portfolios")
+    print(f"  schedule loop: {loop_seconds:8.3f} s")
+    print(f"  closed form:   {batch_seconds:8.3f} s  ({loop_seconds / batch_seconds:,.0f}x faster)")
+
+    interest_rates = np.round(rng.uniform(0.5, 20, batch_count), 2)
+    initial_investments = np.round(rng.uniform(100, 1_000_000, batch_count), 2)
+    batch_seconds = time_it(years_to_double_batch, initial_investments, interest_rates)
+    print(f"  closed form for {batch_count:,} portfolios: {batch_seconds:8.3f} s")
+
+
+# Print every schedule with print_investment_schedule
+def print_schedules(schedules, output):
+    with redirect_stdout(output):
+        for schedule_data in schedules:
+            print_investment_schedule(schedule_data)
+
+
+# Write every schedule with one of the schedule_renderer functions
+def write_schedules(function, schedules, output):
+    for schedule_data in schedules:
+        function(schedule_data, output)
+
+
+def benchmark_schedule_renderer(accounts=10_000):
+    rng = np.random.default_rng(42)
+    projection = project_growth(rng.uniform(100, 1_000_000, accounts), rng.uniform(0.5, 10, accounts))
+    schedules = [projection.schedule(account) for account in range(accounts)]
+    rows = sum(len(schedule_data) for schedule_data in schedules)
+
+    print(f"Rendering schedules for {accounts:,} accounts ({rows:,} rows)")
+    with open(os.devnull, 'w') as text_output, open(os.devnull, 'wb') as binary_output:
+        results = [
+            ('print_investment_schedule', time_it(print_schedules, schedules, text_output)),
+            ('write_schedule', time_it(write_schedules, write_schedule, schedules, binary_output)),
+            ('export_csv', time_it(write_schedules, export_csv, schedules, text_output)),
+            ('export_binary', time_it(write_schedules, export_binary, schedules, binary_output)),
+        ]
+
+    for name, seconds in results:
+        print(f"  {name:<26} {rows / seconds:12,.0f} rows/s")
+
+
+def main():
+    benchmark_doubling_solver()
+    benchmark_schedule_renderer()
+
+
+if __name__ == "__main__":
+    main()
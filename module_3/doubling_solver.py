@@ -0,0 +1,82 @@
+import math
+
+import numpy as np
+
+# Results this close to a whole number of years are too close to call with logarithms.
+# The tolerance grows with the square of the number of years because the schedule loop's rounding
+# error grows with every year it runs. It is capped below half a year, so long horizons are not all
+# close calls.
+CLOSE_CALL_TOLERANCE = 1e-12
+CLOSE_CALL_TOLERANCE_PER_YEAR_SQUARED = 1e-13
+CLOSE_CALL_TOLERANCE_LIMIT = 0.25
+
+# Close calls up to this many years are settled by replaying the schedule loop's arithmetic, which
+# gives exactly its answer. Longer ones check (1 + rate) ** years against 2 for the nearest years.
+REPLAY_YEARS_LIMIT = 10_000
+
+
+# Return the number of whole years it takes an investment to double, without building the schedule.
+# Gives the same answer as len(generate_investment_schedule(initial_investment, interest_rate)).
+def years_to_double(initial_investment, interest_rate):
+    if interest_rate <= 0:
+        raise ValueError("Interest rate must be a positive number")
+    if initial_investment <= 0:
+        return 0
+
+    years = math.log(2) / math.log1p(interest_rate / 100)
+    if _is_close_call(years):
+        return _settle_close_call(initial_investment, interest_rate, years)
+
+    return math.ceil(years)
+
+
+# Return an int64 array of the years to double for arrays of investments and interest rates.
+# The rates are broadcast against the investments, so one rate can be used for a whole portfolio.
+def years_to_double_batch(initial_investments, interest_rates):
+    investments, rates = np.broadcast_arrays(np.asarray(initial_investments, dtype=np.float64),
+                                             np.asarray(interest_rates, dtype=np.float64))
+
+    if rates.size and not (rates > 0).all():
+        raise ValueError("Interest rate must be a positive number")
+
+    years = np.log(2) / np.log1p(rates / 100)
+    result = np.ceil(years).astype(np.int64)
+    result[investments <= 0] = 0
+
+    # Settle the close calls the same way years_to_double does
+    close_calls = np.flatnonzero(_is_close_call(years) & (investments > 0))
+    flat_result = result.reshape(-1)
+    flat_investments = investments.reshape(-1)
+    flat_rates = rates.reshape(-1)
+    flat_years = years.reshape(-1)
+    for i in close_calls:
+        flat_result[i] = _settle_close_call(float(flat_investments[i]), float(flat_rates[i]), float(flat_years[i]))
+
+    return result
+
+
+def _is_close_call(years):
+    tolerance = np.minimum(CLOSE_CALL_TOLERANCE + CLOSE_CALL_TOLERANCE_PER_YEAR_SQUARED * years * years,
+                           CLOSE_CALL_TOLERANCE_LIMIT)
+    return abs(years - np.round(years)) < tolerance
+
+
+def _settle_close_call(initial_investment, interest_rate, years):
+    if years <= REPLAY_YEARS_LIMIT:
+        # The same steps as generate_investment_schedule, without building the rows
+        interest_rate_decimal = interest_rate / 100
+        current_amount = initial_investment
+        target_amount = initial_investment * 2
+        count = 0
+        while current_amount < target_amount:
+            current_amount += current_amount * interest_rate_decimal
+            count += 1
+        return count
+
+    growth = 1 + interest_rate / 100
+    count = math.ceil(years)
+    if growth ** (count - 1) >= 2:
+        return count - 1
+    if growth ** count < 2:
+        return count + 1
+    return count
@@ -0,0 +1,49 @@
+import math
+import time
+import unittest
+
+import numpy as np
+
+from main_m3 import generate_investment_schedule
+from doubling_solver import years_to_double, years_to_double_batch
+
+
+class TestDoublingSolver(unittest.TestCase):
+
+    def test_years_to_double_matches_schedule_length(self):
+        for initial_investment, interest_rate in [(1000, 10), (1000, 100), (1000, 1), (2500.5, 7.25), (1, 0.01)]:
+            with self.subTest(initial_investment=initial_investment, interest_rate=interest_rate):
+                expected = len(generate_investment_schedule(initial_investment, interest_rate))
+                self.assertEqual(years_to_double(initial_investment, interest_rate), expected)
+
+    def test_years_to_double_batch_matches_schedule_length(self):
+        rng = np.random.default_rng(5)
+        interest_rates = np.concatenate([np.arange(1, 10001) / 100, rng.uniform(0.05, 100, 5000)])
+        initial_investments = np.round(rng.uniform(1, 1_000_000, interest_rates.size), 2)
+
+        years = years_to_double_batch(initial_investments, interest_rates)
+
+        expected = [len(generate_investment_schedule(investment, rate))
+                    for investment, rate in zip(initial_investments.tolist(), interest_rates.tolist())]
+        self.assertEqual(years.tolist(), expected)
+
+    def test_years_to_double_batch_broadcasts_a_single_rate(self):
+        years = years_to_double_batch([1000, 5000, 0], 10)
+        self.assertEqual(years.tolist(), [8, 8, 0])
+
+    def test_tiny_interest_rate_does_not_run_the_schedule_loop(self):
+        start = time.perf_counter()
+        years = years_to_double(1000, 1e-5)
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertLessEqual(abs(years - math.log(2) / math.log1p(1e-7)), 1)
+        self.assertEqual(years_to_double_batch([1000], [1e-5]).tolist(), [years])
+
+    def test_given_non_positive_interest_rate_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            years_to_double(1000, 0)
+        with self.assertRaises(ValueError):
+            years_to_double_batch([1000, 1000], [5, -1])
+
+
+if __name__ == '__main__':
+    unittest.main()
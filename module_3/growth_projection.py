@@ -0,0 +1,91 @@
+import numpy as np
+
+from investment_schedule import InvestmentSchedule
+
+DEFAULT_YEARS = 100
+
+# Scenarios projected at a time. Each chunk needs a few temporary arrays of CHUNK_SCENARIOS * (years + 1) floats.
+CHUNK_SCENARIOS = 4096
+
+
+# Year end balances for a batch of growth scenarios, as returned by project_growth.
+# balances[s, y] is the balance of scenario s at the end of year y, and balances[s, 0] is the initial investment.
+# years_to_target holds the first year each scenario reaches its target, or -1 if it never gets there.
+class GrowthProjection:
+
+    def __init__(self, initial_investments, yearly_contributions, balances, years_to_target):
+        self.initial_investments = initial_investments
+        self.yearly_contributions = yearly_contributions
+        self.balances = balances
+        self.years_to_target = years_to_target
+
+    def __len__(self):
+        return len(self.balances)
+
+    # Return the yearly schedule of one scenario as an InvestmentSchedule.
+    # It stops at the year the target is reached, like generate_investment_schedule, unless until_target is False.
+    # Interest earned does not include contributions.
+    def schedule(self, scenario, until_target=True):
+        years = self.balances.shape[1] - 1
+        if until_target and self.years_to_target[scenario] >= 0:
+            years = int(self.years_to_target[scenario])
+
+        balances = self.balances[scenario, :years + 1]
+        beginning_balances = balances[:-1]
+        ending_balances = balances[1:]
+        interest_earned = ending_balances - beginning_balances - self.yearly_contributions[scenario]
+
+        return InvestmentSchedule(beginning_balances, interest_earned, ending_balances)
+
+
+# Project compound growth for many scenarios at once and return a GrowthProjection.
+# The balance after k periods is P * g**k + c * (g**k - 1) / i, with i the rate per period, g = 1 + i and
+# c the contribution at the end of every period, so no loop runs year by year.
+# The investments, rates, contributions and target multiples are broadcast against each other.
+def project_growth(initial_investments, interest_rates, years=DEFAULT_YEARS, periods_per_year=1,
+                   contributions=0.0, target_multiple=2.0):
+    if years <= 0:
+        raise ValueError("The horizon must be at least one year")
+    if periods_per_year <= 0 or int(periods_per_year) != periods_per_year:
+        raise ValueError("Periods per year must be a positive whole number")
+
+    investments, rates, period_contributions, multiples = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(values, dtype=np.float64)) for values in
+          (initial_investments, interest_rates, contributions, target_multiple)))
+
+    if investments.ndim != 1:
+        raise ValueError("Scenarios must be given as one dimensional arrays")
+    if not (rates > -100).all():
+        raise ValueError("Interest rates must be greater than -100%")
+
+    periods = np.arange(years + 1) * periods_per_year
+    balances = np.empty((len(investments), years + 1))
+    years_to_target = np.empty(len(investments), dtype=np.int64)
+
+    # Work through the scenarios in chunks, so the temporary arrays stay a fixed size
+    for start in range(0, len(investments), CHUNK_SCENARIOS):
+        end = start + CHUNK_SCENARIOS
+        years_to_target[start:end] = _project_chunk(
+            investments[start:end], rates[start:end], period_contributions[start:end], multiples[start:end],
+            periods, periods_per_year, balances[start:end])
+
+    return GrowthProjection(investments, period_contributions * periods_per_year, balances, years_to_target)
+
+
+# Fill balances with the projection of one chunk of scenarios and return their years to target
+def _project_chunk(investments, rates, period_contributions, multiples, periods, periods_per_year, balances):
+    period_rates = (rates / 100 / periods_per_year)[:, np.newaxis]
+
+    # g**k and (g**k - 1) / i, using log1p and expm1 so small rates stay accurate
+    log_growth = periods * np.log1p(period_rates)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        annuity = np.where(period_rates == 0, periods, np.expm1(log_growth) / period_rates)
+
+    np.exp(log_growth, out=balances)
+    balances *= investments[:, np.newaxis]
+    annuity *= period_contributions[:, np.newaxis]
+    balances += annuity
+
+    # The first year end at or above the target, checked once a year like the yearly schedule
+    reached = balances[:, 1:] >= (investments * multiples)[:, np.newaxis]
+    return np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, -1)
@@ -0,0 +1,101 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+import numpy as np
+
+from main_m3 import generate_investment_schedule, print_investment_schedule
+from growth_projection import project_growth
+
+
+# Reference implementation that compounds one period at a time
+def balance_by_loop(initial_investment, interest_rate, years, periods_per_year, contribution):
+    balance = initial_investment
+    for _ in range(years * periods_per_year):
+        balance += balance * interest_rate / 100 / periods_per_year
+        balance += contribution
+    return balance
+
+
+class TestGrowthProjection(unittest.TestCase):
+
+    def test_yearly_compounding_without_contributions_matches_the_schedule(self):
+        projection = project_growth([1000, 1000, 1000], [10, 100, 1])
+
+        self.assertEqual(projection.years_to_target.tolist(), [8, 1, 70])
+        for scenario, rate in enumerate([10, 100, 1]):
+            expected = generate_investment_schedule(1000, rate)
+            schedule = projection.schedule(scenario)
+            self.assertEqual(len(schedule), len(expected))
+            for row, expected_row in zip(schedule, expected):
+                self.assertEqual(row['year'], expected_row['year'])
+                self.assertAlmostEqual(row['ending_balance'], expected_row['ending_balance'], places=6)
+                self.assertAlmostEqual(row['interest_earned'], expected_row['interest_earned'], places=6)
+
+    def test_balances_match_period_by_period_loop(self):
+        cases = [(1000, 5, 12, 100), (2500, 0.5, 4, 0), (0, 7, 12, 250), (5000, 0, 1, 1000)]
+
+        for initial_investment, rate, periods_per_year, contribution in cases:
+            with self.subTest(rate=rate, periods_per_year=periods_per_year, contribution=contribution):
+                projection = project_growth(initial_investment, rate, years=30, periods_per_year=periods_per_year,
+                                            contributions=contribution)
+                self.assertEqual(projection.balances.shape, (1, 31))
+                for year in (1, 10, 30):
+                    expected = balance_by_loop(initial_investment, rate, year, periods_per_year, contribution)
+                    self.assertLess(abs(projection.balances[0, year] - expected), 1e-9 * expected)
+
+    def test_many_scenarios_at_once(self):
+        rng = np.random.default_rng(3)
+        investments = rng.uniform(100, 10_000, 1000)
+        rates = rng.uniform(0.5, 15, 1000)
+        projection = project_growth(investments, rates, periods_per_year=12, contributions=25)
+
+        self.assertEqual(len(projection), 1000)
+        for scenario in (0, 499, 999):
+            expected = balance_by_loop(investments[scenario], rates[scenario], 40, 12, 25)
+            self.assertLess(abs(projection.balances[scenario, 40] - expected), 1e-9 * expected)
+
+    def test_chunks_give_the_same_projection(self):
+        rng = np.random.default_rng(4)
+        investments = rng.uniform(100, 10_000, 1000)
+        rates = rng.uniform(0, 15, 1000)
+        whole = project_growth(investments, rates, contributions=10)
+
+        with patch('growth_projection.CHUNK_SCENARIOS', 7):
+            chunked = project_growth(investments, rates, contributions=10)
+
+        np.testing.assert_array_equal(chunked.balances, whole.balances)
+        np.testing.assert_array_equal(chunked.years_to_target, whole.years_to_target)
+
+    def test_target_multiple_and_unreached_targets(self):
+        projection = project_growth([1000, 1000], [10, 1], years=20, target_multiple=[3, 2])
+
+        self.assertEqual(projection.years_to_target.tolist(), [12, -1])
+        self.assertEqual(len(projection.schedule(1)), 20)
+        self.assertEqual(len(projection.schedule(0, until_target=False)), 20)
+
+    def test_contributions_are_not_counted_as_interest(self):
+        schedule = project_growth(1000, 0, years=3, contributions=50, periods_per_year=2).schedule(0)
+
+        self.assertEqual(len(schedule), 3)
+        self.assertAlmostEqual(schedule[0]['interest_earned'], 0)
+        self.assertAlmostEqual(schedule[2]['ending_balance'], 1300)
+
+    def test_schedule_can_be_printed(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_investment_schedule(project_growth(1000, 10).schedule(0))
+        self.assertIn("$2,143.59", output.getvalue())
+
+    def test_given_invalid_arguments_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            project_growth(1000, 5, years=0)
+        with self.assertRaises(ValueError):
+            project_growth(1000, 5, periods_per_year=1.5)
+        with self.assertRaises(ValueError):
+            project_growth(1000, -100)
+
+
+if __name__ == '__main__':
+    unittest.main()
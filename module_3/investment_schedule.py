@@ -0,0 +1,84 @@
+from array import array
+
+
+# A yearly growth schedule stored as three parallel float columns (array('d') or NumPy arrays),
+# with the years as a range, so it costs 24 bytes per year instead of a dictionary per year.
+# Rows are built as dictionaries with the keys generate_investment_schedule uses only when they are read,
+# so print_investment_schedule can print a schedule as is.
+class InvestmentSchedule:
+    # first_year is the year of the first row, or a range with the year of every row
+    def __init__(self, beginning_balances, interest_earned, ending_balances, first_year=1):
+        if not len(beginning_balances) == len(interest_earned) == len(ending_balances):
+            raise ValueError("All schedule columns must have the same length")
+
+        self.beginning_balances = _column(beginning_balances)
+        self.interest_earned = _column(interest_earned)
+        self.ending_balances = _column(ending_balances)
+        self.years = first_year if isinstance(first_year, range) else range(first_year, first_year + len(beginning_balances))
+
+    @classmethod
+    def from_investment(cls, initial_investment, interest_rate):
+        # Build the schedule until the investment doubles, like generate_investment_schedule
+        interest_rate_decimal = interest_rate / 100
+        current_amount = initial_investment
+        target_amount = initial_investment * 2
+        beginning_balances = array('d')
+        interest_earned = array('d')
+        ending_balances = array('d')
+
+        while current_amount < target_amount:
+            beginning_balance = current_amount
+            interest = beginning_balance * interest_rate_decimal
+            current_amount += interest
+
+            beginning_balances.append(beginning_balance)
+            interest_earned.append(interest)
+            ending_balances.append(current_amount)
+
+        return cls(beginning_balances, interest_earned, ending_balances)
+
+    def __len__(self):
+        return len(self.years)
+
+    def __iter__(self):
+        for i in range(len(self.years)):
+            yield self._row(i)
+
+    # Return the row at a position, or a new schedule sharing these columns for a slice
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return InvestmentSchedule(self.beginning_balances[index], self.interest_earned[index],
+                                      self.ending_balances[index], self.years[index])
+
+        if index < 0:
+            index += len(self.years)
+        if not 0 <= index < len(self.years):
+            raise IndexError("Schedule index out of range")
+        return self._row(index)
+
+    # Return the row for a year number, for example row_for_year(1) for the first year
+    def row_for_year(self, year):
+        try:
+            return self._row(self.years.index(year))
+        except ValueError:
+            raise IndexError(f"Year {year} is not in the schedule") from None
+
+    def _row(self, i):
+        return {
+            'year': self.years[i],
+            'beginning_balance': self.beginning_balances[i],
+            'interest_earned': self.interest_earned[i],
+            'ending_balance': self.ending_balances[i]
+        }
+
+
+# Columnar version of generate_investment_schedule. Returns an InvestmentSchedule.
+def generate_investment_schedule_columns(initial_investment, interest_rate):
+    return InvestmentSchedule.from_investment(initial_investment, interest_rate)
+
+
+def _column(values):
+    # Slicing a memoryview shares the memory instead of copying it like array slicing does
+    if isinstance(values, array):
+        return memoryview(values)
+    return values
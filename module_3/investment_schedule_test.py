@@ -0,0 +1,63 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from main_m3 import generate_investment_schedule, print_investment_schedule
+from investment_schedule import InvestmentSchedule, generate_investment_schedule_columns
+
+
+class TestInvestmentSchedule(unittest.TestCase):
+
+    def test_rows_match_generate_investment_schedule(self):
+        for initial_investment, interest_rate in [(1000, 10), (1000, 100), (1000, 1), (2500.5, 0.75)]:
+            with self.subTest(initial_investment=initial_investment, interest_rate=interest_rate):
+                schedule = generate_investment_schedule_columns(initial_investment, interest_rate)
+                self.assertEqual(list(schedule), generate_investment_schedule(initial_investment, interest_rate))
+
+    def test_print_investment_schedule_prints_the_same_table(self):
+        expected = io.StringIO()
+        with redirect_stdout(expected):
+            print_investment_schedule(generate_investment_schedule(1000, 5))
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_investment_schedule(generate_investment_schedule_columns(1000, 5))
+
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_random_access_by_index_and_year(self):
+        schedule = generate_investment_schedule_columns(1000, 10)
+        rows = generate_investment_schedule(1000, 10)
+
+        self.assertEqual(len(schedule), 8)
+        self.assertEqual(schedule[0], rows[0])
+        self.assertEqual(schedule[-1], rows[-1])
+        self.assertEqual(schedule.row_for_year(3), rows[2])
+
+        with self.assertRaises(IndexError):
+            schedule[8]
+        with self.assertRaises(IndexError):
+            schedule.row_for_year(0)
+
+    def test_slices_keep_year_numbers(self):
+        schedule = generate_investment_schedule_columns(1000, 1)
+        rows = generate_investment_schedule(1000, 1)
+
+        self.assertEqual(list(schedule[10:20]), rows[10:20])
+        self.assertEqual(list(schedule[::7]), rows[::7])
+        self.assertEqual(schedule[10:20].row_for_year(15), rows[14])
+
+    def test_numpy_columns(self):
+        schedule = InvestmentSchedule(np.array([100.0, 110.0]), np.array([10.0, 11.0]), np.array([110.0, 121.0]), first_year=5)
+        self.assertEqual(schedule.row_for_year(6)['ending_balance'], 121.0)
+        self.assertEqual([row['year'] for row in schedule], [5, 6])
+
+    def test_given_columns_of_different_lengths_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            InvestmentSchedule([1.0], [0.1, 0.2], [1.1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import csv
+import io
+from itertools import islice
+
+import numpy as np
+
+from investment_schedule import InvestmentSchedule
+
+DEFAULT_CHUNK_ROWS = 4096
+
+TABLE_WIDTH = 76
+TABLE_HEADER = (
+    "\n"
+    "Yearly Growth Schedule\n"
+    + "-" * TABLE_WIDTH + "\n"
+    + f"{'Year':^8} | {'Beginning Balance':^20} | {'Interest Earned':^20} | {'Ending Balance':^20}\n"
+    + "-" * TABLE_WIDTH + "\n"
+)
+TABLE_FOOTER = "-" * TABLE_WIDTH + "\n"
+
+CSV_HEADER = ['Year', 'Beginning Balance', 'Interest Earned', 'Ending Balance']
+
+# Fixed width little endian record used by export_binary: 4 + 3 * 8 = 28 bytes per year
+BINARY_RECORD = np.dtype([
+    ('year', '<u4'),
+    ('beginning_balance', '<f8'),
+    ('interest_earned', '<f8'),
+    ('ending_balance', '<f8'),
+])
+
+
+# Write the same table as print_investment_schedule to a text or binary writable.
+# schedule_data is a list of row dictionaries or an InvestmentSchedule. Rows are formatted chunk_rows
+# at a time into one string and written with a single call, instead of one print() per row.
+def write_schedule(schedule_data, output, chunk_rows=DEFAULT_CHUNK_ROWS):
+    write = _writer_for(output)
+    write(TABLE_HEADER)
+
+    for years, beginning_balances, interest_earned, ending_balances in _column_chunks(schedule_data, chunk_rows):
+        write(''.join([
+            f"{year:^8} | {f'${beginning:,.2f}'.center(20)} | {f'${interest:,.2f}'.center(20)} | {f'${ending:,.2f}'.center(20)}\n"
+            for year, beginning, interest, ending in zip(years, beginning_balances, interest_earned, ending_balances)
+        ]))
+
+    write(TABLE_FOOTER)
+
+
+# Write the schedule as CSV with full precision balances to a text writable
+def export_csv(schedule_data, output, chunk_rows=DEFAULT_CHUNK_ROWS):
+    csv_writer = csv.writer(output)
+    csv_writer.writerow(CSV_HEADER)
+
+    for columns in _column_chunks(schedule_data, chunk_rows):
+        csv_writer.writerows(zip(*columns))
+
+
+# Write the schedule as fixed width BINARY_RECORD records to a binary writable.
+# The file can be read back with numpy.fromfile(file_name, dtype=BINARY_RECORD).
+def export_binary(schedule_data, output, chunk_rows=DEFAULT_CHUNK_ROWS):
+    for years, beginning_balances, interest_earned, ending_balances in _column_chunks(schedule_data, chunk_rows):
+        records = np.empty(len(years), dtype=BINARY_RECORD)
+        records['year'] = years
+        records['beginning_balance'] = beginning_balances
+        records['interest_earned'] = interest_earned
+        records['ending_balance'] = ending_balances
+        output.write(records.tobytes())
+
+
+def _column_chunks(schedule_data, chunk_rows):
+    # Yields (years, beginning balances, interest earned, ending balances) column slices of chunk_rows rows
+    if chunk_rows <= 0:
+        raise ValueError("Chunk rows must be a positive number")
+
+    if isinstance(schedule_data, InvestmentSchedule):
+        for start in range(0, len(schedule_data), chunk_rows):
+            chunk = schedule_data[start:start + chunk_rows]
+            # Plain floats format much faster than NumPy scalars
+            yield (chunk.years, _to_list(chunk.beginning_balances), _to_list(chunk.interest_earned),
+                   _to_list(chunk.ending_balances))
+        return
+
+    rows = iter(schedule_data)
+    while True:
+        chunk = list(islice(rows, chunk_rows))
+        if not chunk:
+            return
+        yield ([row['year'] for row in chunk], [row['beginning_balance'] for row in chunk],
+               [row['interest_earned'] for row in chunk], [row['ending_balance'] for row in chunk])
+
+
+def _to_list(column):
+    return column.tolist() if hasattr(column, 'tolist') else list(column)
+
+
+def _writer_for(output):
+    # Text writables get strings, anything else gets UTF-8 bytes
+    if isinstance(output, io.TextIOBase):
+        return output.write
+    return lambda text: output.write(text.encode('utf-8'))
@@ -0,0 +1,69 @@
+import csv
+import io
+import unittest
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from main_m3 import generate_investment_schedule, print_investment_schedule
+from investment_schedule import generate_investment_schedule_columns
+from growth_projection import project_growth
+from schedule_renderer import BINARY_RECORD, export_binary, export_csv, write_schedule
+
+
+def printed_schedule(schedule_data):
+    output = io.StringIO()
+    with redirect_stdout(output):
+        print_investment_schedule(schedule_data)
+    return output.getvalue()
+
+
+class TestScheduleRenderer(unittest.TestCase):
+
+    def test_write_schedule_matches_print_investment_schedule(self):
+        schedules = [
+            generate_investment_schedule(1000, 1),
+            generate_investment_schedule_columns(1234.56, 0.5),
+            project_growth(10, 3, contributions=1000).schedule(0),
+            [],
+        ]
+        for schedule_data in schedules:
+            with self.subTest(rows=len(schedule_data)):
+                output = io.StringIO()
+                write_schedule(schedule_data, output, chunk_rows=16)
+                self.assertEqual(output.getvalue(), printed_schedule(schedule_data))
+
+    def test_write_schedule_to_binary_writable(self):
+        schedule_data = generate_investment_schedule(1000, 10)
+        output = io.BytesIO()
+        write_schedule(schedule_data, output)
+        self.assertEqual(output.getvalue().decode('utf-8'), printed_schedule(schedule_data))
+
+    def test_export_csv(self):
+        schedule_data = generate_investment_schedule_columns(1000, 10)
+        output = io.StringIO()
+        export_csv(schedule_data, output, chunk_rows=3)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(rows[0], ['Year', 'Beginning Balance', 'Interest Earned', 'Ending Balance'])
+        self.assertEqual(len(rows), 9)
+        self.assertEqual([int(rows[1][0]), *map(float, rows[1][1:])], [1, 1000.0, 100.0, 1100.0])
+        self.assertEqual(float(rows[8][3]), schedule_data[7]['ending_balance'])
+
+    def test_export_binary_round_trips(self):
+        rows = generate_investment_schedule(1000, 1)
+        output = io.BytesIO()
+        export_binary(rows, output, chunk_rows=16)
+
+        records = np.frombuffer(output.getvalue(), dtype=BINARY_RECORD)
+        self.assertEqual(len(output.getvalue()), 28 * len(rows))
+        self.assertEqual(records['year'].tolist(), [row['year'] for row in rows])
+        self.assertEqual(records['ending_balance'].tolist(), [row['ending_balance'] for row in rows])
+
+    def test_given_invalid_chunk_rows_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            write_schedule([], io.StringIO(), chunk_rows=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+# Batch versions of the unit conversions for whole columns of values.
+# Buffers are viewed as NumPy arrays without copying, so array('d'), memoryview and NumPy inputs
+# can be converted in place. Column files are raw little endian float64 values read through mmap.
+
+import mmap
+import os
+from array import array
+
+import numpy as np
+
+from main_m4 import KILOMETERS_TO_MILES_RATIO
+from discussion import CUPS_TO_OUNCES_RATIO, GALLONS_TO_LITERS_RATIO
+
+COLUMN_DTYPE = np.dtype('<f8')
+
+
+# The as_float_array function views a float64 buffer as a NumPy array without copying.
+# Anything else, like a list, is copied into a new array.
+def as_float_array(values):
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    if is_float_buffer(values):
+        return np.frombuffer(values, dtype=np.float64)
+    return np.asarray(values, dtype=np.float64)
+
+
+# The is_float_buffer function checks if values can be viewed as float64 values without copying.
+def is_float_buffer(values):
+    if isinstance(values, np.ndarray):
+        return values.dtype == np.float64
+    if isinstance(values, array):
+        return values.typecode == 'd'
+    if isinstance(values, memoryview):
+        return values.format == 'd' and values.c_contiguous
+    return False
+
+
+# The convert_buffer function multiplies every value by ratio.
+# With in_place=True the input buffer itself is updated, otherwise the result goes to out
+# (any float64 buffer of the same length) or to a new NumPy array. Returns the result as a NumPy array.
+def convert_buffer(values, ratio, out=None, in_place=False):
+    source = as_float_array(values)
+
+    if in_place:
+        if not is_float_buffer(values) or not source.flags.writeable:
+            raise ValueError("In place conversion needs a writable float64 buffer")
+        out = source
+    elif out is not None:
+        if not is_float_buffer(out):
+            raise ValueError("The output buffer must be a writable float64 buffer of the same length")
+        out = as_float_array(out)
+        if out.shape != source.shape or not out.flags.writeable:
+            raise ValueError("The output buffer must be a writable float64 buffer of the same length")
+
+    return np.multiply(source, ratio, out=out)
+
+
+def miles_to_kilometers_batch(miles, out=None, in_place=False):
+    return convert_buffer(miles, KILOMETERS_TO_MILES_RATIO, out, in_place)
+
+
+def cups_to_ounces_batch(cups, out=None, in_place=False):
+    return convert_buffer(cups, CUPS_TO_OUNCES_RATIO, out, in_place)
+
+
+def gallons_to_liters_batch(gallons, out=None, in_place=False):
+    return convert_buffer(gallons, GALLONS_TO_LITERS_RATIO, out, in_place)
+
+
+# The write_column function writes values to a binary column file of little endian float64 values.
+def write_column(file_name, values):
+    with open(file_name, 'wb') as file:
+        file.write(as_float_array(values).astype(COLUMN_DTYPE, copy=False).tobytes())
+
+
+# The read_column function maps a column file into memory and returns a read only NumPy view of it.
+# Pages are only read from disk when they are used.
+def read_column(file_name):
+    with open(file_name, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return np.empty(0, dtype=COLUMN_DTYPE)
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return np.frombuffer(mapped, dtype=COLUMN_DTYPE)
+
+
+# The convert_column_file function converts a whole column file with ratio through memory maps.
+# Without a destination, or with the source file as the destination, the source file is converted in place.
+def convert_column_file(source, ratio, destination=None):
+    size = os.path.getsize(source)
+    if size % COLUMN_DTYPE.itemsize:
+        raise ValueError(f"'{source}' is not a float64 column file")
+
+    # Opening the source as the destination would empty it before it is read
+    if destination is None or (os.path.exists(destination) and os.path.samefile(source, destination)):
+        with open(source, 'r+b') as file:
+            if size:
+                with mmap.mmap(file.fileno(), 0) as mapped:
+                    column = np.frombuffer(mapped, dtype=COLUMN_DTYPE)
+                    np.multiply(column, ratio, out=column)
+                    del column
+        return
+
+    with open(destination, 'w+b') as destination_file:
+        destination_file.truncate(size)
+        if size:
+            with mmap.mmap(destination_file.fileno(), 0) as mapped:
+                converted = np.frombuffer(mapped, dtype=COLUMN_DTYPE)
+                np.multiply(read_column(source), ratio, out=converted)
+                del converted
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+from array import array
+
+import numpy as np
+
+from main_m4 import miles_to_kilometers
+from discussion import cups_to_ounces, gallons_to_liters
+from batch_convert import (
+    convert_column_file,
+    cups_to_ounces_batch,
+    gallons_to_liters_batch,
+    miles_to_kilometers_batch,
+    read_column,
+    write_column,
+)
+
+VALUES = [0.0, 0.5, 1.0, 3.75, 1234.56, 1e9]
+
+
+class BatchConversionTests(unittest.TestCase):
+    def test_batch_conversions_match_scalar_functions(self):
+        self.assertEqual(miles_to_kilometers_batch(VALUES).tolist(), [miles_to_kilometers(value) for value in VALUES])
+        self.assertEqual(cups_to_ounces_batch(VALUES).tolist(), [cups_to_ounces(value) for value in VALUES])
+        self.assertEqual(gallons_to_liters_batch(VALUES).tolist(), [gallons_to_liters(value) for value in VALUES])
+
+    def test_in_place_conversion_of_array_and_memoryview(self):
+        miles = array('d', VALUES)
+        miles_to_kilometers_batch(miles, in_place=True)
+        self.assertEqual(list(miles), [miles_to_kilometers(value) for value in VALUES])
+
+        gallons = array('d', VALUES)
+        gallons_to_liters_batch(memoryview(gallons), in_place=True)
+        self.assertEqual(list(gallons), [gallons_to_liters(value) for value in VALUES])
+
+    def test_conversion_into_output_buffer(self):
+        cups = np.array(VALUES)
+        ounces = array('d', bytes(8 * len(VALUES)))
+        cups_to_ounces_batch(cups, out=ounces)
+
+        self.assertEqual(list(ounces), [cups_to_ounces(value) for value in VALUES])
+        self.assertEqual(cups.tolist(), VALUES)
+
+    def test_given_buffer_that_cannot_be_updated_in_place_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            miles_to_kilometers_batch(list(VALUES), in_place=True)
+        with self.assertRaises(ValueError):
+            miles_to_kilometers_batch(memoryview(bytes(8)).cast('d'), in_place=True)
+        with self.assertRaises(ValueError):
+            miles_to_kilometers_batch(VALUES, out=np.empty(2))
+        with self.assertRaises(ValueError):
+            miles_to_kilometers_batch(VALUES, out=[0.0] * len(VALUES))
+
+
+class ColumnFileTests(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.miles_path = os.path.join(self.test_dir.name, 'miles.f64')
+        self.kilometers_path = os.path.join(self.test_dir.name, 'kilometers.f64')
+
+    def tearDown(self):
+        self.test_dir.cleanup()
+
+    def test_write_and_read_column(self):
+        write_column(self.miles_path, VALUES)
+        self.assertEqual(os.path.getsize(self.miles_path), 8 * len(VALUES))
+        self.assertEqual(read_column(self.miles_path).tolist(), VALUES)
+
+    def test_convert_column_file_to_destination(self):
+        write_column(self.miles_path, VALUES)
+        convert_column_file(self.miles_path, 1.609344, self.kilometers_path)
+
+        self.assertEqual(read_column(self.kilometers_path).tolist(), [miles_to_kilometers(value) for value in VALUES])
+        self.assertEqual(read_column(self.miles_path).tolist(), VALUES)
+
+    def test_convert_column_file_in_place(self):
+        write_column(self.miles_path, VALUES)
+        convert_column_file(self.miles_path, 1.609344)
+        self.assertEqual(read_column(self.miles_path).tolist(), [miles_to_kilometers(value) for value in VALUES])
+
+    def test_convert_column_file_onto_itself(self):
+        write_column(self.miles_path, VALUES)
+        same_file = os.path.join(os.path.dirname(self.miles_path), ".", os.path.basename(self.miles_path))
+        convert_column_file(self.miles_path, 1.609344, same_file)
+        self.assertEqual(read_column(self.miles_path).tolist(), [miles_to_kilometers(value) for value in VALUES])
+
+    def test_empty_column_file(self):
+        write_column(self.miles_path, [])
+        convert_column_file(self.miles_path, 1.609344, self.kilometers_path)
+        self.assertEqual(len(read_column(self.kilometers_path)), 0)
+
+    def test_given_file_that_is_not_a_column_then_raise_value_error(self):
+        with open(self.miles_path, 'wb') as file:
+            file.write(b'abc')
+        with self.assertRaises(ValueError):
+            convert_column_file(self.miles_path, 1.609344)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
 #Example Program that converts cups to fluid ounces
 
+import argparse
+import sys
+import time
+
 # Constants
 CUPS_TO_OUNCES_RATIO = 8
 GALLONS_TO_LITERS_RATIO = 3.785411784
@@ -8,36 +12,39 @@ def main():
     # display the intro screen.
     intro()
 
-    try:
-        # Ask user to select the conversion type.
-        print("Select the conversion type:")
-        print("1. Cups to Fluid Ounces")
-        print("2. Gallons to Liters")
-        choice = int(input("Enter your choice (1 or 2): "))
-
-        if choice == 1:
-            # Get the number of cups.
-            cups_needed = int(input('Enter the number of cups: '))
-
-            # Convert the cups to ounces and display result
-            ounces = cups_to_ounces(cups_needed)
-            display_result(ounces, "ounces")
-        elif choice == 2:
-            # Get the number of gallons.
-            gallons_needed = int(input('Enter the number of gallons: '))
-
-            # Convert the gallons to liters and display result
-            liters = gallons_to_liters(gallons_needed)
-            display_result(liters, "liters")
-        else:
-            print("Invalid choice. Please enter 1 or 2.")
-            print()
-            main()
+    # Keep asking until a conversion succeeds. A loop instead of calling main() again,
+    # so bad input can not grow the stack.
+    while True:
+        try:
+            # Ask user to select the conversion type.
+            print("Select the conversion type:")
+            print("1. Cups to Fluid Ounces")
+            print("2. Gallons to Liters")
+            choice = int(input("Enter your choice (1 or 2): "))
 
-    except:
-        print("An exception occurred, try again by entering only a number")
-        print()
-        main()
+            if choice == 1:
+                # Get the number of cups.
+                cups_needed = int(input('Enter the number of cups: '))
+
+                # Convert the cups to ounces and display result
+                ounces = cups_to_ounces(cups_needed)
+                display_result(ounces, "ounces")
+                return
+            elif choice == 2:
+                # Get the number of gallons.
+                gallons_needed = int(input('Enter the number of gallons: '))
+
+                # Convert the gallons to liters and display result
+                liters = gallons_to_liters(gallons_needed)
+                display_result(liters, "liters")
+                return
+            else:
+                print("Invalid choice. Please enter 1 or 2.")
+                print()
+
+        except ValueError:
+            print("An exception occurred, try again by entering only a number")
+            print()
 
 def display_result(value, unit):
     print(f"That converts to {value} {unit}.")
@@ -60,6 +67,104 @@ def cups_to_ounces(cups):
     return cups * CUPS_TO_OUNCES_RATIO
 
 
+# Conversions available in batch mode, by choice number or unit name
+BATCH_CONVERSIONS = {
+    '1': (cups_to_ounces, "ounces"),
+    'cups': (cups_to_ounces, "ounces"),
+    '2': (gallons_to_liters, "liters"),
+    'gallons': (gallons_to_liters, "liters"),
+}
+
+# Number of results collected before they are written
+BATCH_WRITE_LINES = 4096
+
+# The convert_request function converts one batch request like "1 3" or "gallons 2.5"
+# and returns the same sentence display_result prints.
+def convert_request(line):
+    parts = line.split()
+    if len(parts) != 2:
+        raise ValueError("expected a conversion and an amount, like '1 3' or 'gallons 2'")
+
+    conversion, amount = parts
+    if conversion.lower() not in BATCH_CONVERSIONS:
+        raise ValueError(f"unknown conversion '{conversion}', use 1, 2, cups or gallons")
+    convert, unit = BATCH_CONVERSIONS[conversion.lower()]
+
+    try:
+        value = int(amount)
+    except ValueError:
+        try:
+            value = float(amount)
+        except ValueError:
+            raise ValueError(f"'{amount}' is not a valid number") from None
+
+    return f"That converts to {convert(value)} {unit}."
+
+# The run_batch function converts one request per line and streams the results to output.
+# Bad lines produce an error line and processing goes on, so memory stays constant for any input.
+# Returns a dictionary of statistics for the run.
+def run_batch(lines, output):
+    start = time.perf_counter()
+    line_count = 0
+    converted = 0
+    errors = 0
+    results = []
+
+    for line_count, line in enumerate(lines, start=1):
+        if not line.strip():
+            results.append("\n")
+            continue
+
+        try:
+            results.append(convert_request(line) + "\n")
+            converted += 1
+        except ValueError as e:
+            errors += 1
+            results.append(f"Error on line {line_count}: {e}\n")
+
+        if len(results) >= BATCH_WRITE_LINES:
+            output.write("".join(results))
+            results = []
+
+    output.write("".join(results))
+    output.flush()
+    seconds = time.perf_counter() - start
+
+    return {
+        'lines': line_count,
+        'converted': converted,
+        'errors': errors,
+        'seconds': seconds,
+        'lines_per_second': line_count / seconds if seconds else 0.0,
+    }
+
+# The batch_main function runs batch mode from the command line and reports throughput on stderr.
+def batch_main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert cups to fluid ounces and gallons to liters.")
+    parser.add_argument('--batch', action='store_true', help="Read one request per line, like '1 3' or 'gallons 2'")
+    parser.add_argument('file', nargs='?', default='-', help="File of requests for batch mode (default: stdin)")
+    args = parser.parse_args(argv)
+
+    if not args.batch:
+        main()
+        return 0
+
+    try:
+        if args.file == '-':
+            stats = run_batch(sys.stdin, sys.stdout)
+        else:
+            with open(args.file, 'r') as file:
+                stats = run_batch(file, sys.stdout)
+    except OSError as e:
+        print(f"Error reading requests: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Converted {stats['converted']:,} of {stats['lines']:,} lines "
+          f"with {stats['errors']:,} errors in {stats['seconds']:,.2f} seconds "
+          f"({stats['lines_per_second']:,.0f} lines/s)", file=sys.stderr)
+    return 0
+
+
 # Call the main function.
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(batch_main())
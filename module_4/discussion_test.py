@@ -1,7 +1,7 @@
 import unittest
 from unittest.mock import patch
 from io import StringIO
-from discussion import cups_to_ounces, gallons_to_liters, display_result
+from discussion import cups_to_ounces, gallons_to_liters, display_result, main, run_batch, convert_request
 
 class ConversionTests(unittest.TestCase):
     def test_cups_to_ounces(self):
@@ -36,5 +36,48 @@ class ConversionTests(unittest.TestCase):
             self.assertEqual(fake_output.getvalue(), "That converts to 3.785411784 liters.\n")
 
 
+class InteractiveTests(unittest.TestCase):
+    @patch('builtins.input', side_effect=["abc", "3"] * 1000 + ["1", "2"])
+    def test_main_retries_without_recursion(self, mock_input):
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            main()
+            self.assertIn("That converts to 16 ounces.", fake_output.getvalue())
+            self.assertIn("An exception occurred", fake_output.getvalue())
+            self.assertIn("Invalid choice", fake_output.getvalue())
+
+
+class BatchTests(unittest.TestCase):
+    def test_convert_request(self):
+        self.assertEqual(convert_request("1 3"), "That converts to 24 ounces.")
+        self.assertEqual(convert_request("Gallons 2"), "That converts to 7.570823568 liters.")
+        self.assertEqual(convert_request("cups 0.5"), "That converts to 4.0 ounces.")
+
+    def test_given_bad_request_then_raise_value_error(self):
+        for line in ["1", "3 1", "cups abc", "1 2 3"]:
+            with self.subTest(line=line):
+                with self.assertRaises(ValueError):
+                    convert_request(line)
+
+    def test_run_batch_streams_results_and_errors(self):
+        lines = ["1 3\n", "bad\n", "\n", "2 1\n"]
+        output = StringIO()
+        stats = run_batch(iter(lines), output)
+
+        self.assertEqual(output.getvalue(),
+                         "That converts to 24 ounces.\n"
+                         "Error on line 2: expected a conversion and an amount, like '1 3' or 'gallons 2'\n"
+                         "\n"
+                         "That converts to 3.785411784 liters.\n")
+        self.assertEqual(stats['lines'], 4)
+        self.assertEqual(stats['converted'], 2)
+        self.assertEqual(stats['errors'], 1)
+
+    def test_run_batch_with_many_lines(self):
+        output = StringIO()
+        stats = run_batch(("1 1\n" for _ in range(10000)), output)
+        self.assertEqual(stats['converted'], 10000)
+        self.assertEqual(output.getvalue().count("\n"), 10000)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,8 @@
 # Example Program that converts Miles to Kilometers
 
+import sys
+from functools import lru_cache
+
 # Constants
 KILOMETERS_TO_MILES_RATIO = 1.609344
 
@@ -51,6 +54,11 @@ def miles_to_kilometers(miles):
 
 # The display_odometer function creates an ASCII art display for the kilometers.
 def display_odometer(kilometers):
+    print(render_odometer(kilometers))
+
+# The render_odometer function returns the odometer art as a single string.
+# Only the number is formatted here, the frame comes from the cached template for its width.
+def render_odometer(kilometers):
     # Format the kilometers with commas and 2 decimal places
     # Example: 1234.56 becomes "1,234.56"
     km_str = f"{kilometers:,.2f}"
@@ -60,19 +68,44 @@ def display_odometer(kilometers):
     # Ensure minimum width of 14 characters to fit "ODOMETER" header
     width = max(len(km_str) + 4, 14)
 
+    top, number_line, bottom = odometer_template(width)
+    return top + number_line.format(km_str) + bottom
+
+# The render_odometers function draws many odometers side by side and returns one string.
+# per_row limits how many odometers go on a row, rows are separated by a blank line.
+def render_odometers(kilometers_list, per_row=None):
+    frames = [render_odometer(kilometers).splitlines() for kilometers in kilometers_list]
+    per_row = per_row or len(frames) or 1
+
+    rows = []
+    for start in range(0, len(frames), per_row):
+        row_frames = frames[start:start + per_row]
+        rows.append("".join("".join(lines) + "\n" for lines in zip(*row_frames)))
+
+    return "\n".join(rows)
+
+# The write_odometers function writes many odometers side by side with a single write call.
+def write_odometers(kilometers_list, output=None, per_row=None):
+    output = output or sys.stdout
+    output.write(render_odometers(kilometers_list, per_row))
+
+# The odometer_template function builds the parts of the odometer art that only depend on the width.
+# Returns the lines above the number, a format string for the number line and the lines below it.
+# Results are cached, so each width is only built once.
+@lru_cache(maxsize=64)
+def odometer_template(width):
     # Create the horizontal border line using ═ repeated to match width
     border = "═" * width
     # Create spaces for padding the text lines
     spaces = " " * (width - 2)
 
-    # Draw the Odometer art
-    print(f"    ╔{border}╗")
-    print(f"    ║   ODOMETER{spaces[11:]}  ║")
-    print(f"    ╠{border}╣")
-    print(f"    ║{km_str:>{width - 2}}  ║")
-    print(f"    ║      KM{spaces[8:]}  ║")
-    print(f"    ╚{border}╝")
-    print()
+    top = (f"    ╔{border}╗\n"
+           f"    ║   ODOMETER{spaces[11:]}  ║\n"
+           f"    ╠{border}╣\n")
+    number_line = f"    ║{{:>{width - 2}}}  ║\n"
+    bottom = (f"    ║      KM{spaces[8:]}  ║\n"
+              f"    ╚{border}╝\n")
+    return top, number_line, bottom
 
 # Call the main function.
 if __name__ == "__main__":
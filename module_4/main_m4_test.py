@@ -1,6 +1,9 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
-from main_m4 import miles_to_kilometers, get_miles
+from io import StringIO
+from main_m4 import miles_to_kilometers, get_miles, display_odometer, render_odometer, render_odometers, odometer_template, write_odometers
 
 class MilesConversionTests(unittest.TestCase):
     def test_one_mile(self):
@@ -13,5 +16,56 @@ class MilesConversionTests(unittest.TestCase):
         self.assertAlmostEqual(miles_to_kilometers(1000), 1609.344)
 
 
+class OdometerTests(unittest.TestCase):
+    def test_display_odometer(self):
+        with patch('sys.stdout', new=StringIO()) as fake_output:
+            display_odometer(1234.56)
+            self.assertEqual(fake_output.getvalue(),
+                             "    ╔══════════════╗\n"
+                             "    ║   ODOMETER   ║\n"
+                             "    ╠══════════════╣\n"
+                             "    ║    1,234.56  ║\n"
+                             "    ║      KM      ║\n"
+                             "    ╚══════════════╝\n"
+                             "\n")
+
+    def test_wide_odometer(self):
+        lines = render_odometer(1234567890.12).splitlines()
+        self.assertEqual(lines[3], "    ║  1,234,567,890.12  ║")
+        self.assertEqual(len({len(line) for line in lines}), 1)
+
+    def test_templates_are_cached_per_width(self):
+        odometer_template.cache_clear()
+        for kilometers in [1.5, 2.5, 3.5, 1000000.0]:
+            render_odometer(kilometers)
+        self.assertEqual(odometer_template.cache_info().misses, 2)
+
+    def test_render_odometers_side_by_side(self):
+        rows = render_odometers([1.5, 42, 7], per_row=2).split("\n\n")
+
+        self.assertEqual(len(rows), 2)
+        first_row = rows[0].splitlines()
+        self.assertEqual(len(first_row), 6)
+        self.assertEqual(first_row[3], render_odometer(1.5).splitlines()[3] + render_odometer(42).splitlines()[3])
+        self.assertEqual(rows[1], render_odometer(7))
+
+    def test_write_odometers_to_file(self):
+        with tempfile.TemporaryDirectory() as test_dir:
+            path = os.path.join(test_dir, "odometers.txt")
+            with open(path, 'w', encoding='utf-8') as output:
+                write_odometers([1.5, 42, 7], output, per_row=2)
+            with open(path, encoding='utf-8') as output:
+                written = output.read()
+
+        self.assertEqual(written, render_odometers([1.5, 42, 7], per_row=2))
+        self.assertIn("42.00", written)
+        self.assertEqual(written.count("ODOMETER"), 3)
+
+    def test_write_odometers_defaults_to_stdout(self):
+        with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+            write_odometers([3])
+        self.assertEqual(mock_stdout.getvalue(), render_odometers([3]))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,139 @@
+# A registry of measurement units and the conversions between them.
+# Units are nodes of a graph and every direct conversion is an edge. compile() walks the graph once
+# and stores the factor for every pair of units in a matrix, so a conversion is one table lookup
+# and one multiply. Units that cannot be converted into each other have a factor of NaN.
+# Unit codes follow the order the units were added in, so codes stay valid when units are added.
+
+from collections import deque
+
+import numpy as np
+
+from main_m4 import KILOMETERS_TO_MILES_RATIO
+from discussion import CUPS_TO_OUNCES_RATIO, GALLONS_TO_LITERS_RATIO
+
+
+class UnitRegistry:
+    def __init__(self):
+        self._conversions = {}
+        self._units = []
+        self._codes = {}
+        self._factors = None
+
+    # The add_conversion function records that 1 from_unit equals factor to_unit, and the reverse.
+    def add_conversion(self, from_unit, to_unit, factor):
+        if not factor > 0:
+            raise ValueError("Conversion factors must be positive numbers")
+
+        self._conversions.setdefault(from_unit, {})[to_unit] = factor
+        self._conversions.setdefault(to_unit, {})[from_unit] = 1 / factor
+        self._factors = None
+
+    # The compile function builds the conversion factor matrix for every pair of units.
+    # It runs automatically the first time a conversion is needed after units were added.
+    def compile(self):
+        units = list(self._conversions)
+        codes = {unit: code for code, unit in enumerate(units)}
+        factors = np.full((len(units), len(units)), np.nan)
+
+        # Breadth first search from every unit, multiplying the factors along the way
+        for unit in units:
+            row = factors[codes[unit]]
+            row[codes[unit]] = 1.0
+            queue = deque([unit])
+            while queue:
+                current = queue.popleft()
+                for neighbor, factor in self._conversions[current].items():
+                    if np.isnan(row[codes[neighbor]]):
+                        row[codes[neighbor]] = row[codes[current]] * factor
+                        queue.append(neighbor)
+
+        self._units = units
+        self._codes = codes
+        self._factors = factors
+
+    @property
+    def units(self):
+        self._ensure_compiled()
+        return list(self._units)
+
+    # The unit_code function returns the row of a unit in the factor matrix.
+    def unit_code(self, unit):
+        self._ensure_compiled()
+        try:
+            return self._codes[unit]
+        except KeyError:
+            raise ValueError(f"Unknown unit '{unit}'") from None
+
+    # The encode_units function turns a sequence of unit names into an array of unit codes.
+    # Each distinct name is looked up once, however many times it appears.
+    def encode_units(self, units):
+        names, inverse = np.unique(np.asarray(units, dtype=object).astype(str), return_inverse=True)
+        codes = np.array([self.unit_code(name) for name in names], dtype=np.intp)
+        return codes[inverse.reshape(-1)]
+
+    # The factor function returns the number to multiply by to convert from_unit into to_unit.
+    def factor(self, from_unit, to_unit):
+        factor = self._factors_for(self.unit_code(from_unit), self.unit_code(to_unit))
+        return float(factor)
+
+    # The convert function converts a single value.
+    def convert(self, value, from_unit, to_unit):
+        return value * self.factor(from_unit, to_unit)
+
+    # The convert_codes function converts an array of values with unit codes from encode_units.
+    # to_codes can be a single code or one code per value.
+    def convert_codes(self, values, from_codes, to_codes):
+        self._ensure_compiled()
+        return np.asarray(values, dtype=np.float64) * self._factors_for(from_codes, to_codes)
+
+    # The convert_records function converts a stream of (value, unit) records into to_unit.
+    # Returns the converted values as a NumPy array.
+    def convert_records(self, records, to_unit):
+        values = []
+        units = []
+        for value, unit in records:
+            values.append(value)
+            units.append(unit)
+
+        if not values:
+            return np.empty(0)
+        return self.convert_codes(values, self.encode_units(units), self.unit_code(to_unit))
+
+    def _factors_for(self, from_codes, to_codes):
+        self._ensure_compiled()
+        factors = self._factors[from_codes, to_codes]
+        if np.isnan(factors).any():
+            raise ValueError("Cannot convert between units of different kinds")
+        return factors
+
+    def _ensure_compiled(self):
+        if self._factors is None:
+            self.compile()
+
+
+# The default_registry function returns a registry with common length and volume units.
+def default_registry():
+    registry = UnitRegistry()
+
+    # Length
+    registry.add_conversion('mile', 'kilometer', KILOMETERS_TO_MILES_RATIO)
+    registry.add_conversion('kilometer', 'meter', 1000)
+    registry.add_conversion('meter', 'centimeter', 100)
+    registry.add_conversion('centimeter', 'millimeter', 10)
+    registry.add_conversion('mile', 'yard', 1760)
+    registry.add_conversion('yard', 'foot', 3)
+    registry.add_conversion('foot', 'inch', 12)
+    registry.add_conversion('nautical_mile', 'meter', 1852)
+
+    # Volume
+    registry.add_conversion('cup', 'fluid_ounce', CUPS_TO_OUNCES_RATIO)
+    registry.add_conversion('gallon', 'liter', GALLONS_TO_LITERS_RATIO)
+    registry.add_conversion('gallon', 'quart', 4)
+    registry.add_conversion('quart', 'pint', 2)
+    registry.add_conversion('pint', 'cup', 2)
+    registry.add_conversion('fluid_ounce', 'tablespoon', 2)
+    registry.add_conversion('tablespoon', 'teaspoon', 3)
+    registry.add_conversion('liter', 'milliliter', 1000)
+
+    registry.compile()
+    return registry
@@ -0,0 +1,83 @@
+import unittest
+
+import numpy as np
+
+from main_m4 import miles_to_kilometers
+from discussion import cups_to_ounces, gallons_to_liters
+from unit_registry import UnitRegistry, default_registry
+
+
+class UnitRegistryTests(unittest.TestCase):
+    def setUp(self):
+        self.registry = default_registry()
+
+    def test_direct_conversions_match_the_converter_functions(self):
+        for value in [0, 1, 2.5, 1000]:
+            with self.subTest(value=value):
+                self.assertEqual(self.registry.convert(value, 'mile', 'kilometer'), miles_to_kilometers(value))
+                self.assertEqual(self.registry.convert(value, 'cup', 'fluid_ounce'), cups_to_ounces(value))
+                self.assertEqual(self.registry.convert(value, 'gallon', 'liter'), gallons_to_liters(value))
+
+    def test_transitive_conversions(self):
+        self.assertAlmostEqual(self.registry.convert(1, 'mile', 'foot'), 5280)
+        self.assertAlmostEqual(self.registry.convert(1, 'gallon', 'fluid_ounce'), 128)
+        self.assertAlmostEqual(self.registry.convert(1, 'kilometer', 'mile'), 1 / 1.609344)
+        self.assertAlmostEqual(self.registry.convert(1, 'cup', 'milliliter'), 3785.411784 / 16)
+        self.assertEqual(self.registry.factor('meter', 'meter'), 1.0)
+
+    def test_every_pair_of_factors_is_consistent(self):
+        units = self.registry.units
+        for from_unit in units:
+            for to_unit in units:
+                try:
+                    factor = self.registry.factor(from_unit, to_unit)
+                except ValueError:
+                    continue
+                self.assertAlmostEqual(factor * self.registry.factor(to_unit, from_unit), 1.0)
+
+    def test_convert_records_with_mixed_units(self):
+        records = [(1, 'mile'), (1000, 'meter'), (3, 'foot'), (2, 'mile')]
+        kilometers = self.registry.convert_records(iter(records), 'kilometer')
+
+        np.testing.assert_allclose(kilometers, [1.609344, 1, 0.0009144, 3.218688])
+        self.assertEqual(len(self.registry.convert_records([], 'kilometer')), 0)
+
+    def test_convert_codes(self):
+        codes = self.registry.encode_units(['cup', 'pint', 'cup'])
+        ounces = self.registry.convert_codes([1, 1, 2], codes, self.registry.unit_code('fluid_ounce'))
+        np.testing.assert_allclose(ounces, [8, 16, 16])
+
+    def test_given_units_of_different_kinds_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            self.registry.convert(1, 'mile', 'liter')
+        with self.assertRaises(ValueError):
+            self.registry.convert_records([(1, 'mile'), (1, 'cup')], 'kilometer')
+
+    def test_given_unknown_unit_then_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            self.registry.convert(1, 'furlong', 'mile')
+
+    def test_adding_a_conversion_recompiles_the_registry(self):
+        registry = UnitRegistry()
+        registry.add_conversion('a', 'b', 2)
+        self.assertEqual(registry.convert(1, 'a', 'b'), 2)
+
+        registry.add_conversion('b', 'c', 5)
+        self.assertEqual(registry.convert(1, 'a', 'c'), 10)
+
+        with self.assertRaises(ValueError):
+            registry.add_conversion('c', 'd', 0)
+
+    def test_codes_stay_valid_after_adding_a_conversion(self):
+        registry = UnitRegistry()
+        registry.add_conversion('m', 'n', 2)
+        codes = registry.encode_units(['m', 'n'])
+        to_code = registry.unit_code('n')
+
+        registry.add_conversion('a', 'm', 3)
+        np.testing.assert_allclose(registry.convert_codes([1, 1], codes, to_code), [2, 1])
+        self.assertEqual(registry.convert(1, 'a', 'n'), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# Benchmarks for the module 5 user file code.
+# Run with: python benchmark_m5.py --storage-sizes 1000000 10000000 50000000
+
+import argparse
+import os
+import re
+import tempfile
+import time
+
+from main_m5 import read_csv_file
+from storage import ColumnarWriter, read_columns, read_users
+from user_store import UserStore
+from validation import validate_batch, validate_file
+
+
+# Time a function call and return the elapsed seconds
+def time_it(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+# The address check as it was written before the validation module: compiled on every call, two searches
+def is_valid_address_format_per_call(address):
+    if len(address) < 5:
+        return False
+    pattern = re.compile(r'\d+\s+\w+')
+    if not pattern.search(address):
+        return False
+    if not re.search(r'[a-zA-Z]', address):
+        return False
+    return True
+
+
+def is_valid_phone_format_per_call(phone):
+    pattern = re.compile(r'^\d{3}-\d{3}-\d{4}$')
+    return bool(pattern.match(phone))
+
+
+def validate_with_per_call_functions(records):
+    return [is_valid_address_format_per_call(address) and is_valid_phone_format_per_call(phone)
+            for _, address, phone in records]
+
+
+def make_records(count):
+    records = []
+    for i in range(count):
+        phone = f"555-{i % 1000:03}-{i % 10000:04}" if i % 7 else f"555{i % 10000:07}"
+        address = f"{i} Main St, Springfield, IL 62701" if i % 11 else "Main St"
+        records.append([f"User {i}", address, phone])
+    return records
+
+
+def benchmark_validation(count=1_000_000):
+    records = make_records(count)
+
+    per_call_seconds = time_it(validate_with_per_call_functions, records)
+    batch_seconds = time_it(validate_batch, records)
+
+    print(f"Validating {count:,} records")
+    print(f"  per call functions: {per_call_seconds:8.3f} s")
+    print(f"  validate_batch:     {batch_seconds:8.3f} s  ({per_call_seconds / batch_seconds:,.1f}x faster)")
+
+
+def benchmark_validate_file(count=1_000_000):
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "users.csv")
+        with UserStore(file_name) as store:
+            for record in make_records(count):
+                store.append_row(record)
+
+        print(f"Validating a file of {count:,} records")
+        for workers in sorted({1, os.cpu_count() or 1}):
+            stats = validate_file(file_name, workers=workers)
+            print(f"  {workers:>3} workers: {stats['seconds']:8.3f} s  ({stats['rows_per_second']:,.0f} rows/s)")
+
+
+def file_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def benchmark_storage(sizes=(1_000_000, 10_000_000, 50_000_000)):
+    print("Reading user files, CSV against columnar")
+    for count in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            csv_file = os.path.join(directory, "users.csv")
+            columnar_file = os.path.join(directory, "users.cols")
+            with UserStore(csv_file) as store, ColumnarWriter(columnar_file) as writer:
+                for i in range(count):
+                    row = [f"User {i}", f"{i} Main St, Springfield, IL 62701", f"555-{i % 1000:03}-{i % 10000:04}"]
+                    store.append_row(row)
+                    writer.append_row(row)
+
+            csv_seconds = time_it(read_csv_file, csv_file)
+            columns_seconds = time_it(read_columns, columnar_file)
+            rows_seconds = time_it(read_users, columnar_file)
+            projection_seconds = time_it(read_columns, columnar_file, ['phone_number'])
+
+            print(f"  {count:,} rows")
+            print(f"    CSV rows:            {csv_seconds:8.3f} s  {file_size(csv_file) / 1e6:10,.1f} MB")
+            print(f"    columnar columns:    {columns_seconds:8.3f} s  {file_size(columnar_file) / 1e6:10,.1f} MB")
+            print(f"    columnar rows:       {rows_seconds:8.3f} s")
+            print(f"    columnar, phones:    {projection_seconds:8.3f} s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the module 5 user file code.")
+    parser.add_argument('--records', type=int, default=1_000_000, help="Records for the validation benchmarks")
+    parser.add_argument('--storage-sizes', type=int, nargs='+', default=[1_000_000, 10_000_000, 50_000_000],
+                        help="Row counts for the storage benchmark")
+    args = parser.parse_args(argv)
+
+    benchmark_validation(args.records)
+    print()
+    benchmark_validate_file(args.records)
+    print()
+    benchmark_storage(args.storage_sizes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# Bulk import of user CSV files into a user store, dropping duplicate users.
+# Run with: python bulk_import.py users.csv new_users_1.csv new_users_2.csv --workers 8
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from csv_pages import ENCODING, iter_csv_records, iter_record_chunks, map_chunks_in_order
+from disk_hash_table import DiskHashTable, key_hash
+from file_checksum import prefix_checksum, prefix_unchanged
+from user_index import normalize_phone
+from user_store import CSV_HEADER, UserStore
+from validation import FIELD_COUNT, VALID, validate_batch
+
+HASH_SET_SUFFIX = '.dedup.idx'
+HASH_META_SUFFIX = '.dedup.json'
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+FIELD_SEPARATOR = '\x1f'
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    try:
+        stats = import_users(args.store, args.sources, args.workers, args.chunk_bytes, args.skip_invalid)
+    except (OSError, ValueError) as e:
+        print(f"Error importing users: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Read {stats['rows']:,} rows in {stats['seconds']:,.2f} seconds ({stats['rows_per_second']:,.0f} rows/s)",
+          file=sys.stderr)
+    print(f"Imported {stats['imported']:,} users, dropped {stats['duplicates']:,} duplicates "
+          f"and {stats['invalid']:,} invalid rows", file=sys.stderr)
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Import user CSV files into a user store without duplicates.")
+    parser.add_argument('store', help="The user CSV file to import into. It is created if it does not exist.")
+    parser.add_argument('sources', nargs='+', help="CSV files of name, address and phone number to import")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="Number of worker processes")
+    parser.add_argument('--chunk-bytes', type=int, default=DEFAULT_CHUNK_BYTES, help="Bytes of input hashed per task")
+    parser.add_argument('--skip-invalid', action='store_true',
+                        help="Also drop rows whose address or phone number does not pass validation")
+    return parser.parse_args(argv)
+
+
+def import_users(store_file_name, source_file_names, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES,
+                 skip_invalid=False):
+    """Appends the users of the source files to the store, skipping users that are already in it.
+
+    Two rows are duplicates when their normalized fields match (see normalize_record). The hashes
+    of the stored users are kept in an on-disk hash set next to the store, so memory use does not
+    grow with the size of the store. Rows are parsed, normalized and hashed in worker processes,
+    and the results are checked and appended in order in one streaming pass.
+
+    Args:
+        store_file_name (str): The user CSV file to append to.
+        source_file_names (list): The CSV files to import. A header row is skipped if present.
+        workers (int): The number of worker processes. Defaults to the number of cores.
+        chunk_bytes (int): The approximate number of bytes each task parses.
+        skip_invalid (bool): Also drop rows that do not pass validation.
+
+    Returns:
+        dict: The number of 'rows' read, users 'imported', 'duplicates' and 'invalid' rows dropped,
+            the 'seconds' it took and the 'rows_per_second'.
+    """
+    if chunk_bytes < 1:
+        raise ValueError("Chunk size must be at least 1 byte.")
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    stats = {'rows': 0, 'imported': 0, 'duplicates': 0, 'invalid': 0}
+
+    hashed_size, checksum = _hashed_prefix(store_file_name)
+    with UserStore(store_file_name) as store, _open_hash_set(store_file_name, hashed_size) as hash_set:
+        executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            for source_file_name in source_file_names:
+                with open(source_file_name, 'rb') as source:
+                    _skip_header(source)
+                    chunks = iter_record_chunks(source, chunk_bytes)
+                    results = map_chunks_in_order(executor, hash_chunk, chunks, 2 * workers, skip_invalid)
+                    for hashes, rows, invalid in results:
+                        stats['rows'] += len(rows) + invalid
+                        stats['invalid'] += invalid
+                        for row_hash, row in zip(hashes, rows):
+                            if hash_set.put(row_hash, 1):
+                                store.append_row(row)
+                                stats['imported'] += 1
+                            else:
+                                stats['duplicates'] += 1
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    # The store is closed, so its size now includes every imported row
+    _save_hash_meta(store_file_name, hashed_size, checksum)
+
+    seconds = time.perf_counter() - start
+    stats['seconds'] = seconds
+    stats['rows_per_second'] = stats['rows'] / seconds if seconds else 0.0
+    return stats
+
+
+def open_hash_set(store_file_name):
+    """Opens the hash set of the users in the store, bringing it up to date first.
+
+    Rows appended to the store since the last import are hashed and added. The checksum of the
+    whole part hashed before is checked first, and if any of it was edited, the hash set is
+    rebuilt from the whole store, even when rows were also appended.
+
+    Returns:
+        DiskHashTable: The open hash set. Its keys are the row hashes.
+    """
+    return _open_hash_set(store_file_name, _hashed_prefix(store_file_name)[0])
+
+
+def _open_hash_set(store_file_name, hashed_size):
+    # Hashes the rows past the first hashed_size bytes of the store, or every row if it is 0
+    hash_set = DiskHashTable(store_file_name + HASH_SET_SUFFIX).open()
+    if hashed_size == 0 or len(hash_set) == 0:
+        hash_set.clear()
+        hashed_size = 0
+
+    if os.path.exists(store_file_name):
+        for offset, row in iter_csv_records(store_file_name, hashed_size):
+            if offset == 0:
+                continue  # The header row
+            if len(row) == FIELD_COUNT:
+                hash_set.put(hash_record(*row), 1)
+
+    return hash_set
+
+
+def normalize_record(name, address, phone):
+    """Normalizes the fields of a user so rows that only differ in case or spacing match.
+
+    Names and addresses are case folded with runs of whitespace collapsed to one space.
+    Only the digits of the phone number are kept.
+    """
+    return ' '.join(name.split()).casefold(), ' '.join(address.split()).casefold(), normalize_phone(phone)
+
+
+def hash_record(name, address, phone):
+    """Returns the 64-bit hash of a user's normalized fields."""
+    return key_hash(FIELD_SEPARATOR.join(normalize_record(name, address, phone)))
+
+
+def hash_chunk(chunk, skip_invalid=False):
+    """Worker task: parses a chunk of CSV bytes and hashes its rows.
+
+    Returns:
+        tuple: (row hashes, rows, number of invalid rows dropped). Rows without exactly three
+            fields are always dropped; with skip_invalid, so are rows that fail validation.
+    """
+    rows = [row for row in csv.reader(io.StringIO(chunk.decode(ENCODING), newline='')) if row]
+    total = len(rows)
+
+    if skip_invalid:
+        rows = [row for row, errors in zip(rows, validate_batch(rows)) if errors == VALID]
+    else:
+        rows = [row for row in rows if len(row) == FIELD_COUNT]
+
+    rows = [[field.strip() for field in row] for row in rows]
+    return [hash_record(*row) for row in rows], rows, total - len(rows)
+
+
+def _skip_header(file):
+    # Leaves the file at the first data row, whether or not it starts with a header row
+    first_line = file.readline()
+    fields = next(csv.reader([first_line.decode(ENCODING)]), [])
+    if [field.strip().casefold() for field in fields] != [header.casefold() for header in CSV_HEADER]:
+        file.seek(0)
+
+
+def _hashed_prefix(store_file_name):
+    # Returns the size and checksum of the part of the store already in the hash set, or (0, 0)
+    # if it must be rebuilt. A store that shrank, changed without growing, or has any different
+    # bytes in the hashed part was edited or replaced outside the import.
+    try:
+        with open(store_file_name + HASH_META_SUFFIX, 'r') as file:
+            meta = json.load(file)
+        size, checksum = meta['size'], meta['checksum']
+        with open(store_file_name, 'rb') as store:
+            stat = os.fstat(store.fileno())
+            if stat.st_size == size:
+                unchanged = stat.st_mtime_ns == meta['mtime_ns']
+            else:
+                unchanged = prefix_unchanged(store, size, checksum)
+        if unchanged:
+            return size, checksum
+    except (OSError, ValueError, KeyError):
+        pass
+    return 0, 0
+
+
+def _save_hash_meta(store_file_name, hashed_size, checksum):
+    # Extends the checksum of the part of the store hashed before the import with the rows added since
+    with open(store_file_name, 'rb') as store:
+        stat = os.fstat(store.fileno())
+        checksum = prefix_checksum(store, stat.st_size, hashed_size, checksum)
+    with open(store_file_name + HASH_META_SUFFIX, 'w') as file:
+        json.dump({
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'checksum': checksum,
+        }, file)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+from main_m5 import read_csv_file
+from user_store import UserStore
+from bulk_import import hash_record, import_users, main, normalize_record
+
+
+class NormalizeTests(unittest.TestCase):
+    def test_normalize_record(self):
+        """Test that case, spacing and phone punctuation are ignored."""
+        self.assertEqual(normalize_record("  John   DOE ", "123 Main\tSt", "(555) 123-4567"),
+                         ("john doe", "123 main st", "5551234567"))
+        self.assertEqual(hash_record("John Doe", "123 Main St", "555-123-4567"),
+                         hash_record("john doe", " 123  MAIN st", "555 123 4567"))
+        self.assertNotEqual(hash_record("John Doe", "123 Main St", "555-123-4567"),
+                            hash_record("Jane Doe", "123 Main St", "555-123-4567"))
+
+
+class BulkImportTests(unittest.TestCase):
+    def setUp(self):
+        """Create a store with two users and a source file with duplicates."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self.test_dir.name, "users.csv")
+        self.source_path = os.path.join(self.test_dir.name, "import.csv")
+
+        with UserStore(self.store_path) as store:
+            store.append_row(["John Doe", "123 Main St", "555-123-4567"])
+            store.append_row(["Jane Doe", "456 Elm Ave", "555-765-4321"])
+
+        with open(self.source_path, 'w', newline='') as file:
+            file.write("Name,Address,Phone Number\n")
+            file.write("JOHN DOE,123  main st,(555) 123-4567\n")  # Already in the store
+            file.write('Jim Beam,"7 Oak Dr\nApt 2",555-000-1111\n')
+            file.write("jim beam,7 Oak Dr Apt 2,555-000-1111\n")  # Same as the row above
+            file.write("Bad Row,1 Pine St\n")
+            for i in range(200):
+                file.write(f"User {i % 150},{i % 150} Main St,555-123-{i % 150:04}\n")
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def test_import_drops_duplicates(self):
+        """Test that rows already in the store and repeated rows are dropped."""
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                store_path = os.path.join(self.test_dir.name, f"store_{workers}.csv")
+                with open(self.store_path, 'rb') as source, open(store_path, 'wb') as copy:
+                    copy.write(source.read())
+
+                stats = import_users(store_path, [self.source_path], workers=workers, chunk_bytes=64)
+
+                self.assertEqual(stats['rows'], 204)
+                self.assertEqual(stats['imported'], 151)
+                self.assertEqual(stats['duplicates'], 52)
+                self.assertEqual(stats['invalid'], 1)
+
+                rows = read_csv_file(store_path)
+                self.assertEqual(rows[0], ['Name', 'Address', 'Phone Number'])
+                self.assertEqual(len(rows), 1 + 2 + 151)
+                self.assertIn(['Jim Beam', '7 Oak Dr\nApt 2', '555-000-1111'], rows)
+
+    def test_second_import_finds_everything(self):
+        """Test that the hash set remembers the users across imports, including rows added in between."""
+        import_users(self.store_path, [self.source_path], workers=1)
+        with UserStore(self.store_path) as store:
+            store.append_row(["New User", "9 Elm St", "555-999-0000"])
+
+        with open(self.source_path, 'a', newline='') as file:
+            file.write("new user,9 Elm St,555-999-0000\n")
+
+        stats = import_users(self.store_path, [self.source_path], workers=1)
+        self.assertEqual(stats['imported'], 0)
+        self.assertEqual(stats['duplicates'], 204)
+
+    def test_store_rewritten_between_imports(self):
+        """Test that the hash set is rebuilt when the store is replaced."""
+        import_users(self.store_path, [self.source_path], workers=1)
+        os.remove(self.store_path)
+
+        stats = import_users(self.store_path, [self.source_path], workers=1)
+        self.assertEqual(stats['imported'], 152)
+
+    def test_store_replaced_by_larger_file(self):
+        """Test that the hash set is rebuilt when the store is replaced by a different, larger file."""
+        import_users(self.store_path, [self.source_path], workers=1)
+        size = os.path.getsize(self.store_path)
+
+        os.remove(self.store_path)
+        with UserStore(self.store_path) as store:
+            for i in range(size // 20):
+                store.append_row([f"Bob {i}", f"{i} Carol Ct", "555-222-3333"])
+        self.assertGreater(os.path.getsize(self.store_path), size)
+
+        returning_path = os.path.join(self.test_dir.name, "returning.csv")
+        with open(returning_path, 'w', newline='') as file:
+            file.write("John Doe,123 Main St,555-123-4567\n")
+
+        stats = import_users(self.store_path, [returning_path], workers=1)
+        self.assertEqual(stats['imported'], 1)
+
+    def test_store_edited_and_appended_between_imports(self):
+        """Test that the hash set is rebuilt when an earlier row was edited and rows were appended after it."""
+        with UserStore(self.store_path) as store:
+            for i in range(300):
+                store.append_row([f"Bob {i}", f"{i} Carol Ct", "555-222-3333"])
+        import_users(self.store_path, [self.source_path], workers=1)
+        with open(self.store_path, 'rb') as file:
+            data = file.read()
+        with open(self.store_path, 'wb') as file:
+            file.write(data.replace(b'John Doe', b'Jack Doe'))
+        with UserStore(self.store_path) as store:
+            store.append_row(["New User", "9 Elm St", "555-999-0000"])
+
+        returning_path = os.path.join(self.test_dir.name, "returning.csv")
+        with open(returning_path, 'w', newline='') as file:
+            file.write("John Doe,123 Main St,555-123-4567\n")
+            file.write("Jack Doe,123 Main St,555-123-4567\n")
+            file.write("New User,9 Elm St,555-999-0000\n")
+
+        stats = import_users(self.store_path, [returning_path], workers=1)
+        self.assertEqual(stats['imported'], 1)
+        self.assertEqual(stats['duplicates'], 2)
+        self.assertIn(['John Doe', '123 Main St', '555-123-4567'], read_csv_file(self.store_path))
+
+    def test_skip_invalid(self):
+        """Test that rows failing validation can be dropped as well."""
+        with open(self.source_path, 'a', newline='') as file:
+            file.write("No Phone,10 Main St,5551234567\n")
+
+        stats = import_users(self.store_path, [self.source_path], workers=1, skip_invalid=True)
+        self.assertEqual(stats['invalid'], 3)  # The short row, the (555) phone and the unformatted phone
+
+    def test_main_reports_stats(self):
+        """Test that the command reports rows per second and duplicates."""
+        errors = io.StringIO()
+        with redirect_stderr(errors):
+            exit_code = main([self.store_path, self.source_path, '--workers', '1'])
+
+        self.assertEqual(exit_code, 0)
+        self.assertIn("rows/s", errors.getvalue())
+        self.assertIn("dropped 52 duplicates", errors.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
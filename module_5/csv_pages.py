@@ -0,0 +1,275 @@
+import csv
+import json
+import os
+from collections import deque
+from itertools import islice
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_SAMPLE_ROWS = 1000
+COLUMN_PADDING = 4
+ENCODING = 'utf-8'
+INDEX_SUFFIX = '.pages.json'
+
+
+def iter_csv_records(file_name, start_offset=0):
+    """Reads a CSV file one row at a time, keeping track of where each row starts.
+
+    Only the current row is held in memory, however big the file is.
+
+    Args:
+        file_name (str): The name of the CSV file to read.
+        start_offset (int): The byte offset of the first row to read.
+
+    Yields:
+        tuple: (byte offset of the row, list of fields).
+    """
+    with open(file_name, 'rb') as file:
+        file.seek(start_offset)
+        position = [start_offset]
+
+        def lines():
+            for raw_line in file:
+                position[0] += len(raw_line)
+                yield raw_line.decode(ENCODING)
+
+        # The csv reader only pulls the lines of one row at a time, so the position
+        # before each row is where that row starts
+        csv_reader = csv.reader(lines())
+        while True:
+            row_start = position[0]
+            try:
+                row = next(csv_reader)
+            except StopIteration:
+                return
+            yield row_start, row
+
+
+def iter_csv_rows(file_name, start_offset=0):
+    """Reads a CSV file one row at a time. Yields each row as a list of fields."""
+    for _, row in iter_csv_records(file_name, start_offset):
+        yield row
+
+
+def iter_record_chunks(file, chunk_bytes):
+    """Reads a binary CSV file in chunks of roughly chunk_bytes that end on a record boundary.
+
+    Quotes in a CSV file always come in pairs, so a chunk with an odd number of quotes ends
+    inside a quoted field that continues on the next line. Such a chunk is extended line by
+    line until its quotes are balanced.
+
+    Args:
+        file: A file opened in binary mode, positioned at the start of a record.
+        chunk_bytes (int): The approximate size of each chunk.
+
+    Yields:
+        bytes: The next chunk of whole records.
+    """
+    while True:
+        lines = file.readlines(chunk_bytes)
+        if not lines:
+            return
+
+        chunk = b''.join(lines)
+        while chunk.count(b'"') % 2:
+            line = file.readline()
+            if not line:
+                break
+            chunk += line
+        yield chunk
+
+
+def map_chunks_in_order(executor, function, chunks, max_pending, *args):
+    """Calls a function on every chunk in a pool of workers and yields the results in order.
+
+    Like executor.map, but the next chunk is only read when fewer than max_pending chunks are
+    waiting, so memory use does not grow with the size of the file.
+
+    Args:
+        executor: The pool to submit the chunks to, or None to call the function in this process.
+        function: The worker task. It is called as function(chunk, *args).
+        chunks: The chunks, usually from iter_record_chunks.
+        max_pending (int): The number of chunks submitted ahead of the result being used.
+        *args: More arguments for every call of the function.
+
+    Yields:
+        The result for each chunk, in the order of the chunks.
+    """
+    if executor is None:
+        for chunk in chunks:
+            yield function(chunk, *args)
+        return
+
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(function, chunk, *args))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def build_page_index(file_name, page_size=DEFAULT_PAGE_SIZE):
+    """Scans a CSV file once and records where every page of data rows starts.
+
+    The column widths are measured during the same scan. The index is saved next to the
+    CSV file (file_name + '.pages.json') so later runs can skip the scan.
+
+    Returns:
+        dict: The page index, with the headers, the byte offset of every page and the column widths.
+    """
+    if page_size < 1:
+        raise ValueError("Page size must be at least 1.")
+
+    records = iter_csv_records(file_name)
+    headers = next(records, (0, []))[1]
+    widths = [len(header) for header in headers]
+    offsets = []
+    row_count = 0
+
+    for offset, row in records:
+        if row_count % page_size == 0:
+            offsets.append(offset)
+        row_count += 1
+        _update_widths(widths, row)
+
+    index = {
+        'page_size': page_size,
+        'headers': headers,
+        'offsets': offsets,
+        'widths': [width + COLUMN_PADDING for width in widths],
+        'rows': row_count,
+    }
+    index.update(_file_signature(file_name))
+
+    with open(file_name + INDEX_SUFFIX, 'w') as file:
+        json.dump(index, file)
+    return index
+
+
+def load_page_index(file_name, page_size=DEFAULT_PAGE_SIZE):
+    """Returns the saved page index, or builds a new one if the CSV file changed since it was saved."""
+    try:
+        with open(file_name + INDEX_SUFFIX, 'r') as file:
+            index = json.load(file)
+        if index['page_size'] == page_size and all(index[key] == value
+                                                   for key, value in _file_signature(file_name).items()):
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+
+    return build_page_index(file_name, page_size)
+
+
+def sample_column_widths(file_name, sample_rows=DEFAULT_SAMPLE_ROWS):
+    """Measures the column widths from the headers and the first sample_rows data rows only.
+
+    Returns:
+        tuple: (headers, column widths including padding).
+    """
+    rows = iter_csv_rows(file_name)
+    headers = next(rows, [])
+    widths = [len(header) for header in headers]
+    for row in islice(rows, sample_rows):
+        _update_widths(widths, row)
+
+    return headers, [width + COLUMN_PADDING for width in widths]
+
+
+def read_page(file_name, page_number, index):
+    """Reads one page of data rows by seeking straight to it.
+
+    Args:
+        file_name (str): The name of the CSV file to read.
+        page_number (int): The page to read, starting at 1.
+        index (dict): The page index from load_page_index.
+
+    Returns:
+        list: The data rows on the page.
+    """
+    page_count = len(index['offsets'])
+    if not 1 <= page_number <= page_count:
+        raise ValueError(f"Page {page_number} does not exist. The file has {page_count} pages.")
+
+    return list(islice(iter_csv_rows(file_name, index['offsets'][page_number - 1]), index['page_size']))
+
+
+def format_rows(rows, col_widths):
+    """Formats rows as fixed width lines, like display_csv_data does.
+
+    Fields past the last measured column are printed with no padding.
+    """
+    lines = []
+    for row in rows:
+        lines.append(''.join(f"{field:<{col_widths[i] if i < len(col_widths) else 0}}"
+                             for i, field in enumerate(row)))
+        lines.append('\n')
+    return ''.join(lines)
+
+
+def format_table_header(headers, col_widths):
+    """Formats the header line and the separator line."""
+    return format_rows([headers], col_widths) + '-' * sum(col_widths) + '\n'
+
+
+def display_csv_page(file_name, page_number, page_size=DEFAULT_PAGE_SIZE):
+    """Displays one page of a CSV file, using the saved page index to find it.
+
+    The column widths come from the index, so they fit every row in the file.
+    """
+    try:
+        index = load_page_index(file_name, page_size)
+        rows = read_page(file_name, page_number, index)
+
+        print(format_table_header(index['headers'], index['widths']), end='')
+        print(format_rows(rows, index['widths']), end='')
+        print(f"Page {page_number} of {len(index['offsets'])} ({index['rows']} records)")
+
+    except (OSError, ValueError) as e:
+        print(f"Error displaying data: {e}")
+
+
+def display_csv_pages(file_name, page_size=DEFAULT_PAGE_SIZE, sample_rows=DEFAULT_SAMPLE_ROWS):
+    """Displays a whole CSV file page by page with bounded memory.
+
+    The column widths are measured from the first sample_rows rows, so the file is only read once.
+    Longer fields later in the file are shown in full and push the rest of their row to the right.
+    """
+    try:
+        if not os.path.isfile(file_name):
+            print(f"Error: File '{file_name}' not found.")
+            return
+
+        headers, col_widths = sample_column_widths(file_name, sample_rows)
+        if not headers:
+            print("The file is empty.")
+            return
+
+        rows = iter_csv_rows(file_name)
+        next(rows)
+        page = list(islice(rows, page_size))
+        if not page:
+            print("No data records found in the file.")
+            return
+
+        print(format_table_header(headers, col_widths), end='')
+        while page:
+            print(format_rows(page, col_widths), end='')
+            page = list(islice(rows, page_size))
+
+    except (OSError, ValueError) as e:
+        print(f"Error displaying data: {e}")
+
+
+def _update_widths(widths, row):
+    for i, field in enumerate(row):
+        if i < len(widths):
+            if len(field) > widths[i]:
+                widths[i] = len(field)
+        else:
+            widths.append(len(field))
+
+
+def _file_signature(file_name):
+    stat = os.stat(file_name)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
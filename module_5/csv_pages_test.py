@@ -0,0 +1,118 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from main_m5 import User, read_csv_file, display_csv_data
+from user_store import UserStore
+from csv_pages import (
+    INDEX_SUFFIX,
+    iter_csv_records,
+    iter_csv_rows,
+    build_page_index,
+    load_page_index,
+    read_page,
+    sample_column_widths,
+    display_csv_page,
+    display_csv_pages,
+)
+
+
+class CsvPagesTests(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary CSV file with 23 users, one with an address over two lines."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_file_path = os.path.join(self.test_dir.name, "users.csv")
+        self.users = [User(f"User {i}", f"{i} Main St", "555-123-4567") for i in range(23)]
+        self.users[7].address = "7 Main St\nApt 2, Springfield"
+
+        with UserStore(self.test_file_path) as store:
+            store.extend(self.users)
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def test_iter_csv_rows_matches_read_csv_file(self):
+        """Test that streaming the file gives the same rows as reading it all at once."""
+        self.assertEqual(list(iter_csv_rows(self.test_file_path)), read_csv_file(self.test_file_path))
+
+    def test_record_offsets_point_at_rows(self):
+        """Test that reading from a recorded offset starts at that row."""
+        for offset, row in iter_csv_records(self.test_file_path):
+            with self.subTest(row=row):
+                self.assertEqual(next(iter_csv_rows(self.test_file_path, offset)), row)
+
+    def test_read_page_seeks_to_page(self):
+        """Test that every page holds the right rows, including the short last page."""
+        index = build_page_index(self.test_file_path, page_size=5)
+        rows = read_csv_file(self.test_file_path)[1:]
+
+        self.assertEqual(len(index['offsets']), 5)
+        self.assertEqual(index['rows'], 23)
+        for page_number in range(1, 6):
+            with self.subTest(page=page_number):
+                self.assertEqual(read_page(self.test_file_path, page_number, index),
+                                 rows[(page_number - 1) * 5:page_number * 5])
+
+        with self.assertRaises(ValueError):
+            read_page(self.test_file_path, 6, index)
+
+    def test_index_is_saved_and_rebuilt_when_file_changes(self):
+        """Test that the saved index is reused until the CSV file changes."""
+        build_page_index(self.test_file_path, page_size=5)
+        with open(self.test_file_path + INDEX_SUFFIX, 'r') as file:
+            saved = json.load(file)
+        self.assertEqual(load_page_index(self.test_file_path, page_size=5), saved)
+
+        with UserStore(self.test_file_path) as store:
+            store.append(User("A Much Longer User Name", "1 Main St", "555-123-4567"))
+
+        index = load_page_index(self.test_file_path, page_size=5)
+        self.assertEqual(index['rows'], 24)
+        self.assertEqual(index['widths'][0], len("A Much Longer User Name") + 4)
+
+    def test_sample_column_widths(self):
+        """Test that only the sampled rows are measured."""
+        headers, widths = sample_column_widths(self.test_file_path, sample_rows=1)
+        self.assertEqual(headers, ['Name', 'Address', 'Phone Number'])
+        self.assertEqual(widths, [len("User 0") + 4, len("0 Main St") + 4, len("Phone Number") + 4])
+
+    def test_display_csv_pages_matches_display_csv_data(self):
+        """Test that the paginated display prints the same table as display_csv_data."""
+        expected = io.StringIO()
+        with redirect_stdout(expected):
+            display_csv_data(read_csv_file(self.test_file_path))
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            display_csv_pages(self.test_file_path, page_size=4)
+
+        self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_display_csv_page(self):
+        """Test that a single page is printed with its page number."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            display_csv_page(self.test_file_path, 2, page_size=10)
+
+        lines = output.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith("Name"))
+        self.assertTrue(lines[2].startswith("User 10"))
+        self.assertEqual(lines[-1], "Page 2 of 3 (23 records)")
+
+    def test_display_missing_file(self):
+        """Test that a missing file prints an error instead of raising."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            display_csv_pages(os.path.join(self.test_dir.name, "missing.csv"))
+            display_csv_page(os.path.join(self.test_dir.name, "missing.csv"), 1)
+
+        self.assertIn("not found", output.getvalue())
+        self.assertIn("Error displaying data", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
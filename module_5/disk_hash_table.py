@@ -0,0 +1,170 @@
+import hashlib
+import mmap
+import os
+from array import array
+
+MAGIC = int.from_bytes(b'DISKHT1\0', 'little')  # Marks the file as a hash table
+HEADER_SLOTS = 3  # Magic number, capacity and count
+SLOT_BYTES = 8
+EMPTY_KEY = 0
+MAX_LOAD = 0.5
+DEFAULT_CAPACITY = 1024
+
+
+def key_hash(data):
+    """Hashes bytes or a string to a non-zero 64-bit key for a DiskHashTable."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    key = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'little')
+    return key or 1
+
+
+class DiskHashTable:
+    """A hash table of 64-bit keys and values stored in a memory-mapped file.
+
+    It uses open addressing with linear probing, so a lookup touches only a few slots of the file
+    however many entries it holds. The file doubles in size when it gets more than half full.
+
+    Keys must not be 0, which marks an empty slot. Use key_hash to turn strings into keys.
+    """
+
+    def __init__(self, file_name, capacity=DEFAULT_CAPACITY):
+        """
+        Args:
+            file_name (str): The file to store the table in. It is created if it does not exist.
+            capacity (int): The number of slots of a new table, rounded up to a power of two.
+        """
+        self.file_name = file_name
+        self._initial_capacity = _power_of_two(capacity)
+        self._file = None
+        self._map = None
+        self._slots = None
+
+    def open(self):
+        """Maps the table file into memory, creating an empty table if needed."""
+        if self._map is None:
+            if not os.path.exists(self.file_name) or os.path.getsize(self.file_name) == 0:
+                _create_table(self.file_name, self._initial_capacity)
+            self._map_file()
+        return self
+
+    @property
+    def capacity(self):
+        return self._slots[1]
+
+    def __len__(self):
+        return self._slots[2]
+
+    def put(self, key, value):
+        """Stores value under key, replacing the value the key had.
+
+        Returns:
+            bool: True if the key is new, False if it was already in the table.
+        """
+        if key == EMPTY_KEY:
+            raise ValueError("Key 0 is reserved for empty slots.")
+        if (len(self) + 1) > self.capacity * MAX_LOAD:
+            self._grow()
+
+        added = _insert(self._slots, key, value)
+        if added:
+            self._slots[2] += 1
+        return added
+
+    def get(self, key, default=None):
+        """Returns the value stored under key, or default if the key is not in the table."""
+        slots = self._slots
+        mask = slots[1] - 1
+        slot = key & mask
+
+        while True:
+            stored = slots[HEADER_SLOTS + 2 * slot]
+            if stored == key:
+                return slots[HEADER_SLOTS + 2 * slot + 1]
+            if stored == EMPTY_KEY:
+                return default
+            slot = (slot + 1) & mask
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def clear(self):
+        """Removes every entry and shrinks the file back to its initial capacity."""
+        self.close()
+        _create_table(self.file_name, self._initial_capacity)
+        self._map_file()
+
+    def flush(self):
+        """Writes changed pages back to the file."""
+        if self._map is not None:
+            self._map.flush()
+
+    def close(self):
+        """Unmaps and closes the table file."""
+        if self._map is None:
+            return
+
+        self._slots.release()
+        self._map.close()
+        self._file.close()
+        self._slots = None
+        self._map = None
+        self._file = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _map_file(self):
+        self._file = open(self.file_name, 'r+b')
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        self._slots = memoryview(self._map).cast('Q')
+        if self._slots[0] != MAGIC:
+            self.close()
+            raise ValueError(f"'{self.file_name}' is not a hash table file.")
+
+    def _grow(self):
+        # Rehash every entry into a table twice the size, then swap the files
+        temp_name = self.file_name + '.tmp'
+        _create_table(temp_name, self.capacity * 2)
+        with open(temp_name, 'r+b') as file, mmap.mmap(file.fileno(), 0) as mapped:
+            new_slots = memoryview(mapped).cast('Q')
+            old_slots = self._slots
+            for slot in range(self.capacity):
+                key = old_slots[HEADER_SLOTS + 2 * slot]
+                if key != EMPTY_KEY:
+                    _insert(new_slots, key, old_slots[HEADER_SLOTS + 2 * slot + 1])
+            new_slots[2] = len(self)
+            new_slots.release()
+
+        self.close()
+        os.replace(temp_name, self.file_name)
+        self._map_file()
+
+
+def _insert(slots, key, value):
+    # Returns True if the key took an empty slot
+    mask = slots[1] - 1
+    slot = key & mask
+    while True:
+        stored = slots[HEADER_SLOTS + 2 * slot]
+        if stored == key or stored == EMPTY_KEY:
+            slots[HEADER_SLOTS + 2 * slot] = key
+            slots[HEADER_SLOTS + 2 * slot + 1] = value
+            return stored == EMPTY_KEY
+        slot = (slot + 1) & mask
+
+
+def _create_table(file_name, capacity):
+    with open(file_name, 'wb') as file:
+        array('Q', [MAGIC, capacity, 0]).tofile(file)
+        file.truncate((HEADER_SLOTS + 2 * capacity) * SLOT_BYTES)
+
+
+def _power_of_two(n):
+    capacity = 1
+    while capacity < n:
+        capacity *= 2
+    return capacity
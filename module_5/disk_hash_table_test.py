@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from disk_hash_table import DiskHashTable, key_hash
+
+
+class DiskHashTableTests(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary directory for the table file."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.table_path = os.path.join(self.test_dir.name, "table.idx")
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def test_put_and_get(self):
+        """Test that the last value put under a key is returned."""
+        with DiskHashTable(self.table_path) as table:
+            self.assertTrue(table.put(key_hash("555-123-4567"), 10))
+            self.assertFalse(table.put(key_hash("555-123-4567"), 20))
+            table.put(key_hash("800-555-1212"), 30)
+
+            self.assertEqual(table.get(key_hash("555-123-4567")), 20)
+            self.assertEqual(table.get(key_hash("800-555-1212")), 30)
+            self.assertIsNone(table.get(key_hash("missing")))
+            self.assertEqual(table.get(key_hash("missing"), 0), 0)
+            self.assertIn(key_hash("800-555-1212"), table)
+            self.assertEqual(len(table), 2)
+
+    def test_table_grows_and_persists(self):
+        """Test that the table keeps every entry when it grows and after it is reopened."""
+        with DiskHashTable(self.table_path, capacity=4) as table:
+            for i in range(1000):
+                table.put(key_hash(str(i)), i)
+            self.assertGreaterEqual(table.capacity, 2000)
+
+        with DiskHashTable(self.table_path) as table:
+            self.assertEqual(len(table), 1000)
+            for i in range(1000):
+                self.assertEqual(table.get(key_hash(str(i))), i)
+
+    def test_clear(self):
+        """Test that clear removes every entry."""
+        with DiskHashTable(self.table_path) as table:
+            table.put(1, 2)
+            table.clear()
+            self.assertEqual(len(table), 0)
+            self.assertNotIn(1, table)
+
+    def test_invalid_key_and_file(self):
+        """Test that key 0 and files that are not tables are rejected."""
+        with DiskHashTable(self.table_path) as table:
+            with self.assertRaises(ValueError):
+                table.put(0, 1)
+
+        with open(self.table_path, 'wb') as file:
+            file.write(b'\1' * 64)
+        with self.assertRaises(ValueError):
+            DiskHashTable(self.table_path).open()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import zlib
+
+# Bytes read at a time while a checksum is calculated
+CHECKSUM_BLOCK_BYTES = 1024 * 1024
+
+
+def prefix_checksum(file, size, start=0, checksum=0):
+    """Calculates the CRC-32 checksum of the first size bytes of a file.
+
+    The checksum of a file that grew can be extended instead of calculated again: given the
+    checksum of the first start bytes, only the bytes from start to size are read.
+
+    Args:
+        file: A file opened in binary mode.
+        size (int): The number of bytes to checksum.
+        start (int): The number of bytes that checksum already covers.
+        checksum (int): The checksum of the first start bytes.
+
+    Returns:
+        int: The checksum of the first size bytes.
+    """
+    file.seek(start)
+    remaining = size - start
+    while remaining > 0:
+        block = file.read(min(remaining, CHECKSUM_BLOCK_BYTES))
+        if not block:
+            break
+        checksum = zlib.crc32(block, checksum)
+        remaining -= len(block)
+    return checksum
+
+
+def prefix_unchanged(file, size, checksum):
+    """Checks that the first size bytes of a file are still the bytes that were checksummed.
+
+    Every byte of the prefix is read, so an edit anywhere in it is found, even when rows were
+    appended after the edit.
+
+    Args:
+        file: A file opened in binary mode.
+        size (int): The number of bytes that were checksummed.
+        checksum (int): Their checksum (see prefix_checksum).
+
+    Returns:
+        bool: True if the file is at least size bytes long and its first size bytes have the checksum.
+    """
+    if os.fstat(file.fileno()).st_size < size:
+        return False
+    return prefix_checksum(file, size) == checksum
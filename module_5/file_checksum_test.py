@@ -0,0 +1,53 @@
+import os
+import tempfile
+import unittest
+import zlib
+from unittest.mock import patch
+
+from file_checksum import prefix_checksum, prefix_unchanged
+
+
+class FileChecksumTests(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary file of a few blocks."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_file_path = os.path.join(self.test_dir.name, "data.csv")
+        self.data = bytes(range(256)) * 40
+        with open(self.test_file_path, 'wb') as file:
+            file.write(self.data)
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def test_checksum_of_prefix_in_blocks(self):
+        """Test that the checksum read in blocks matches the checksum of the whole prefix."""
+        with open(self.test_file_path, 'rb') as file, patch('file_checksum.CHECKSUM_BLOCK_BYTES', 1000):
+            self.assertEqual(prefix_checksum(file, 5000), zlib.crc32(self.data[:5000]))
+            self.assertEqual(prefix_checksum(file, 0), 0)
+
+    def test_checksum_is_extended(self):
+        """Test that extending the checksum of a prefix gives the checksum of the longer prefix."""
+        with open(self.test_file_path, 'rb') as file:
+            first = prefix_checksum(file, 3000)
+            self.assertEqual(prefix_checksum(file, len(self.data), 3000, first), zlib.crc32(self.data))
+
+    def test_edit_anywhere_in_prefix_is_found(self):
+        """Test that an edit at the start is found after the file grew, and an append is not an edit."""
+        with open(self.test_file_path, 'rb') as file:
+            checksum = prefix_checksum(file, len(self.data))
+
+        with open(self.test_file_path, 'ab') as file:
+            file.write(b'appended')
+        with open(self.test_file_path, 'rb') as file:
+            self.assertTrue(prefix_unchanged(file, len(self.data), checksum))
+
+        with open(self.test_file_path, 'r+b') as file:
+            file.write(b'\xff')
+        with open(self.test_file_path, 'rb') as file:
+            self.assertFalse(prefix_unchanged(file, len(self.data), checksum))
+            self.assertFalse(prefix_unchanged(file, len(self.data) + 100, checksum))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import io
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+import pandas as pd
+
+from file_checksum import prefix_unchanged
+
+DEFAULT_PAGE_SIZE = 100
+
+# Files whose frames are kept. Loading another file drops the least recently loaded one.
+DEFAULT_MAX_FILES = 1
+
+
+class FrameCache:
+    """Caches the DataFrames of CSV files and updates them when the files grow.
+
+    A cached frame is returned as long as the file's size and modification time are unchanged.
+    When rows were appended, the checksum of the part already parsed is checked and only the
+    new bytes are parsed. The new rows are kept as separate parts until a whole frame is
+    needed, so appending does not copy the cached rows. Any other change to the file parses
+    it again from the start.
+
+    Only the frames of the max_files most recently loaded files are kept, so a long running
+    app that views many files does not hold all of them in memory.
+
+    Every column is read as strings, so phone numbers and addresses keep their exact text.
+    The returned frames are shared between callers and must not be modified.
+    """
+
+    def __init__(self, max_files=DEFAULT_MAX_FILES):
+        """
+        Args:
+            max_files (int): The number of files whose frames are kept.
+        """
+        if max_files < 1:
+            raise ValueError("The cache must keep at least 1 file.")
+
+        self.max_files = max_files
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, file_name):
+        """Returns the DataFrame of a CSV file, parsing as little of the file as possible.
+
+        Args:
+            file_name (str): The CSV file to load. Its first row holds the column names.
+
+        Returns:
+            DataFrame: The rows of the file.
+        """
+        with self._lock:
+            entry = self._update(file_name)
+            parts = entry['parts']
+            if len(parts) > 1:
+                parts[:] = [pd.concat(parts, ignore_index=True)]
+            return parts[0]
+
+    def page(self, file_name, page_number, page_size=DEFAULT_PAGE_SIZE):
+        """Returns one page of rows of a CSV file.
+
+        Only the rows on the page are copied, even if the file grew since it was last loaded.
+
+        Args:
+            file_name (str): The CSV file to load.
+            page_number (int): The page to return, starting at 1.
+            page_size (int): The number of rows on a page.
+
+        Returns:
+            DataFrame: The rows on the page. Empty if the page is past the end of the file.
+        """
+        if page_size < 1:
+            raise ValueError("Page size must be at least 1.")
+        if page_number < 1:
+            raise ValueError("Page number must be at least 1.")
+
+        start = (page_number - 1) * page_size
+        with self._lock:
+            parts = self._update(file_name)['parts']
+            if len(parts) == 1:
+                return parts[0].iloc[start:start + page_size]
+
+            pieces = []
+            first_row = 0
+            for part in parts:
+                piece = part.iloc[max(0, start - first_row):start + page_size - first_row]
+                if len(piece):
+                    pieces.append(piece)
+                first_row += len(part)
+
+        if not pieces:
+            return parts[0].iloc[0:0]
+        rows = pd.concat(pieces, ignore_index=True)
+        rows.index = pd.RangeIndex(start, start + len(rows))
+        return rows
+
+    def page_count(self, file_name, page_size=DEFAULT_PAGE_SIZE):
+        """Returns the number of pages of rows in a CSV file."""
+        with self._lock:
+            rows = self._update(file_name)['rows']
+        return -(-rows // page_size)
+
+    def clear(self):
+        """Forgets every cached frame."""
+        with self._lock:
+            self._entries.clear()
+
+    def _update(self, file_name):
+        # Brings the entry of a file up to date and makes it the most recently used one
+        key = os.path.abspath(file_name)
+        entry = self._entries.pop(key, None)
+        stat = os.stat(key)
+
+        if entry is None or (stat.st_size, stat.st_mtime_ns) != (entry['size'], entry['mtime_ns']):
+            with open(key, 'rb') as file:
+                if entry is not None and entry['appendable'] and \
+                        prefix_unchanged(file, entry['parsed_size'], entry['checksum']):
+                    entry = self._append(file, entry, stat)
+                else:
+                    entry = self._parse(file, stat)
+
+        self._entries[key] = entry
+        while len(self._entries) > self.max_files:
+            self._entries.popitem(last=False)
+        return entry
+
+    def _parse(self, file, stat):
+        file.seek(0)
+        data = file.read(stat.st_size)
+        frame = pd.read_csv(io.BytesIO(data), dtype=str)
+
+        # If the last row has no line break yet, the rest of it may still be written.
+        # Parse the whole file again next time instead of appending to a partial row.
+        return {
+            'parts': [frame],
+            'rows': len(frame),
+            'parsed_size': len(data),
+            'checksum': zlib.crc32(data),
+            'appendable': data.endswith(b'\n'),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+
+    def _append(self, file, entry, stat):
+        # Parse the appended rows with the column names of the cached frame
+        file.seek(entry['parsed_size'])
+        data = _complete_lines(file.read(stat.st_size - entry['parsed_size']))
+        parts = entry['parts']
+
+        if data.strip():
+            new_rows = pd.read_csv(io.BytesIO(data), header=None, names=list(parts[0].columns), dtype=str)
+            _add_part(parts, new_rows)
+            entry['rows'] += len(new_rows)
+
+        entry['parsed_size'] += len(data)
+        entry['checksum'] = zlib.crc32(data, entry['checksum'])
+        entry['size'] = stat.st_size
+        entry['mtime_ns'] = stat.st_mtime_ns
+        return entry
+
+
+def _add_part(parts, new_rows):
+    # Merge the newest parts while they are no bigger than the new rows. Each merge at least
+    # doubles the part the older rows are in, so many small appends copy each row only a few
+    # times instead of copying every cached row on every append.
+    while len(parts) > 1 and len(parts[-1]) <= len(new_rows):
+        new_rows = pd.concat([parts.pop(), new_rows], ignore_index=True)
+    parts.append(new_rows)
+
+
+def _complete_lines(data):
+    # A row that is still being written has no line break yet. It is parsed on the next load.
+    end = data.rfind(b'\n') + 1
+    return data[:end] if end else b''
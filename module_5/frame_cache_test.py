@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+try:
+    import pandas as pd
+    from frame_cache import FrameCache
+except ImportError:
+    pd = None
+
+from user_store import UserStore
+
+
+@unittest.skipIf(pd is None, "pandas is not installed")
+class FrameCacheTests(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary user CSV file."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_file_path = os.path.join(self.test_dir.name, "users.csv")
+        self.append_users(0, 10)
+        self.cache = FrameCache()
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def append_users(self, first, last):
+        with UserStore(self.test_file_path) as store:
+            for i in range(first, last):
+                store.append_row([f"User {i}", f"{i} Main St", f"555-123-{i:04}"])
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        """Test that the cached frame is returned while the file is unchanged."""
+        frame = self.cache.load(self.test_file_path)
+        self.assertEqual(list(frame.columns), ['Name', 'Address', 'Phone Number'])
+        self.assertEqual(len(frame), 10)
+
+        with patch('frame_cache.pd.read_csv') as read_csv:
+            self.assertIs(self.cache.load(self.test_file_path), frame)
+            read_csv.assert_not_called()
+
+    def test_only_appended_rows_are_parsed(self):
+        """Test that rows appended to the file are parsed and added to the cached frame."""
+        self.cache.load(self.test_file_path)
+        self.append_users(10, 15)
+
+        with patch('frame_cache.pd.read_csv', wraps=pd.read_csv) as read_csv:
+            frame = self.cache.load(self.test_file_path)
+            self.assertEqual(read_csv.call_count, 1)
+            self.assertEqual(read_csv.call_args.kwargs['header'], None)
+
+        expected = pd.read_csv(self.test_file_path, dtype=str)
+        pd.testing.assert_frame_equal(frame, expected)
+
+    def test_partial_row_waits_for_its_line_break(self):
+        """Test that a row without a line break yet is parsed once it is complete."""
+        self.cache.load(self.test_file_path)
+        with open(self.test_file_path, 'a', newline='') as file:
+            file.write("User 10,10 Main St,555-")
+        self.assertEqual(len(self.cache.load(self.test_file_path)), 10)
+
+        with open(self.test_file_path, 'a', newline='') as file:
+            file.write("123-0010\r\n")
+        frame = self.cache.load(self.test_file_path)
+        self.assertEqual(frame.iloc[-1].tolist(), ["User 10", "10 Main St", "555-123-0010"])
+
+    def test_rewritten_file_is_parsed_again(self):
+        """Test that a file changed in place is parsed from the start."""
+        self.cache.load(self.test_file_path)
+        os.remove(self.test_file_path)
+        self.append_users(100, 103)
+
+        frame = self.cache.load(self.test_file_path)
+        self.assertEqual(frame['Name'].tolist(), ["User 100", "User 101", "User 102"])
+
+    def test_edit_before_an_append_is_parsed_again(self):
+        """Test that an edit to an earlier row is found when rows were also appended."""
+        self.cache.load(self.test_file_path)
+        with open(self.test_file_path, 'rb') as file:
+            data = file.read()
+        with open(self.test_file_path, 'wb') as file:
+            file.write(data.replace(b'User 4', b'User X'))
+        self.append_users(10, 11)
+
+        frame = self.cache.load(self.test_file_path)
+        self.assertEqual(len(frame), 11)
+        self.assertEqual(frame['Name'][4], "User X")
+
+    def test_appended_rows_are_kept_in_parts_until_needed(self):
+        """Test that appends are not concatenated into the frame until a whole frame is loaded."""
+        first = self.cache.load(self.test_file_path)
+        with patch('frame_cache.pd.concat', wraps=pd.concat) as concat:
+            for i in range(10, 18):
+                self.append_users(i, i + 1)
+                self.assertEqual(self.cache.page_count(self.test_file_path, page_size=4), -(-(i + 1) // 4))
+            self.assertEqual(self.cache.page(self.test_file_path, 3, page_size=4)['Name'].tolist(),
+                             [f"User {i}" for i in range(8, 12)])
+            # Only the appended rows are merged, never the 10 rows parsed first
+            self.assertTrue(all(len(part) < 10 for call in concat.call_args_list for part in call.args[0]))
+
+        frame = self.cache.load(self.test_file_path)
+        pd.testing.assert_frame_equal(frame, pd.read_csv(self.test_file_path, dtype=str))
+        pd.testing.assert_frame_equal(self.cache.page(self.test_file_path, 3, page_size=4), frame.iloc[8:12])
+        self.assertEqual(len(first), 10)
+
+    def test_only_the_most_recent_files_are_kept(self):
+        """Test that loading another file drops the frame of the least recently loaded one."""
+        other_file_path = os.path.join(self.test_dir.name, "other.csv")
+        with UserStore(other_file_path) as store:
+            store.append_row(["Other", "1 Elm St", "555-000-0000"])
+
+        cache = FrameCache(max_files=1)
+        cache.load(self.test_file_path)
+        cache.load(other_file_path)
+        with patch('frame_cache.pd.read_csv', wraps=pd.read_csv) as read_csv:
+            cache.load(other_file_path)
+            read_csv.assert_not_called()
+            cache.load(self.test_file_path)
+            self.assertEqual(read_csv.call_count, 1)
+
+        with self.assertRaises(ValueError):
+            FrameCache(max_files=0)
+
+    def test_pages(self):
+        """Test that pages split the rows in order."""
+        self.assertEqual(self.cache.page_count(self.test_file_path, page_size=4), 3)
+        self.assertEqual(self.cache.page(self.test_file_path, 3, page_size=4)['Name'].tolist(),
+                         ["User 8", "User 9"])
+        self.assertTrue(self.cache.page(self.test_file_path, 4, page_size=4).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,17 @@
-import re
 import os
 import csv
+from user_store import CSV_HEADER, UserStore
+from storage import ColumnarWriter, is_columnar, read_users
+from validation import is_valid_address_format, is_valid_phone_format
+from csv_pages import display_csv_pages
 
 
 class User:
     # This class represents a user with a name, address, and phone number.
+    # __slots__ stores the three fields without a per-instance __dict__, which keeps
+    # millions of users in memory much smaller.
+    __slots__ = ('name', 'address', 'phone')
+
     def __init__(self, name, address, phone):
         self.name = name
         self.address = address
@@ -21,23 +28,30 @@ def main():
     # Prompt the user for the file name and ensure it has .csv extension
     file_name = get_filename()
     
-    # Loop to allow multiple data entries
-    continue_entry = True
-    while continue_entry:
-        # Get user input
-        user_information = get_input()
-
-        # Write the data to the CSV file
-        write_to_csv(file_name, user_information)
-        
-        # Ask if the user wants to enter another record
-        continue_entry = ask_continue()
+    # Keep one file handle open for the whole session.
+    # A batch size of 1 writes every record as soon as it is entered.
+    try:
+        with UserStore(file_name, batch_size=1) as store:
+            # Loop to allow multiple data entries
+            continue_entry = True
+            while continue_entry:
+                # Get user input
+                user_information = get_input()
+
+                # Write the data to the CSV file
+                store.append(user_information)
+                print(f"Data successfully written to {file_name}")
+
+                # Ask if the user wants to enter another record
+                continue_entry = ask_continue()
+    except OSError as e:
+        print(f"Error writing to file: {e}")
+        return
     
-    # After all entries are complete, read and display the file contents
+    # After all entries are complete, display the file contents page by page
+    # so large files are never loaded into memory all at once
     print("\nFile contents:")
-    rows = read_csv_file(file_name)
-    if rows:
-        display_csv_data(rows)
+    display_csv_pages(file_name)
 
 
 def ask_continue():
@@ -130,34 +144,6 @@ def get_address():
     return address
 
 
-def is_valid_address_format(address):
-    """Validates if the provided address matches basic address conventions. 
-    Without a proper address validation library, this is a simple check.
-    The address should contain at least one number followed by text.  
-
-    Args:
-        address (str): The address string to validate.
-        
-    Returns:
-        bool: True if the address follows basic conventions, False otherwise.
-    """
-    # Check minimum length
-    if len(address) < 5:
-        return False
-    
-    # Basic pattern: should contain at least one number followed by text
-    # This checks for a street number and name pattern
-    pattern = re.compile(r'\d+\s+\w+')
-    if not pattern.search(address):
-        return False
-    
-    # Should contain some letters (for street name)
-    if not re.search(r'[a-zA-Z]', address):
-        return False
-        
-    return True
-
-
 def get_phone_number():
     """Prompts the user for a phone number and validates its format.
 
@@ -182,37 +168,18 @@ def get_phone_number():
     return phone
 
 
-def is_valid_phone_format(phone):
-    """Validates if the provided phone number matches the required format.
-    
-    Args:
-        phone (str): The phone number string to validate.
-        
-    Returns:
-        bool: True if the phone number is in valid format, False otherwise.
-    """
-    # Regular expression pattern for XXX-XXX-XXXX format
-    pattern = re.compile(r'^\d{3}-\d{3}-\d{4}$')
-    return bool(pattern.match(phone))
-
-
 def write_to_csv(file_name, user_data):
-    """Writes user data to a CSV file with headers if the file doesn't exist."""
+    """Writes user data to a CSV file with headers if the file doesn't exist.
+
+    A file name ending in .cols is written in the columnar format of storage.py instead.
+    For many records, use a UserStore directly so the file is only opened once.
+    """
     try:
-        # Check if file exists to determine if headers need to be written
-        file_exists = os.path.isfile(file_name)
-        
-        # Open the file in append mode to add data without overwriting
-        with open(file_name, 'a', newline='') as file:
-            csv_writer = csv.writer(file)
-            
-            # Write headers if file is new
-            if not file_exists:
-                csv_writer.writerow(['Name', 'Address', 'Phone Number'])
-            
-            # Write the user data
-            csv_writer.writerow([user_data.name, user_data.address, user_data.phone])
-            
+        # The store writes the headers if the file is new
+        store = ColumnarWriter(file_name) if is_columnar(file_name) else UserStore(file_name, batch_size=1)
+        with store:
+            store.append(user_data)
+
         print(f"Data successfully written to {file_name}")
     except Exception as e:
         print(f"Error writing to file: {e}")
@@ -220,6 +187,9 @@ def write_to_csv(file_name, user_data):
 
 def read_csv_file(file_name):
     """Reads data from a CSV file.
+
+    The whole file is loaded into memory. For large files use csv_pages.iter_csv_rows instead.
+    A columnar (.cols) user file is read as the same rows, starting with the header row.
     
     Args:
         file_name (str): The name of the CSV file to read.
@@ -228,6 +198,16 @@ def read_csv_file(file_name):
         list: A list of rows from the CSV file or None if an error occurred.
     """
     try:
+        if is_columnar(file_name):
+            if not os.path.isdir(file_name):
+                print(f"Error: File '{file_name}' not found.")
+                return None
+            users = read_users(file_name)
+            if not users:
+                print("The file is empty.")
+                return None
+            return [list(CSV_HEADER)] + users
+
         # Check if the file exists
         if not os.path.isfile(file_name):
             print(f"Error: File '{file_name}' not found.")
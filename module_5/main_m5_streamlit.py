@@ -1,87 +1,45 @@
 import streamlit as st
-import re
 import os
-import csv
 import pandas as pd
-
-
-class User:
-    # This class represents a user with a name, address, and phone number.
-    def __init__(self, name, address, phone):
-        self.name = name
-        self.address = address
-        self.phone = phone
-
-    def __str__(self):
-        return f"{self.name}, {self.address}, {self.phone}"
-
-
-def is_valid_address_format(address):
-    """Validates if the provided address matches basic address conventions.
-    The address should contain at least one number followed by text.  
-
-    Args:
-        address (str): The address string to validate.
-        
-    Returns:
-        bool: True if the address follows basic conventions, False otherwise.
-    """
-    # Check minimum length
-    if len(address) < 5:
-        return False
-    
-    # Basic pattern: should contain at least one number followed by text
-    # This checks for a street number and name pattern
-    pattern = re.compile(r'\d+\s+\w+')
-    if not pattern.search(address):
-        return False
-    
-    # Should contain some letters (for street name)
-    if not re.search(r'[a-zA-Z]', address):
-        return False
-        
-    return True
-
-
-def is_valid_phone_format(phone):
-    """Validates if the provided phone number matches the required format.
-    
-    Args:
-        phone (str): The phone number string to validate.
-        
-    Returns:
-        bool: True if the phone number is in valid format, False otherwise.
-    """
-    # Regular expression pattern for XXX-XXX-XXXX format
-    pattern = re.compile(r'^\d{3}-\d{3}-\d{4}$')
-    return bool(pattern.match(phone))
+from main_m5 import User
+from frame_cache import FrameCache
+from storage import ColumnarWriter, is_columnar, read_columns
+from user_batch import UserBatch
+from user_store import UserStore
+from validation import is_valid_address_format, is_valid_phone_format, validate_record, describe_errors
 
 
 def write_to_csv(file_name, user_data):
     """Writes user data to a CSV file with headers if the file doesn't exist."""
     try:
-        # Check if file exists to determine if headers need to be written
-        file_exists = os.path.isfile(file_name)
-        
-        # Open the file in append mode to add data without overwriting
-        with open(file_name, 'a', newline='') as file:
-            csv_writer = csv.writer(file)
-            
-            # Write headers if file is new
-            if not file_exists:
-                csv_writer.writerow(['Name', 'Address', 'Phone Number'])
-            
-            # Write the user data
-            csv_writer.writerow([user_data.name, user_data.address, user_data.phone])
-            
+        # The store writes the headers if the file is new
+        store = ColumnarWriter(file_name) if is_columnar(file_name) else UserStore(file_name, batch_size=1)
+        with store:
+            store.append(user_data)
+
         return True
     except Exception as e:
         st.error(f"Error writing to file: {e}")
         return False
 
 
+# Rows per page to choose from when viewing a file
+PAGE_SIZES = [50, 100, 500, 1000]
+
+
+@st.cache_resource
+def get_frame_cache():
+    """Returns the frame cache shared by every session and rerun of the app."""
+    return FrameCache()
+
+
 def read_csv_file(file_name):
     """Reads data from a CSV file.
+
+    The parsed file is cached by path, size and modification time, so reruns do not read it
+    again, and rows appended since the last read are the only part that is parsed.
+    The returned DataFrame is shared and must not be modified.
+    A columnar (.cols) user file is read column by column into a UserBatch instead.
     
     Args:
         file_name (str): The name of the CSV file to read.
@@ -90,13 +48,20 @@ def read_csv_file(file_name):
         DataFrame: A pandas DataFrame with the CSV data or None if an error occurred.
     """
     try:
+        if is_columnar(file_name):
+            if not os.path.isdir(file_name):
+                st.warning(f"File '{file_name}' not found.")
+                return None
+            # Each column is decoded in one go, and the frame shares the batch's interned strings
+            return UserBatch(*read_columns(file_name).values()).to_dataframe()
+
         # Check if the file exists
         if not os.path.isfile(file_name):
             st.warning(f"File '{file_name}' not found.")
             return None
             
-        # Read the CSV into a pandas DataFrame
-        df = pd.read_csv(file_name)
+        # Read the CSV into a pandas DataFrame through the cache
+        df = get_frame_cache().load(file_name)
         return df
                 
     except Exception as e:
@@ -111,9 +76,9 @@ def main():
     st.write("This application collects user information and stores it in a CSV file.")
     st.write("You can also view the contents of existing CSV files.")
     
-    # File name input with .csv extension check
+    # File name input with .csv extension check. Columnar .cols files are kept as they are.
     file_name = st.text_input("Enter a file name:")
-    if file_name and not file_name.lower().endswith('.csv'):
+    if file_name and not file_name.lower().endswith('.csv') and not is_columnar(file_name):
         file_name += '.csv'
 
     # Create tabs for adding users and viewing data
@@ -142,17 +107,10 @@ def main():
             submit_button = st.form_submit_button("Save User Information")
             
             if submit_button:
-                # Validate all inputs
-                if not name:
-                    st.error("Name cannot be empty.")
-                elif not address:
-                    st.error("Address cannot be empty.")
-                elif not is_valid_address_format(address):
-                    st.error("Address format is invalid.")
-                elif not phone:
-                    st.error("Phone number cannot be empty.")
-                elif not is_valid_phone_format(phone):
-                    st.error("Phone number format is invalid.")
+                # Validate all inputs and show the first problem
+                errors = validate_record(name, address, phone)
+                if errors:
+                    st.error(describe_errors(errors)[0])
                 elif not file_name:
                     st.error("File name cannot be empty.")
                 else:
@@ -167,12 +125,16 @@ def main():
     with view_tab:
         st.subheader("View CSV Data")
         
-        # Button to display data from the current file
+        # Button to display data from the current file.
+        # The file stays open in the view across reruns so its pages can be browsed.
         if file_name:
             if st.button(f"View data from {file_name}"):
+                st.session_state['viewed_file'] = file_name
+
+            if st.session_state.get('viewed_file') == file_name:
                 df = read_csv_file(file_name)
                 if df is not None and not df.empty:
-                    st.dataframe(df, use_container_width=True)
+                    display_page(df)
                 elif df is not None and df.empty:
                     st.info("The file exists but contains no data.")
         else:
@@ -190,5 +152,18 @@ def main():
                 st.error(f"Error reading uploaded file: {e}")
 
 
+def display_page(df):
+    """Displays one page of a DataFrame. Only the rows on the page are sent to the browser."""
+    page_column, size_column = st.columns(2)
+    page_size = size_column.selectbox("Rows per page:", PAGE_SIZES, index=1)
+    page_count = -(-len(df) // page_size)
+    page = page_column.number_input("Page:", min_value=1, max_value=page_count, value=1, step=1)
+
+    start = (page - 1) * page_size
+    end = min(start + page_size, len(df))
+    st.dataframe(df.iloc[start:end], use_container_width=True)
+    st.caption(f"Showing rows {start + 1:,} to {end:,} of {len(df):,} (page {page} of {page_count})")
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
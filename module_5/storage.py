@@ -0,0 +1,390 @@
+import json
+import mmap
+import os
+from array import array
+
+from csv_pages import ENCODING, iter_csv_rows
+from user_store import CSV_HEADER, UserStore
+
+# A columnar user file is a directory ending in .cols. Each column is stored in two files:
+#   <column>.dat holds the UTF-8 values, each one followed by a NUL byte,
+#   <column>.off holds the byte offset where each value starts, plus the end of the last one,
+#                as unsigned 64-bit numbers.
+# The offsets give any single value without reading the others, and the NUL bytes let a whole
+# column be decoded and split in one go. meta.json holds the format version and the column names.
+COLUMNAR_SUFFIX = '.cols'
+FORMAT_VERSION = 1
+META_FILE = 'meta.json'
+SEPARATOR = b'\0'
+OFFSET_BYTES = 8
+WRITE_BUFFER_ROWS = 10_000
+
+# File names of the columns, in the same order as the CSV header
+COLUMNS = ('name', 'address', 'phone_number')
+COLUMN_FOR_HEADER = dict(zip(CSV_HEADER, COLUMNS))
+
+
+def is_columnar(file_name):
+    """Checks if a user file name uses the columnar format instead of CSV."""
+    return file_name.rstrip('/\\').lower().endswith(COLUMNAR_SUFFIX)
+
+
+def write_users(file_name, users):
+    """Appends users to a user file in the format its name calls for (.csv or .cols).
+
+    Args:
+        file_name (str): The user file to append to. It is created if it does not exist.
+        users (iterable): Users, or anything with name, address and phone attributes.
+    """
+    store = ColumnarWriter(file_name) if is_columnar(file_name) else UserStore(file_name)
+    with store:
+        store.extend(users)
+
+
+def read_columns(file_name, columns=None):
+    """Reads whole columns of a user file in either format.
+
+    Args:
+        file_name (str): The .csv or .cols user file to read.
+        columns (list): The columns to read, from COLUMNS. Defaults to every column.
+            A columnar file only reads the files of these columns.
+
+    Returns:
+        dict: The values of each requested column, as lists of strings.
+    """
+    columns = _check_columns(columns)
+
+    if is_columnar(file_name):
+        with ColumnarReader(file_name, columns) as reader:
+            return {column: reader.column(column) for column in columns}
+
+    values = {column: [] for column in columns}
+    positions = [COLUMNS.index(column) for column in columns]
+    rows = iter_csv_rows(file_name)
+    next(rows, None)
+    for row in rows:
+        for column, position in zip(columns, positions):
+            values[column].append(row[position] if position < len(row) else '')
+    return values
+
+
+def read_users(file_name, columns=None):
+    """Reads the rows of a user file in either format, without the header row.
+
+    Args:
+        file_name (str): The .csv or .cols user file to read.
+        columns (list): The columns of each row, from COLUMNS. Defaults to every column.
+
+    Returns:
+        list: The rows, as lists of strings in the order of columns.
+    """
+    values = read_columns(file_name, columns)
+    return list(map(list, zip(*values.values())))
+
+
+def convert_csv_to_columnar(csv_file_name, columnar_file_name):
+    """Converts a user CSV file to a new columnar user file, one row at a time.
+
+    Returns:
+        int: The number of rows converted.
+    """
+    if os.path.exists(columnar_file_name):
+        raise ValueError(f"'{columnar_file_name}' already exists.")
+
+    rows = iter_csv_rows(csv_file_name)
+    next(rows, None)
+    with ColumnarWriter(columnar_file_name) as writer:
+        for row in rows:
+            writer.append_row(row)
+        return writer.rows_written
+
+
+class ColumnarWriter:
+    """Appends users to a columnar user file.
+
+    It has the same append methods as UserStore, so either can be used to write users:
+
+        with ColumnarWriter("users.cols") as writer:
+            writer.append(user)
+    """
+
+    def __init__(self, file_name):
+        """
+        Args:
+            file_name (str): The columnar user directory to append to. It is created if needed.
+        """
+        self.file_name = file_name
+        self.rows_written = 0
+        self._data_files = None
+        self._offset_files = None
+        self._ends = None
+        self._pending_values = None
+        self._pending_offsets = None
+
+    def open(self):
+        """Opens the column files for appending, creating the directory if it is new."""
+        if self._data_files is not None:
+            return self
+
+        os.makedirs(self.file_name, exist_ok=True)
+        meta_path = os.path.join(self.file_name, META_FILE)
+        if not os.path.exists(meta_path):
+            with open(meta_path, 'w') as file:
+                json.dump({'version': FORMAT_VERSION, 'columns': list(COLUMNS)}, file)
+        else:
+            _read_meta(self.file_name)
+            _drop_partial_rows(self.file_name)
+
+        self._data_files = []
+        self._offset_files = []
+        self._ends = []
+        for column in COLUMNS:
+            data_file = open(_data_path(self.file_name, column), 'ab')
+            offset_file = open(_offset_path(self.file_name, column), 'ab')
+            if offset_file.tell() == 0:
+                array('Q', [0]).tofile(offset_file)
+            self._data_files.append(data_file)
+            self._offset_files.append(offset_file)
+            self._ends.append(data_file.tell())
+
+        self._pending_values = [[] for _ in COLUMNS]
+        self._pending_offsets = [array('Q') for _ in COLUMNS]
+        return self
+
+    def append(self, user):
+        """Adds one user. Anything with name, address and phone attributes can be stored."""
+        self.append_row([user.name, user.address, user.phone])
+
+    def append_row(self, row):
+        """Adds one [name, address, phone] row."""
+        if self._data_files is None:
+            self.open()
+        if len(row) != len(COLUMNS):
+            raise ValueError(f"A row must have {len(COLUMNS)} fields.")
+
+        encoded = [value.encode(ENCODING) for value in row]
+        if any(SEPARATOR in data for data in encoded):
+            raise ValueError("Values cannot contain NUL characters.")
+
+        for i, data in enumerate(encoded):
+            self._pending_values[i].append(data + SEPARATOR)
+            self._ends[i] += len(data) + 1
+            self._pending_offsets[i].append(self._ends[i])
+
+        self.rows_written += 1
+        if len(self._pending_offsets[0]) >= WRITE_BUFFER_ROWS:
+            self.flush()
+
+    def extend(self, users):
+        """Adds many users."""
+        for user in users:
+            self.append(user)
+
+    def flush(self):
+        """Writes the buffered rows to the column files."""
+        if self._data_files is None:
+            return
+
+        # The values are written before their offsets, so a reader never sees an offset past the data
+        for i in range(len(COLUMNS)):
+            self._data_files[i].write(b''.join(self._pending_values[i]))
+            self._data_files[i].flush()
+        for i in range(len(COLUMNS)):
+            self._pending_offsets[i].tofile(self._offset_files[i])
+            self._offset_files[i].flush()
+            self._pending_values[i] = []
+            self._pending_offsets[i] = array('Q')
+
+    def close(self):
+        """Writes the remaining rows and closes the column files."""
+        if self._data_files is None:
+            return
+
+        try:
+            self.flush()
+        finally:
+            for file in self._data_files + self._offset_files:
+                file.close()
+            self._data_files = None
+            self._offset_files = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class ColumnarReader:
+    """Reads a columnar user file through memory maps.
+
+    Only the files of the requested columns are opened, and only the pages that are used are
+    read from disk, so reading one value or one column of a large file is cheap.
+
+        with ColumnarReader("users.cols", ['phone_number']) as reader:
+            phones = reader.column('phone_number')
+    """
+
+    def __init__(self, file_name, columns=None):
+        """
+        Args:
+            file_name (str): The columnar user directory to read.
+            columns (list): The columns to open, from COLUMNS. Defaults to every column.
+        """
+        self.file_name = file_name
+        self.columns = _check_columns(columns)
+        self._maps = None
+        self._offsets = None
+        self._rows = 0
+
+    def open(self):
+        """Maps the files of the requested columns into memory."""
+        if self._maps is not None:
+            return self
+
+        _read_meta(self.file_name)
+        self._maps = {}
+        self._offsets = {}
+        rows = None
+        for column in self.columns:
+            offsets = _map_file(_offset_path(self.file_name, column))
+            if offsets is None:
+                self._offsets[column] = memoryview(array('Q', [0]))
+            else:
+                # Ignore a partly written offset at the end
+                self._offsets[column] = memoryview(offsets)[:len(offsets) - len(offsets) % OFFSET_BYTES].cast('Q')
+            self._maps[column] = (offsets, _map_file(_data_path(self.file_name, column)))
+
+            # A writer that was stopped part way may have written more of some columns than others
+            column_rows = len(self._offsets[column]) - 1
+            rows = column_rows if rows is None else min(rows, column_rows)
+
+        self._rows = rows or 0
+        return self
+
+    def __len__(self):
+        return self._rows
+
+    def value(self, column, i):
+        """Returns the value of column in row i."""
+        if not 0 <= i < self._rows:
+            raise IndexError("Row index out of range.")
+        offsets = self._offsets[column]
+        data = self._maps[column][1]
+        return data[offsets[i]:offsets[i + 1] - 1].decode(ENCODING)
+
+    def row(self, i):
+        """Returns row i as a list of the requested columns."""
+        return [self.value(column, i) for column in self.columns]
+
+    def column(self, column):
+        """Returns every value of a column as a list of strings.
+
+        The column is decoded in one go and split on its separators.
+        """
+        if self._rows == 0:
+            return []
+        data = self._maps[column][1]
+        end = self._offsets[column][self._rows]
+        return data[:end - 1].decode(ENCODING).split(SEPARATOR.decode(ENCODING))
+
+    def close(self):
+        """Unmaps and closes the column files."""
+        if self._maps is None:
+            return
+
+        for view in self._offsets.values():
+            view.release()
+        for offsets, data in self._maps.values():
+            for mapped in (offsets, data):
+                if mapped is not None:
+                    mapped.close()
+        self._maps = None
+        self._offsets = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _check_columns(columns):
+    if columns is None:
+        return list(COLUMNS)
+
+    columns = [COLUMN_FOR_HEADER.get(column, column) for column in columns]
+    for column in columns:
+        if column not in COLUMNS:
+            raise ValueError(f"Unknown column '{column}'. Use one of: {', '.join(COLUMNS)}.")
+    return columns
+
+
+def _read_meta(file_name):
+    with open(os.path.join(file_name, META_FILE), 'r') as file:
+        meta = json.load(file)
+    if meta.get('version') != FORMAT_VERSION or meta.get('columns') != list(COLUMNS):
+        raise ValueError(f"'{file_name}' is not a columnar user file this version can read.")
+    return meta
+
+
+def _drop_partial_rows(file_name):
+    # A writer that was stopped part way can leave columns with different numbers of rows,
+    # a partly written offset, or values without an offset. Cut every column back to the rows
+    # that are complete in all of them, so new rows are appended in line.
+    counts = {column: _complete_offsets(file_name, column) for column in COLUMNS}
+    rows = max(min(counts.values()) - 1, 0)
+
+    for column in COLUMNS:
+        offset_path = _offset_path(file_name, column)
+        data_path = _data_path(file_name, column)
+        if counts[column] == 0:
+            offsets_size, data_size = 0, 0
+        else:
+            offsets_size = (rows + 1) * OFFSET_BYTES
+            with open(offset_path, 'rb') as file:
+                data_size = _read_offset(file, rows)
+        for path, size in ((offset_path, offsets_size), (data_path, data_size)):
+            if os.path.exists(path) and os.path.getsize(path) != size:
+                os.truncate(path, size)
+
+
+def _complete_offsets(file_name, column):
+    # Returns how many whole offsets of a column point inside its data file.
+    # The offsets only grow, so the first one past the end of the data is found by bisection.
+    offset_path = _offset_path(file_name, column)
+    data_path = _data_path(file_name, column)
+    if not os.path.exists(offset_path):
+        return 0
+
+    data_size = os.path.getsize(data_path) if os.path.exists(data_path) else 0
+    low, high = 0, os.path.getsize(offset_path) // OFFSET_BYTES
+    with open(offset_path, 'rb') as file:
+        while low < high:
+            middle = (low + high) // 2
+            if _read_offset(file, middle) <= data_size:
+                low = middle + 1
+            else:
+                high = middle
+    return low
+
+
+def _read_offset(file, i):
+    file.seek(i * OFFSET_BYTES)
+    return array('Q', file.read(OFFSET_BYTES))[0]
+
+
+def _map_file(path):
+    # Returns a read only memory map of the file, or None if the file is empty
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _data_path(file_name, column):
+    return os.path.join(file_name, column + '.dat')
+
+
+def _offset_path(file_name, column):
+    return os.path.join(file_name, column + '.off')
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+
+from main_m5 import User, read_csv_file, write_to_csv
+from user_store import UserStore
+from storage import (
+    ColumnarReader,
+    ColumnarWriter,
+    convert_csv_to_columnar,
+    is_columnar,
+    read_columns,
+    read_users,
+    write_users,
+)
+
+
+class StorageTests(unittest.TestCase):
+    def setUp(self):
+        """Create some users, including one with a multi-line address and accented letters."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.test_dir.name, "users.csv")
+        self.columnar_path = os.path.join(self.test_dir.name, "users.cols")
+        self.users = [User(f"User {i}", f"{i} Main St", f"555-123-{i:04}") for i in range(50)]
+        self.users[3] = User("José Núñez", "3 Calle Mayor\nPiso 2", "555-123-0003")
+        self.users[4] = User("", "", "")
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def rows(self):
+        return [[user.name, user.address, user.phone] for user in self.users]
+
+    def test_is_columnar(self):
+        """Test that the format is picked by the file name."""
+        self.assertTrue(is_columnar("users.cols"))
+        self.assertTrue(is_columnar("users.COLS/"))
+        self.assertFalse(is_columnar("users.csv"))
+
+    def test_both_formats_read_the_same(self):
+        """Test that write_users and read_users round trip in both formats."""
+        for path in (self.csv_path, self.columnar_path):
+            with self.subTest(path=path):
+                write_users(path, self.users[:20])
+                write_users(path, self.users[20:])
+                self.assertEqual(read_users(path), self.rows())
+
+    def test_column_projection(self):
+        """Test that only the requested columns are returned, in the requested order."""
+        write_users(self.columnar_path, self.users)
+        write_users(self.csv_path, self.users)
+
+        for path in (self.csv_path, self.columnar_path):
+            with self.subTest(path=path):
+                self.assertEqual(read_columns(path, ['phone_number']),
+                                 {'phone_number': [user.phone for user in self.users]})
+                self.assertEqual(read_users(path, ['Phone Number', 'name'])[3], ["555-123-0003", "José Núñez"])
+
+        with self.assertRaises(ValueError):
+            read_columns(self.columnar_path, ['email'])
+
+    def test_reader_random_access(self):
+        """Test that single values are read straight from the memory maps."""
+        write_users(self.columnar_path, self.users)
+
+        with ColumnarReader(self.columnar_path, ['name', 'address']) as reader:
+            self.assertEqual(len(reader), 50)
+            self.assertEqual(reader.value('address', 3), "3 Calle Mayor\nPiso 2")
+            self.assertEqual(reader.row(49), ["User 49", "49 Main St"])
+            self.assertEqual(reader.value('name', 4), "")
+            with self.assertRaises(IndexError):
+                reader.value('name', 50)
+
+    def test_empty_file(self):
+        """Test that a columnar file without rows reads as empty."""
+        with ColumnarWriter(self.columnar_path):
+            pass
+        self.assertEqual(read_users(self.columnar_path), [])
+
+    def test_invalid_rows(self):
+        """Test that rows the format cannot hold are rejected."""
+        with ColumnarWriter(self.columnar_path) as writer:
+            with self.assertRaises(ValueError):
+                writer.append_row(["Name", "Address"])
+            with self.assertRaises(ValueError):
+                writer.append_row(["Na\0me", "1 Main St", "555-123-4567"])
+
+    def test_append_after_partial_write(self):
+        """Test that rows appended after an interrupted write line up in every column."""
+        write_users(self.columnar_path, self.users[:3])
+
+        # Leave a value without an offset in one column and half an offset in another
+        with open(os.path.join(self.columnar_path, 'name.dat'), 'ab') as file:
+            file.write(b'Lost\0')
+        with open(os.path.join(self.columnar_path, 'address.dat'), 'ab') as file:
+            file.write(b'Lost\0')
+        with open(os.path.join(self.columnar_path, 'address.off'), 'ab') as file:
+            file.write(b'\1\2\3')
+        # And a whole row in the last column only
+        with ColumnarReader(self.columnar_path) as reader:
+            self.assertEqual(len(reader), 3)
+        with open(os.path.join(self.columnar_path, 'phone_number.dat'), 'ab') as file:
+            file.write(b'555-000-0000\0')
+        with open(os.path.join(self.columnar_path, 'phone_number.off'), 'ab') as file:
+            file.write((os.path.getsize(file.name.replace('.off', '.dat'))).to_bytes(8, 'little'))
+
+        write_users(self.columnar_path, self.users[3:6])
+        self.assertEqual(read_users(self.columnar_path), self.rows()[:6])
+
+    def test_user_file_functions_use_the_columnar_format(self):
+        """Test that write_to_csv and read_csv_file pick the columnar format for .cols files."""
+        self.assertIsNone(read_csv_file(self.columnar_path))
+        for user in self.users[:3]:
+            write_to_csv(self.columnar_path, user)
+
+        self.assertTrue(os.path.isdir(self.columnar_path))
+        self.assertEqual(read_csv_file(self.columnar_path), [['Name', 'Address', 'Phone Number']] + self.rows()[:3])
+
+    def test_convert_csv_to_columnar(self):
+        """Test that a CSV file converts to a columnar file with the same rows."""
+        with UserStore(self.csv_path) as store:
+            store.extend(self.users)
+
+        self.assertEqual(convert_csv_to_columnar(self.csv_path, self.columnar_path), 50)
+        self.assertEqual(read_users(self.columnar_path), read_csv_file(self.csv_path)[1:])
+
+        with self.assertRaises(ValueError):
+            convert_csv_to_columnar(self.csv_path, self.columnar_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import sys
+
+from csv_pages import iter_csv_rows
+from main_m5 import User
+from user_store import CSV_HEADER
+
+
+class UserBatch:
+    """Holds many users as three parallel columns instead of one object per user.
+
+    Every string is interned with sys.intern, so a name, address or phone number that appears
+    many times is stored once and the columns only hold references to it.
+
+        batch = UserBatch.from_csv("users.csv")
+        frame = batch.to_dataframe()
+    """
+
+    __slots__ = ('names', 'addresses', 'phones')
+
+    def __init__(self, names=(), addresses=(), phones=()):
+        """
+        Args:
+            names (iterable): The names of the users.
+            addresses (iterable): The addresses, in the same order as the names.
+            phones (iterable): The phone numbers, in the same order as the names.
+        """
+        self.names = [sys.intern(name) for name in names]
+        self.addresses = [sys.intern(address) for address in addresses]
+        self.phones = [sys.intern(phone) for phone in phones]
+        if not len(self.names) == len(self.addresses) == len(self.phones):
+            raise ValueError("The names, addresses and phones must have the same length.")
+
+    @classmethod
+    def from_users(cls, users):
+        """Creates a batch from User objects, or anything with name, address and phone attributes."""
+        batch = cls()
+        batch.extend(users)
+        return batch
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Creates a batch from [name, address, phone] rows."""
+        batch = cls()
+        for name, address, phone in rows:
+            batch.append_row(name, address, phone)
+        return batch
+
+    @classmethod
+    def from_csv(cls, file_name):
+        """Reads a user CSV file, one row at a time, into a batch. The header row is skipped."""
+        rows = iter_csv_rows(file_name)
+        next(rows, None)
+        return cls.from_rows(rows)
+
+    def append(self, user):
+        """Adds one user."""
+        self.append_row(user.name, user.address, user.phone)
+
+    def append_row(self, name, address, phone):
+        """Adds one user from its fields."""
+        self.names.append(sys.intern(name))
+        self.addresses.append(sys.intern(address))
+        self.phones.append(sys.intern(phone))
+
+    def extend(self, users):
+        """Adds many users."""
+        for user in users:
+            self.append(user)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, i):
+        """Returns the user at position i as a User object."""
+        return User(self.names[i], self.addresses[i], self.phones[i])
+
+    def __iter__(self):
+        """Yields the users as User objects, created one at a time."""
+        for name, address, phone in zip(self.names, self.addresses, self.phones):
+            yield User(name, address, phone)
+
+    def to_dataframe(self):
+        """Returns the batch as a pandas DataFrame with the CSV column names.
+
+        The DataFrame shares the string objects with the batch, so no string is copied. pandas
+        still builds one array of references per column, because it cannot use a Python list
+        as a column directly.
+
+        Returns:
+            DataFrame: A DataFrame with the Name, Address and Phone Number columns.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(dict(zip(CSV_HEADER, (self.names, self.addresses, self.phones))), copy=False)
@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+from main_m5 import User
+from user_store import UserStore
+from user_batch import UserBatch
+from storage import read_columns, write_users
+
+
+class UserTests(unittest.TestCase):
+    def test_user_has_no_instance_dict(self):
+        """Test that User stores its fields in slots."""
+        user = User("John Doe", "123 Main St", "555-123-4567")
+        self.assertFalse(hasattr(user, '__dict__'))
+        with self.assertRaises(AttributeError):
+            user.email = "john@example.com"
+
+
+class UserBatchTests(unittest.TestCase):
+    def setUp(self):
+        """Create some users that share addresses and phone numbers."""
+        self.users = [User(f"User {i}", f"{i % 3} Main St", "555-123-4567") for i in range(10)]
+
+    def test_from_users_round_trip(self):
+        """Test that users come back out of the batch unchanged."""
+        batch = UserBatch.from_users(self.users)
+        self.assertEqual(len(batch), 10)
+        self.assertEqual([str(user) for user in batch], [str(user) for user in self.users])
+        self.assertEqual(str(batch[4]), "User 4, 1 Main St, 555-123-4567")
+
+    def test_strings_are_interned(self):
+        """Test that equal strings are stored once."""
+        batch = UserBatch.from_rows([["A", "".join(["1 Main", " St"]), "555-123-4567"],
+                                     ["B", "".join(["1 Ma", "in St"]), "555-123-4567"]])
+        self.assertIs(batch.addresses[0], batch.addresses[1])
+
+    def test_columns_must_match(self):
+        """Test that columns of different lengths are rejected."""
+        with self.assertRaises(ValueError):
+            UserBatch(["A"], ["1 Main St"], [])
+
+    def test_from_csv(self):
+        """Test that a batch can be read from a user CSV file."""
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, "users.csv")
+            with UserStore(file_name) as store:
+                store.extend(self.users)
+
+            batch = UserBatch.from_csv(file_name)
+
+        self.assertEqual(batch.names, [user.name for user in self.users])
+        self.assertEqual(batch.phones, ["555-123-4567"] * 10)
+
+    def test_to_dataframe(self):
+        """Test that the DataFrame has the CSV columns and shares the strings."""
+        try:
+            import pandas
+        except ImportError:
+            self.skipTest("pandas is not installed")
+
+        batch = UserBatch.from_users(self.users)
+        frame = batch.to_dataframe()
+        self.assertEqual(list(frame.columns), ['Name', 'Address', 'Phone Number'])
+        self.assertEqual(len(frame), 10)
+        self.assertIs(frame['Name'].iloc[3], batch.names[3])
+
+    def test_dataframe_of_columnar_file(self):
+        """Test that the columns of a columnar file make the same DataFrame as the CSV file."""
+        try:
+            import pandas
+        except ImportError:
+            self.skipTest("pandas is not installed")
+
+        with tempfile.TemporaryDirectory() as test_dir:
+            csv_path = os.path.join(test_dir, "users.csv")
+            columnar_path = os.path.join(test_dir, "users.cols")
+            write_users(csv_path, self.users)
+            write_users(columnar_path, self.users)
+
+            frame = UserBatch(*read_columns(columnar_path).values()).to_dataframe()
+            pandas.testing.assert_frame_equal(frame, pandas.read_csv(csv_path, dtype=str), check_dtype=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,346 @@
+import csv
+import json
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+
+from csv_pages import ENCODING, iter_csv_records
+from disk_hash_table import DiskHashTable, key_hash
+from file_checksum import prefix_checksum, prefix_unchanged
+
+PHONE_INDEX_SUFFIX = '.phone.idx'
+PHONE_CHAIN_SUFFIX = '.chain.idx'
+NAME_INDEX_SUFFIX = '.names.idx'
+NAME_LOG_SUFFIX = '.names.log'
+META_SUFFIX = '.idx.json'
+
+# Names appended since the last merge are kept in a small unsorted log.
+# Once it holds this many entries it is merged into the sorted name index.
+DEFAULT_MERGE_THRESHOLD = 1024
+
+NAME_COLUMN = 0
+PHONE_COLUMN = 2
+
+NON_DIGITS_PATTERN = re.compile(r'\D+')
+
+
+class UserIndex:
+    """Indexes a user CSV file by phone number and by name.
+
+    The indexes are kept in files next to the CSV file:
+        - a hash index from phone number to the offset of the last row with it (file_name + '.phone.idx'),
+        - a hash index from each row offset to the previous row with the same phone (file_name + '.chain.idx'),
+        - the row offsets sorted by name (file_name + '.names.idx'),
+        - the offsets of rows added since the last merge (file_name + '.names.log'),
+        - the size and a checksum of the part of the CSV file that is indexed (file_name + '.idx.json').
+
+    The index files are memory-mapped, so opening an index does not read it. refresh() indexes
+    only the rows appended since the last refresh. Before it does, the checksum of the whole
+    indexed part is checked, and if any of it was edited the indexes are rebuilt from scratch,
+    even when rows were also appended. A file whose size and modification time are unchanged
+    is not read at all.
+
+        with UserIndex("users.csv") as index:
+            rows = index.find_by_phone("555-123-4567")
+    """
+
+    def __init__(self, file_name, merge_threshold=DEFAULT_MERGE_THRESHOLD):
+        """
+        Args:
+            file_name (str): The user CSV file to index.
+            merge_threshold (int): The number of appended names kept unsorted before they are merged.
+        """
+        self.file_name = file_name
+        self.merge_threshold = merge_threshold
+        self.indexed_size = 0
+        self.rows_indexed = 0
+        self._indexed_mtime_ns = None
+        self._checksum = 0
+        self._phones = DiskHashTable(file_name + PHONE_INDEX_SUFFIX)
+        self._phone_chain = DiskHashTable(file_name + PHONE_CHAIN_SUFFIX)
+        self._name_log = array('Q')
+        self._log_names = []
+        self._names_file = None
+        self._names_map = None
+        self._names = None
+        self._csv_file = None
+        self._csv_map = None
+
+    def open(self):
+        """Opens the index files and brings them up to date with the CSV file."""
+        if self._csv_file is None:
+            # Create the CSV file if needed, so an index can be opened before the first row is written
+            open(self.file_name, 'ab').close()
+            self._csv_file = open(self.file_name, 'rb')
+            if not self._load():
+                self._reset()
+            self.refresh()
+        return self
+
+    def refresh(self):
+        """Indexes the rows appended to the CSV file since the last refresh.
+
+        Rebuilds the indexes if the indexed part of the file was changed.
+
+        Returns:
+            int: The number of rows indexed.
+        """
+        stat = os.fstat(self._csv_file.fileno())
+        if stat.st_size == self.indexed_size and stat.st_mtime_ns == self._indexed_mtime_ns:
+            if self._csv_map is None:
+                self._map_csv(stat.st_size)
+            return 0
+
+        if not self._indexed_part_unchanged(stat):
+            self._reset()
+
+        size = stat.st_size
+        self._map_csv(size)
+
+        added = 0
+        phones = self._phones
+        phone_chain = self._phone_chain
+        for offset, row in iter_csv_records(self.file_name, self.indexed_size):
+            if offset >= size:
+                break
+            if offset == 0:
+                continue  # The header row
+            if len(row) > PHONE_COLUMN:
+                # Rows with the same phone are chained from the newest to the oldest
+                key = key_hash(normalize_phone(row[PHONE_COLUMN]))
+                previous = phones.get(key)
+                phones.put(key, offset)
+                if previous is not None:
+                    phone_chain.put(offset, previous)
+            self._name_log.append(offset)
+            self._log_names.append(normalize_name(row[NAME_COLUMN]) if row else '')
+            added += 1
+
+        with open(self.file_name + NAME_LOG_SUFFIX, 'ab') as file:
+            self._name_log[len(self._name_log) - added:].tofile(file)
+
+        self._checksum = prefix_checksum(self._csv_file, size, self.indexed_size, self._checksum)
+        self.indexed_size = size
+        self._indexed_mtime_ns = stat.st_mtime_ns
+        self.rows_indexed += added
+
+        if len(self._name_log) >= self.merge_threshold:
+            self.merge_names()
+        self._save_meta()
+        return added
+
+    def rebuild(self):
+        """Throws the indexes away and indexes the whole CSV file again."""
+        self._reset()
+        self.refresh()
+
+    def find_by_phone(self, phone):
+        """Returns the rows with the given phone number, in file order.
+
+        Args:
+            phone (str): The phone number. Only its digits are compared.
+
+        Returns:
+            list: The matching rows as [name, address, phone] lists.
+        """
+        digits = normalize_phone(phone)
+        rows = []
+        offset = self._phones.get(key_hash(digits))
+        while offset is not None:
+            row = self._row_at(offset)
+            # Different numbers can share a hash, so check the row itself
+            if len(row) > PHONE_COLUMN and normalize_phone(row[PHONE_COLUMN]) == digits:
+                rows.append(row)
+            offset = self._phone_chain.get(offset)
+
+        rows.reverse()
+        return rows
+
+    def find_by_name_prefix(self, prefix, limit=None):
+        """Returns the rows whose name starts with prefix, ignoring case, sorted by name.
+
+        Args:
+            prefix (str): The start of the name.
+            limit (int): The maximum number of rows to return, or None for all of them.
+
+        Returns:
+            list: The matching rows as [name, address, phone] lists.
+        """
+        key = normalize_name(prefix)
+        matches = []
+
+        # Binary search the sorted index, then walk forward while the names match
+        if self._names is not None:
+            position = bisect_left(self._names, key, key=self._name_key_at)
+            while position < len(self._names) and (limit is None or len(matches) < limit):
+                row = self._row_at(self._names[position])
+                if not normalize_name(row[NAME_COLUMN]).startswith(key):
+                    break
+                matches.append(row)
+                position += 1
+
+        # Names that were not merged yet are checked one by one
+        for offset, name in zip(self._name_log, self._log_names):
+            if name.startswith(key):
+                matches.append(self._row_at(offset))
+
+        matches.sort(key=lambda row: normalize_name(row[NAME_COLUMN]))
+        return matches if limit is None else matches[:limit]
+
+    def merge_names(self):
+        """Sorts the names in the log and merges them into the sorted name index."""
+        if not self._name_log:
+            return
+
+        # Only the new names are sorted. Each one is placed with a binary search, so the
+        # rows already in the index are not read again; their offsets are copied in blocks.
+        new_entries = sorted(zip(self._log_names, self._name_log))
+        old_offsets = self._names if self._names is not None else memoryview(array('Q'))
+        merged = array('Q')
+        copied = 0
+        for name, offset in new_entries:
+            position = bisect_right(old_offsets, name, lo=copied, key=self._name_key_at)
+            merged.frombytes(old_offsets[copied:position].tobytes())
+            merged.append(offset)
+            copied = position
+        merged.frombytes(old_offsets[copied:].tobytes())
+
+        # Write the new index next to the old one, then swap them
+        temp_name = self.file_name + NAME_INDEX_SUFFIX + '.tmp'
+        with open(temp_name, 'wb') as file:
+            merged.tofile(file)
+        self._unmap_names()
+        os.replace(temp_name, self.file_name + NAME_INDEX_SUFFIX)
+        self._map_names()
+
+        self._name_log = array('Q')
+        self._log_names = []
+        open(self.file_name + NAME_LOG_SUFFIX, 'wb').close()
+
+    def close(self):
+        """Saves and closes the index files."""
+        if self._csv_file is None:
+            return
+
+        self._phones.close()
+        self._phone_chain.close()
+        self._unmap_names()
+        if self._csv_map is not None:
+            self._csv_map.close()
+            self._csv_map = None
+        self._csv_file.close()
+        self._csv_file = None
+
+    def __len__(self):
+        return self.rows_indexed
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _row_at(self, offset):
+        # Parse the row that starts at offset straight from the memory-mapped CSV file
+        self._csv_map.seek(offset)
+        lines = iter(lambda: self._csv_map.readline().decode(ENCODING), '')
+        return next(csv.reader(lines), [])
+
+    def _name_key_at(self, offset):
+        row = self._row_at(offset)
+        return normalize_name(row[NAME_COLUMN]) if row else ''
+
+    def _load(self):
+        # Returns True if the saved indexes exist and can be used
+        try:
+            with open(self.file_name + META_SUFFIX, 'r') as file:
+                meta = json.load(file)
+            self.indexed_size = meta['indexed_size']
+            self._indexed_mtime_ns = meta['mtime_ns']
+            self._checksum = meta['checksum']
+            self.rows_indexed = meta['rows']
+
+            with open(self.file_name + NAME_LOG_SUFFIX, 'rb') as file:
+                self._name_log = array('Q', file.read())
+            self._phones.open()
+            self._phone_chain.open()
+            self._map_names()
+        except (OSError, ValueError, KeyError):
+            return False
+
+        stat = os.fstat(self._csv_file.fileno())
+        if not self._indexed_part_unchanged(stat):
+            return False
+
+        self._map_csv(self.indexed_size)
+        self._log_names = [self._name_key_at(offset) for offset in self._name_log]
+        return True
+
+    def _reset(self):
+        self.indexed_size = 0
+        self._indexed_mtime_ns = None
+        self._checksum = 0
+        self.rows_indexed = 0
+        self._phones.clear()
+        self._phone_chain.clear()
+        self._unmap_names()
+        self._name_log = array('Q')
+        self._log_names = []
+        for suffix in (NAME_INDEX_SUFFIX, NAME_LOG_SUFFIX):
+            open(self.file_name + suffix, 'wb').close()
+
+    def _indexed_part_unchanged(self, stat):
+        # Appending rows keeps the indexed part as it was. A file that shrank, changed
+        # without growing, or has any different bytes in the indexed part was edited.
+        if stat.st_size < self.indexed_size:
+            return False
+        if stat.st_size == self.indexed_size:
+            return stat.st_mtime_ns == self._indexed_mtime_ns
+        return prefix_unchanged(self._csv_file, self.indexed_size, self._checksum)
+
+    def _save_meta(self):
+        self._phones.flush()
+        self._phone_chain.flush()
+        meta = {
+            'indexed_size': self.indexed_size,
+            'mtime_ns': self._indexed_mtime_ns,
+            'checksum': self._checksum,
+            'rows': self.rows_indexed,
+        }
+        with open(self.file_name + META_SUFFIX, 'w') as file:
+            json.dump(meta, file)
+
+    def _map_csv(self, size):
+        if self._csv_map is not None:
+            self._csv_map.close()
+            self._csv_map = None
+        if size:
+            self._csv_map = mmap.mmap(self._csv_file.fileno(), size, access=mmap.ACCESS_READ)
+
+    def _map_names(self):
+        self._names_file = open(self.file_name + NAME_INDEX_SUFFIX, 'rb')
+        if os.fstat(self._names_file.fileno()).st_size:
+            self._names_map = mmap.mmap(self._names_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._names = memoryview(self._names_map).cast('Q')
+
+    def _unmap_names(self):
+        if self._names is not None:
+            self._names.release()
+            self._names_map.close()
+        if self._names_file is not None:
+            self._names_file.close()
+        self._names = None
+        self._names_map = None
+        self._names_file = None
+
+
+def normalize_phone(phone):
+    """Keeps only the digits of a phone number, so 555-123-4567 and (555) 123 4567 match."""
+    return NON_DIGITS_PATTERN.sub('', phone)
+
+
+def normalize_name(name):
+    """Folds the case of a name so lookups ignore case."""
+    return name.casefold()
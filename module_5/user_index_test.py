@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+
+from main_m5 import User
+from user_store import UserStore
+from user_index import UserIndex
+
+
+class UserIndexTests(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary CSV file with some users."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_file_path = os.path.join(self.test_dir.name, "users.csv")
+        self.users = [User(f"User {i:03}", f"{i} Main St", f"555-123-{i:04}") for i in range(300)]
+        self.users.append(User("alice Smith", "1 Elm St", "555-123-0001"))
+
+        with UserStore(self.test_file_path) as store:
+            store.extend(self.users)
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def test_find_by_phone(self):
+        """Test that every row with a phone number is found, whatever its formatting."""
+        with UserIndex(self.test_file_path) as index:
+            self.assertEqual(index.find_by_phone("555-123-0001"),
+                             [['User 001', '1 Main St', '555-123-0001'],
+                              ['alice Smith', '1 Elm St', '555-123-0001']])
+            self.assertEqual(index.find_by_phone("(555) 123 0042"), [['User 042', '42 Main St', '555-123-0042']])
+            self.assertEqual(index.find_by_phone("555-999-9999"), [])
+
+    def test_find_by_name_prefix(self):
+        """Test that prefix lookups ignore case and come back sorted by name."""
+        with UserIndex(self.test_file_path, merge_threshold=50) as index:
+            names = [row[0] for row in index.find_by_name_prefix("user 01")]
+            self.assertEqual(names, [f"User {i:03}" for i in range(10, 20)])
+            self.assertEqual(index.find_by_name_prefix("ALICE"), [['alice Smith', '1 Elm St', '555-123-0001']])
+            self.assertEqual(len(index.find_by_name_prefix("user", limit=5)), 5)
+            self.assertEqual(index.find_by_name_prefix("bob"), [])
+
+    def test_store_keeps_index_up_to_date(self):
+        """Test that rows appended through a store are found in both the sorted index and the log."""
+        with UserIndex(self.test_file_path, merge_threshold=50) as index:
+            with UserStore(self.test_file_path, batch_size=10, index=index) as store:
+                for i in range(75):
+                    store.append(User(f"New User {i:02}", "1 Oak St", f"555-777-{i:04}"))
+
+            self.assertEqual(len(index), 376)
+            self.assertEqual(index.find_by_phone("555-777-0074")[0][0], "New User 74")
+            self.assertEqual(len(index.find_by_name_prefix("new user")), 75)
+            self.assertEqual([row[0] for row in index.find_by_name_prefix("new user 0")],
+                             [f"New User {i:02}" for i in range(10)])
+
+    def test_index_catches_up_after_reopening(self):
+        """Test that a reopened index only adds rows appended while it was closed."""
+        with UserIndex(self.test_file_path) as index:
+            self.assertEqual(len(index), 301)
+
+        with UserStore(self.test_file_path) as store:
+            store.append(User("Zed", "9 Pine St", "555-000-0000"))
+
+        with UserIndex(self.test_file_path) as index:
+            self.assertEqual(index.refresh(), 0)
+            self.assertEqual(len(index), 302)
+            self.assertEqual(index.find_by_phone("555-000-0000"), [['Zed', '9 Pine St', '555-000-0000']])
+
+    def test_index_is_rebuilt_when_file_is_rewritten(self):
+        """Test that editing the CSV file outside the store rebuilds the index."""
+        with UserIndex(self.test_file_path) as index:
+            self.assertEqual(len(index), 301)
+
+        with UserStore(self.test_file_path + ".new") as store:
+            store.extend(self.users[:5])
+        os.replace(self.test_file_path + ".new", self.test_file_path)
+
+        with UserIndex(self.test_file_path) as index:
+            self.assertEqual(len(index), 5)
+            self.assertEqual(index.find_by_phone("555-123-0200"), [])
+            self.assertEqual(len(index.find_by_name_prefix("user")), 5)
+
+    def test_index_is_rebuilt_when_an_edited_file_also_grew(self):
+        """Test that an edit before the end of the indexed rows is found when rows were appended after it."""
+        with UserIndex(self.test_file_path) as index:
+            self.assertEqual(len(index), 301)
+
+        with open(self.test_file_path, 'rb') as file:
+            data = file.read()
+        with open(self.test_file_path, 'wb') as file:
+            file.write(data.replace(b'555-123-0004', b'555-999-0004'))
+        with UserStore(self.test_file_path) as store:
+            store.append(User("Zed", "9 Pine St", "555-000-0000"))
+
+        with UserIndex(self.test_file_path) as index:
+            self.assertEqual(len(index), 302)
+            self.assertEqual(index.find_by_phone("555-999-0004"), [['User 004', '4 Main St', '555-999-0004']])
+            self.assertEqual(index.find_by_phone("555-123-0004"), [])
+            self.assertEqual(index.find_by_phone("555-000-0000"), [['Zed', '9 Pine St', '555-000-0000']])
+
+
+if __name__ == '__main__':
+    unittest.main()
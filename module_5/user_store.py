@@ -0,0 +1,114 @@
+import csv
+import os
+
+CSV_HEADER = ['Name', 'Address', 'Phone Number']
+
+# How often rows are forced to disk with fsync
+FSYNC_NEVER = 'never'  # Leave it to the operating system
+FSYNC_BATCH = 'batch'  # After every batch of rows
+FSYNC_CLOSE = 'close'  # Once, when the store is closed
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_BATCH, FSYNC_CLOSE)
+
+DEFAULT_BATCH_SIZE = 1000
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+class UserStore:
+    """Appends users to a CSV file through one open, buffered file handle.
+
+    The header is written once, when the file is new or empty. Rows are collected and written
+    together in batches of batch_size (a group commit) instead of opening and closing the
+    file for every record.
+
+    Use it as a context manager so the last batch is always written:
+
+        with UserStore("users.csv") as store:
+            store.append(user)
+    """
+
+    def __init__(self, file_name, batch_size=DEFAULT_BATCH_SIZE, fsync=FSYNC_NEVER, index=None):
+        """
+        Args:
+            file_name (str): The CSV file to append to.
+            batch_size (int): The number of rows collected before they are written.
+            fsync (str): One of FSYNC_NEVER, FSYNC_BATCH or FSYNC_CLOSE.
+            index (UserIndex): An open index of the file, refreshed after every batch so it
+                includes the new rows. None to not keep an index up to date.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1.")
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy '{fsync}'. Use one of: {', '.join(FSYNC_POLICIES)}.")
+
+        self.file_name = file_name
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.index = index
+        self.rows_written = 0
+        self._pending = []
+        self._file = None
+        self._csv_writer = None
+
+    def open(self):
+        """Opens the file for appending and writes the header if the file is new or empty."""
+        if self._file is None:
+            self._file = open(self.file_name, 'a', newline='', buffering=WRITE_BUFFER_SIZE)
+            self._csv_writer = csv.writer(self._file)
+
+            # In append mode the position starts at the end, so 0 means the file is empty
+            if self._file.tell() == 0:
+                self._csv_writer.writerow(CSV_HEADER)
+        return self
+
+    def append(self, user):
+        """Adds one user. Anything with name, address and phone attributes can be stored."""
+        self.append_row([user.name, user.address, user.phone])
+
+    def append_row(self, row):
+        """Adds one [name, address, phone] row."""
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def extend(self, users):
+        """Adds many users."""
+        for user in users:
+            self.append(user)
+
+    def flush(self):
+        """Writes the collected rows to the file."""
+        if self._file is None:
+            self.open()
+
+        if self._pending:
+            self._csv_writer.writerows(self._pending)
+            self.rows_written += len(self._pending)
+            self._pending = []
+
+        self._file.flush()
+        if self.fsync == FSYNC_BATCH:
+            os.fsync(self._file.fileno())
+
+        if self.index is not None:
+            self.index.refresh()
+
+    def close(self):
+        """Writes the remaining rows and closes the file."""
+        if self._file is None and not self._pending:
+            return
+
+        try:
+            self.flush()
+            if self.fsync == FSYNC_CLOSE:
+                os.fsync(self._file.fileno())
+        finally:
+            if self._file is not None:
+                self._file.close()
+            self._file = None
+            self._csv_writer = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
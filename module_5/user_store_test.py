@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from main_m5 import User, read_csv_file
+from user_store import UserStore, FSYNC_BATCH, FSYNC_CLOSE
+
+
+class UserStoreTests(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary directory for test files."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_file_path = os.path.join(self.test_dir.name, "users.csv")
+        self.users = [User(f"User {i}", f"{i} Main St", "555-123-4567") for i in range(25)]
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def test_header_is_written_once(self):
+        """Test that reopening the store does not repeat the header."""
+        with UserStore(self.test_file_path) as store:
+            store.extend(self.users[:10])
+        with UserStore(self.test_file_path) as store:
+            store.extend(self.users[10:])
+
+        rows = read_csv_file(self.test_file_path)
+        self.assertEqual(rows[0], ['Name', 'Address', 'Phone Number'])
+        self.assertEqual(len(rows), 26)
+        self.assertEqual(rows[25], ['User 24', '24 Main St', '555-123-4567'])
+
+    def test_header_is_written_to_existing_empty_file(self):
+        """Test that an empty file still gets a header."""
+        open(self.test_file_path, 'w').close()
+        with UserStore(self.test_file_path) as store:
+            store.append(self.users[0])
+
+        self.assertEqual(read_csv_file(self.test_file_path)[0], ['Name', 'Address', 'Phone Number'])
+
+    def test_rows_are_written_in_batches(self):
+        """Test that rows are only written when a batch is full or the store is closed."""
+        store = UserStore(self.test_file_path, batch_size=10).open()
+        store.extend(self.users[:9])
+        self.assertEqual(store.rows_written, 0)
+
+        store.append(self.users[9])
+        self.assertEqual(store.rows_written, 10)
+        self.assertEqual(len(read_csv_file(self.test_file_path)), 11)
+
+        store.append(self.users[10])
+        store.close()
+        self.assertEqual(store.rows_written, 11)
+        self.assertEqual(len(read_csv_file(self.test_file_path)), 12)
+
+    def test_fsync_policies(self):
+        """Test when each fsync policy forces rows to disk."""
+        with patch('user_store.os.fsync') as mock_fsync:
+            with UserStore(self.test_file_path, batch_size=5, fsync=FSYNC_BATCH) as store:
+                store.extend(self.users[:10])
+            self.assertEqual(mock_fsync.call_count, 3)
+
+        with patch('user_store.os.fsync') as mock_fsync:
+            with UserStore(self.test_file_path, batch_size=5, fsync=FSYNC_CLOSE) as store:
+                store.extend(self.users[:10])
+            self.assertEqual(mock_fsync.call_count, 1)
+
+    def test_invalid_settings(self):
+        """Test that invalid batch sizes and fsync policies are rejected."""
+        with self.assertRaises(ValueError):
+            UserStore(self.test_file_path, batch_size=0)
+        with self.assertRaises(ValueError):
+            UserStore(self.test_file_path, fsync='sometimes')
+
+
+if __name__ == '__main__':
+    unittest.main()
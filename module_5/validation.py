@@ -0,0 +1,175 @@
+import csv
+import io
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from csv_pages import ENCODING, iter_record_chunks, map_chunks_in_order
+
+# The patterns are compiled once, when the module is imported.
+# The address pattern does all three address checks in one match: at least 5 characters,
+# at least one letter, and a number followed by whitespace and a word somewhere in the text.
+ADDRESS_PATTERN = re.compile(r'(?s)^(?=.{5})(?=.*[a-zA-Z]).*?\d+\s+\w+')
+PHONE_PATTERN = re.compile(r'^\d{3}-\d{3}-\d{4}$')
+
+# Error bits of a record. A valid record has no bits set.
+VALID = 0
+NAME_MISSING = 1
+ADDRESS_MISSING = 2
+ADDRESS_INVALID = 4
+PHONE_MISSING = 8
+PHONE_INVALID = 16
+WRONG_FIELD_COUNT = 32
+
+ERROR_MESSAGES = {
+    NAME_MISSING: "Name cannot be empty.",
+    ADDRESS_MISSING: "Address cannot be empty.",
+    ADDRESS_INVALID: "Address format is invalid.",
+    PHONE_MISSING: "Phone number cannot be empty.",
+    PHONE_INVALID: "Phone number format is invalid.",
+    WRONG_FIELD_COUNT: "A record must have exactly a name, an address and a phone number.",
+}
+
+FIELD_COUNT = 3
+DEFAULT_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def is_valid_address_format(address):
+    """Validates if the provided address matches basic address conventions.
+    Without a proper address validation library, this is a simple check.
+    The address should be at least 5 characters long, contain some letters and
+    contain at least one number followed by text.
+
+    Args:
+        address (str): The address string to validate.
+
+    Returns:
+        bool: True if the address follows basic conventions, False otherwise.
+    """
+    return ADDRESS_PATTERN.match(address) is not None
+
+
+def is_valid_phone_format(phone):
+    """Validates if the provided phone number matches the XXX-XXX-XXXX format.
+
+    Args:
+        phone (str): The phone number string to validate.
+
+    Returns:
+        bool: True if the phone number is in valid format, False otherwise.
+    """
+    return PHONE_PATTERN.match(phone) is not None
+
+
+def validate_record(name, address, phone):
+    """Validates the fields of one user.
+
+    Returns:
+        int: The error bits of the record, or VALID (0) if every field is valid.
+    """
+    errors = VALID
+    if not name:
+        errors |= NAME_MISSING
+    if not address:
+        errors |= ADDRESS_MISSING
+    elif ADDRESS_PATTERN.match(address) is None:
+        errors |= ADDRESS_INVALID
+    if not phone:
+        errors |= PHONE_MISSING
+    elif PHONE_PATTERN.match(phone) is None:
+        errors |= PHONE_INVALID
+    return errors
+
+
+def validate_batch(records):
+    """Validates many [name, address, phone] records in one pass.
+
+    Args:
+        records (iterable): The records to validate.
+
+    Returns:
+        bytearray: The error bits of each record, in the same order.
+    """
+    address_match = ADDRESS_PATTERN.match
+    phone_match = PHONE_PATTERN.match
+    results = bytearray()
+    append = results.append
+
+    for record in records:
+        if len(record) == FIELD_COUNT:
+            name, address, phone = record
+            errors = VALID
+        else:
+            # Validate what is there and flag the record
+            name, address, phone = (list(record[:FIELD_COUNT]) + ['', '', ''])[:FIELD_COUNT]
+            errors = WRONG_FIELD_COUNT
+
+        if not name:
+            errors |= NAME_MISSING
+        if not address:
+            errors |= ADDRESS_MISSING
+        elif address_match(address) is None:
+            errors |= ADDRESS_INVALID
+        if not phone:
+            errors |= PHONE_MISSING
+        elif phone_match(phone) is None:
+            errors |= PHONE_INVALID
+        append(errors)
+
+    return results
+
+
+def describe_errors(errors):
+    """Turns the error bits of a record into a list of messages."""
+    return [message for bit, message in ERROR_MESSAGES.items() if errors & bit]
+
+
+def validate_file(file_name, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Validates every record of a user CSV file across a pool of worker processes.
+
+    The file is read in chunks of whole records, and each worker parses and validates its own
+    chunks. The header row is skipped.
+
+    Args:
+        file_name (str): The CSV file to validate.
+        workers (int): The number of worker processes. Defaults to the number of cores.
+        chunk_bytes (int): The approximate size of the chunk each task validates.
+
+    Returns:
+        dict: The error bits of every record ('errors'), the number of 'rows' and 'invalid'
+            rows, the 'seconds' it took and the 'rows_per_second'.
+    """
+    if chunk_bytes < 1:
+        raise ValueError("Chunk size must be at least 1 byte.")
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    errors = bytearray()
+
+    with open(file_name, 'rb') as file:
+        file.readline()  # The header row
+        chunks = iter_record_chunks(file, chunk_bytes)
+
+        if workers == 1:
+            for chunk in chunks:
+                errors += validate_chunk(chunk)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk_errors in map_chunks_in_order(executor, validate_chunk, chunks, 2 * workers):
+                    errors += chunk_errors
+
+    seconds = time.perf_counter() - start
+    return {
+        'errors': errors,
+        'rows': len(errors),
+        'invalid': len(errors) - errors.count(VALID),
+        'seconds': seconds,
+        'rows_per_second': len(errors) / seconds if seconds else 0.0,
+    }
+
+
+def validate_chunk(chunk):
+    """Worker task: parses a chunk of CSV bytes and validates its records."""
+    return validate_batch(csv.reader(io.StringIO(chunk.decode(ENCODING), newline='')))
+
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from csv_pages import map_chunks_in_order
+from main_m5 import User
+from user_store import UserStore
+from validation import (
+    ADDRESS_INVALID,
+    ADDRESS_MISSING,
+    NAME_MISSING,
+    PHONE_INVALID,
+    PHONE_MISSING,
+    VALID,
+    WRONG_FIELD_COUNT,
+    describe_errors,
+    validate_batch,
+    validate_chunk,
+    validate_file,
+    validate_record,
+)
+
+
+class ValidationTests(unittest.TestCase):
+    def test_validate_record(self):
+        """Test that each problem sets its own error bit."""
+        self.assertEqual(validate_record("John Doe", "123 Main St", "555-123-4567"), VALID)
+        self.assertEqual(validate_record("", "123 Main St", "555-123-4567"), NAME_MISSING)
+        self.assertEqual(validate_record("John Doe", "", "555-123-4567"), ADDRESS_MISSING)
+        self.assertEqual(validate_record("John Doe", "Main St", "555-123-4567"), ADDRESS_INVALID)
+        self.assertEqual(validate_record("John Doe", "123 Main St", ""), PHONE_MISSING)
+        self.assertEqual(validate_record("", "123", "5551234567"), NAME_MISSING | ADDRESS_INVALID | PHONE_INVALID)
+
+    def test_validate_batch(self):
+        """Test that a batch gives the same bits as validating each record."""
+        records = [
+            ["John Doe", "123 Main St", "555-123-4567"],
+            ["", "AB", "123-45-6789"],
+            ["Jane Doe", "42 Wallaby Way, Sydney"],
+            ["Jim", "1 Elm St", "800-555-1212", "extra"],
+        ]
+        self.assertEqual(list(validate_batch(records)), [
+            VALID,
+            NAME_MISSING | ADDRESS_INVALID | PHONE_INVALID,
+            WRONG_FIELD_COUNT | PHONE_MISSING,
+            WRONG_FIELD_COUNT,
+        ])
+
+    def test_describe_errors(self):
+        """Test that the messages come out in the order the fields are checked."""
+        self.assertEqual(describe_errors(VALID), [])
+        self.assertEqual(describe_errors(PHONE_INVALID | NAME_MISSING),
+                         ["Name cannot be empty.", "Phone number format is invalid."])
+
+
+class ValidateFileTests(unittest.TestCase):
+    def setUp(self):
+        """Create a temporary CSV file with valid users, invalid users and a multi-line address."""
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.test_file_path = os.path.join(self.test_dir.name, "users.csv")
+        self.users = [User(f"User {i}", f"{i} Main St", "555-123-4567") for i in range(500)]
+        self.users[10].phone = "5551234567"
+        self.users[20].address = "Main St"
+        self.users[30].address = '30 Main St\n"Apt 2"'
+
+        with UserStore(self.test_file_path) as store:
+            store.extend(self.users)
+
+    def tearDown(self):
+        """Clean up temporary directory after tests."""
+        self.test_dir.cleanup()
+
+    def test_validate_file_matches_batch(self):
+        """Test that small chunks and several workers give the same result as one batch."""
+        expected = validate_batch([user.name, user.address, user.phone] for user in self.users)
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                stats = validate_file(self.test_file_path, workers=workers, chunk_bytes=256)
+                self.assertEqual(stats['errors'], expected)
+                self.assertEqual(stats['rows'], 500)
+                self.assertEqual(stats['invalid'], 2)
+
+    def test_chunks_are_read_as_they_are_needed(self):
+        """Test that only a few chunks are read ahead of the results that were used."""
+        read = []
+
+        def chunks():
+            for i in range(50):
+                read.append(i)
+                yield b"John Doe,123 Main St,555-123-4567\n"
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for i, errors in enumerate(map_chunks_in_order(executor, validate_chunk, chunks(), 4)):
+                self.assertEqual(errors, bytearray([VALID]))
+                self.assertLessEqual(len(read), i + 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import math
+from array import array
+
+import numpy as np
+
+# Number of values reduced at a time. A block of 64K float64 values (512 KB) stays in the CPU
+# cache while its lowest, highest and total are found, so the numbers are read from memory once.
+BLOCK_SIZE = 1 << 16
+
+
+def is_buffer(numbers):
+    """Checks if numbers are a NumPy array or another buffer of numbers, such as array('d')."""
+    return isinstance(numbers, (np.ndarray, array, memoryview))
+
+
+def as_array(numbers):
+    """Returns a one dimensional NumPy view of a buffer of numbers, without copying it if possible."""
+    values = np.asarray(numbers)
+    if values.dtype.kind not in 'biuf':
+        raise TypeError(f"Cannot calculate statistics of values of type {values.dtype}.")
+    return values.reshape(-1)
+
+
+def accumulator_dtype(dtype):
+    """Returns the type a total of values of the given type is added up in.
+
+    Floats of less than 64 bits are added as float64, and integers as 64-bit integers. A block
+    of integers whose total could overflow 64 bits is added as Python ints instead (see
+    _block_total).
+    """
+    dtype = np.dtype(dtype)
+    if dtype.kind == 'f':
+        return np.result_type(dtype, np.float64)
+    if dtype.kind == 'u':
+        return np.dtype(np.uint64)
+    return np.dtype(np.int64)
+
+
+def buffer_statistics(numbers):
+    """Calculates statistics for a buffer of numbers and returns them as a dictionary.
+
+    The statistics are the same as for a list: plain Python numbers under the keys 'lowest',
+    'highest', 'total' and 'average'. Each block of values is reduced while it is in the cache,
+    and NumPy adds up each block with pairwise summation. The block totals are then added
+    exactly for integers, or with math.fsum for floats.
+
+    Raises ValueError if the buffer is empty, like min and max of an empty list.
+    """
+    values = as_array(numbers)
+    if values.size == 0:
+        raise ValueError("Cannot calculate statistics of an empty sequence")
+
+    dtype = accumulator_dtype(values.dtype)
+    lows = []
+    highs = []
+    totals = []
+    for start in range(0, values.size, BLOCK_SIZE):
+        block = values[start:start + BLOCK_SIZE]
+        low = block.min()
+        high = block.max()
+        lows.append(low)
+        highs.append(high)
+        totals.append(_block_total(block, dtype, low, high))
+
+    total = _add_totals(totals, dtype)
+    return {
+        'lowest': np.min(lows).item(),
+        'highest': np.max(highs).item(),
+        'total': total,
+        'average': total / values.size
+    }
+
+
+def buffer_lowest(numbers):
+    """Finds the lowest number in a buffer."""
+    values = as_array(numbers)
+    if values.size == 0:
+        raise ValueError("Cannot find the lowest of an empty sequence")
+    return values.min().item()
+
+
+def buffer_highest(numbers):
+    """Finds the highest number in a buffer."""
+    values = as_array(numbers)
+    if values.size == 0:
+        raise ValueError("Cannot find the highest of an empty sequence")
+    return values.max().item()
+
+
+def buffer_total(numbers):
+    """Calculates the total of the numbers in a buffer."""
+    values = as_array(numbers)
+    dtype = accumulator_dtype(values.dtype)
+    totals = [_block_total(values[start:start + BLOCK_SIZE], dtype)
+              for start in range(0, values.size, BLOCK_SIZE)]
+    return _add_totals(totals, dtype)
+
+
+def buffer_average(numbers):
+    """Calculates the average of the numbers in a buffer, or 0 if it is empty."""
+    values = as_array(numbers)
+    return buffer_total(values) / values.size if values.size else 0
+
+
+def _block_total(block, dtype, low=None, high=None):
+    if dtype.kind not in 'iu' or block.size == 0:
+        return np.add.reduce(block, dtype=dtype)
+
+    # Add in 64 bits only if no partial sum can go past the 64-bit limits
+    low = int(block.min() if low is None else low)
+    high = int(block.max() if high is None else high)
+    limits = np.iinfo(dtype)
+    if limits.min <= min(low, 0) * block.size and max(high, 0) * block.size <= limits.max:
+        return np.add.reduce(block, dtype=dtype)
+    return sum(block.tolist())
+
+
+def _add_totals(totals, dtype):
+    # Python ints add the integer block totals exactly, whatever their size
+    if dtype.kind in 'iu':
+        return sum(int(total) for total in totals)
+    return math.fsum(totals)
@@ -0,0 +1,78 @@
+import math
+import random
+import unittest
+from array import array
+
+import numpy as np
+
+import fast_stats
+from fast_stats import accumulator_dtype, buffer_average, buffer_statistics, buffer_total, is_buffer
+from main_m6 import calculate_statistics, find_lowest, find_highest, calculate_total, calculate_average
+
+
+class TestFastStats(unittest.TestCase):
+
+    def test_same_statistics_for_list_and_buffers(self):
+        """Test that lists, arrays and NumPy arrays give the same statistics."""
+        numbers = [10.0, 5.0, 20.0, 15.0, 30.0]
+        expected = calculate_statistics(numbers)
+        for buffer in (array('d', numbers), np.array(numbers), memoryview(array('d', numbers))):
+            self.assertEqual(calculate_statistics(buffer), expected)
+
+    def test_returns_python_numbers(self):
+        """Test that the statistics are plain Python numbers, not NumPy scalars."""
+        result = buffer_statistics(np.array([3, 1, 2], dtype=np.int32))
+        self.assertEqual(result, {'lowest': 1, 'highest': 3, 'total': 6, 'average': 2})
+        for value in result.values():
+            self.assertIn(type(value), (int, float))
+
+    def test_helpers_dispatch_on_buffers(self):
+        """Test that the helper functions accept buffers."""
+        numbers = array('d', [10, 5, 20, 15, 30])
+        self.assertEqual(find_lowest(numbers), 5)
+        self.assertEqual(find_highest(numbers), 30)
+        self.assertEqual(calculate_total(numbers), 80)
+        self.assertEqual(calculate_average(numbers), 16)
+        self.assertEqual(calculate_average(np.array([])), 0)
+
+    def test_blocks(self):
+        """Test that statistics over many blocks match one reduction."""
+        values = np.random.default_rng(1).uniform(-1, 1, 5 * fast_stats.BLOCK_SIZE + 123)
+        result = buffer_statistics(values)
+        self.assertEqual(result['lowest'], values.min())
+        self.assertEqual(result['highest'], values.max())
+        self.assertEqual(result['total'], math.fsum(values))
+        self.assertAlmostEqual(result['average'], math.fsum(values) / values.size)
+
+    def test_float32_adds_in_float64(self):
+        """Test that float32 values are added up without float32 rounding."""
+        values = np.full(3 * fast_stats.BLOCK_SIZE, 0.1, dtype=np.float32)
+        self.assertEqual(accumulator_dtype(values.dtype), np.float64)
+        self.assertAlmostEqual(buffer_total(values), float(np.float32(0.1)) * values.size, places=6)
+
+    def test_integers_do_not_overflow(self):
+        """Test that int8 totals and int64 totals larger than 64 bits are exact."""
+        self.assertEqual(buffer_total(np.full(1000, 100, dtype=np.int8)), 100_000)
+        big = np.full(4 * fast_stats.BLOCK_SIZE, 2 ** 46, dtype=np.int64)
+        self.assertEqual(buffer_total(big), 2 ** 64)
+
+    def test_block_total_larger_than_64_bits(self):
+        """Test that a total that overflows 64 bits within one block is exact."""
+        big = np.full(70000, 2 ** 60, dtype=np.int64)
+        self.assertEqual(calculate_total(big), 2 ** 60 * 70000)
+        self.assertEqual(buffer_statistics(big)['total'], 2 ** 60 * 70000)
+        self.assertEqual(buffer_total(np.full(10, -2 ** 62, dtype=np.int64)), -10 * 2 ** 62)
+        self.assertEqual(buffer_total(np.full(10, 2 ** 63, dtype=np.uint64)), 10 * 2 ** 63)
+
+    def test_empty_and_invalid(self):
+        """Test that empty buffers behave like empty lists and other types are rejected."""
+        with self.assertRaises(ValueError):
+            buffer_statistics(array('d'))
+        self.assertEqual(buffer_average(array('d')), 0)
+        with self.assertRaises(TypeError):
+            buffer_statistics(np.array(['a', 'b']))
+        self.assertFalse(is_buffer([random.random()]))
+
+
+if __name__ == '__main__':
+    unittest.main()
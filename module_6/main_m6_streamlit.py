@@ -3,6 +3,10 @@ import streamlit as st
 import random
 import matplotlib.pyplot as plt
 
+from fast_stats import (buffer_average, buffer_highest, buffer_lowest, buffer_statistics, buffer_total,
+                        is_buffer)
+from running_stats import RunningStats
+
 # To run this code, run the command: streamlit run {path to file}
 # The enviroment file should include all dependencies needed.
 
@@ -126,12 +130,25 @@ def display_visualizations(numbers):
         st.pyplot(fig)
 
 def calculate_statistics(numbers):
-    """Calculates statistics for a list of numbers and returns them as a dictionary."""
+    """Calculates statistics for a list or buffer of numbers and returns them as a dictionary."""
+    # NumPy arrays and array('d') buffers are reduced in NumPy
+    if is_buffer(numbers):
+        return buffer_statistics(numbers)
+
+    # Iterators and streams can only be read once, so every statistic is collected in one pass
+    if iter(numbers) is numbers:
+        return RunningStats(numbers).as_statistics()
+
+    # The builtins are fastest for lists and keep Decimal totals exact; the list is added up once
+    # and the average is derived from that total (an empty list has already raised in min)
+    lowest = find_lowest(numbers)
+    highest = find_highest(numbers)
+    total = calculate_total(numbers)
     statistics = {
-        'lowest': find_lowest(numbers),
-        'highest': find_highest(numbers),
-        'total': calculate_total(numbers),
-        'average': calculate_average(numbers)
+        'lowest': lowest,
+        'highest': highest,
+        'total': total,
+        'average': total / len(numbers)
     }
 
     return statistics
@@ -179,21 +196,29 @@ def display_statistics(statistics):
 
 def find_lowest(numbers):
     """Finds the lowest number in a list."""
+    if is_buffer(numbers):
+        return buffer_lowest(numbers)
     return min(numbers)
 
 
 def find_highest(numbers):
     """Finds the highest number in a list."""
+    if is_buffer(numbers):
+        return buffer_highest(numbers)
     return max(numbers)
 
 
 def calculate_total(numbers):
     """Calculates the total of the numbers in a list."""
+    if is_buffer(numbers):
+        return buffer_total(numbers)
     return sum(numbers)
 
 
 def calculate_average(numbers):
     """Calculates the average of the numbers in a list."""
+    if is_buffer(numbers):
+        return buffer_average(numbers)
     return sum(numbers) / len(numbers) if numbers else 0
 
 
@@ -75,6 +75,13 @@ class TestNumberStatistics(unittest.TestCase):
         self.assertEqual(stats['total'], 80)
         self.assertEqual(stats['average'], 16)
 
+    def test_calculate_statistics_adds_up_a_list_once(self):
+        """Test that the average is derived from the total instead of adding up the list again."""
+        with patch('builtins.sum', wraps=sum) as mock_sum:
+            stats = calculate_statistics([10, 5, 20, 15, 30])
+        self.assertEqual(mock_sum.call_count, 1)
+        self.assertEqual(stats['average'], 16)
+
 
 if __name__ == '__main__':
     unittest.main()
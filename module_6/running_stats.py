@@ -0,0 +1,219 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+class RunningStats:
+    """Collects the count, lowest, highest, total, mean and variance of numbers in one pass.
+
+    Numbers can be added one at a time, from any iterable, or from a stream of chunks, so the
+    numbers never have to be in memory all at once. The mean and variance are updated with
+    Welford's method, which stays accurate when the numbers are large or close together.
+    While every number is an int the total is exact; after the first float it is a compensated
+    (Neumaier) sum, like the built-in sum.
+
+    Accumulators for separate parts of the data can be merged into one, so large files can be
+    split up and processed in parallel.
+    """
+
+    def __init__(self, numbers=()):
+        """Creates an accumulator, optionally starting with the given numbers."""
+        self.count = 0
+        self.lowest = None
+        self.highest = None
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._int_total = 0
+        self._float_total = None  # Set to [total, compensation] once a float is added
+        self.update(numbers)
+
+    def add(self, number):
+        """Adds one number."""
+        self.update((number,))
+
+    def update(self, numbers):
+        """Adds every number of an iterable. Returns the accumulator."""
+        count = self.count
+        lowest = self.lowest
+        highest = self.highest
+        mean = self._mean
+        m2 = self._m2
+        add_to_total = self._add_to_total
+
+        for number in numbers:
+            if count == 0:
+                lowest = highest = number
+            elif number < lowest:
+                lowest = number
+            elif number > highest:
+                highest = number
+
+            count += 1
+            delta = number - mean
+            mean += delta / count
+            m2 += delta * (number - mean)
+            add_to_total(number)
+
+        self.count = count
+        self.lowest = lowest
+        self.highest = highest
+        self._mean = mean
+        self._m2 = m2
+        return self
+
+    def update_chunks(self, chunks):
+        """Adds the numbers of every chunk in a stream of chunks. Returns the accumulator."""
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+
+    def merge(self, other):
+        """Adds the numbers collected by another accumulator to this one. Returns this accumulator."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.lowest = other.lowest
+            self.highest = other.highest
+        else:
+            self.lowest = min(self.lowest, other.lowest)
+            self.highest = max(self.highest, other.highest)
+
+        # Combine the means and variances of the two parts (Chan et al.)
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+        self._int_total += other._int_total
+        if other._float_total is not None:
+            self._add_to_total(other._float_total[0])
+            self._add_to_total(other._float_total[1])
+        return self
+
+    @classmethod
+    def combine(cls, accumulators):
+        """Merges accumulators into a new one."""
+        combined = cls()
+        for accumulator in accumulators:
+            combined.merge(accumulator)
+        return combined
+
+    @property
+    def total(self):
+        """The total of the numbers."""
+        if self._float_total is None:
+            return self._int_total
+        total, compensation = self._float_total
+        return self._int_total + total + compensation
+
+    @property
+    def mean(self):
+        """The mean of the numbers, or 0 if there are none."""
+        return self._mean
+
+    @property
+    def variance(self):
+        """The population variance of the numbers, or 0 if there are none."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def sample_variance(self):
+        """The sample variance of the numbers, or 0 if there are fewer than two."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def standard_deviation(self):
+        """The population standard deviation of the numbers."""
+        return math.sqrt(self.variance)
+
+    def as_statistics(self):
+        """Returns the statistics in the same dictionary as calculate_statistics.
+
+        Raises ValueError if no numbers were added, like min and max of an empty list.
+        """
+        if self.count == 0:
+            raise ValueError("Cannot calculate statistics of an empty sequence")
+
+        total = self.total
+        return {
+            'lowest': self.lowest,
+            'highest': self.highest,
+            'total': total,
+            'average': total / self.count
+        }
+
+    def _add_to_total(self, number):
+        if self._float_total is None:
+            if type(number) is int:
+                self._int_total += number
+                return
+            self._float_total = [0.0, 0.0]
+
+        # Neumaier summation: keep the low order bits lost by each addition
+        total, compensation = self._float_total
+        new_total = total + number
+        if abs(total) >= abs(number):
+            compensation += (total - new_total) + number
+        else:
+            compensation += (number - new_total) + total
+        self._float_total[0] = new_total
+        self._float_total[1] = compensation
+
+
+def file_statistics(file_name, workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Calculates the statistics of a file of numbers across a pool of worker processes.
+
+    The numbers are separated by whitespace, usually one per line. The file is split into
+    chunks that end on a line break, each worker collects the statistics of its chunks, and
+    the results are merged.
+
+    Args:
+        file_name (str): The file of numbers.
+        workers (int): The number of worker processes. Defaults to the number of cores.
+        chunk_bytes (int): The approximate size of each chunk.
+
+    Returns:
+        RunningStats: The statistics of every number in the file.
+    """
+    if chunk_bytes < 1:
+        raise ValueError("Chunk size must be at least 1 byte.")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = plan_chunks(file_name, chunk_bytes)
+    names = [file_name] * len(chunks)
+    starts = [start for start, _ in chunks]
+    ends = [end for _, end in chunks]
+
+    if workers == 1 or len(chunks) < 2:
+        return RunningStats.combine(map(chunk_statistics, names, starts, ends))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return RunningStats.combine(executor.map(chunk_statistics, names, starts, ends))
+
+
+def plan_chunks(file_name, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """Splits a file into (start, end) byte ranges of about chunk_bytes that end after a line break."""
+    size = os.path.getsize(file_name)
+    chunks = []
+    start = 0
+
+    with open(file_name, 'rb') as file:
+        while start < size:
+            file.seek(min(start + chunk_bytes, size))
+            file.readline()
+            end = min(file.tell(), size)
+            chunks.append((start, end))
+            start = end
+
+    return chunks
+
+
+def chunk_statistics(file_name, start, end):
+    """Worker task: collects the statistics of the numbers in one byte range of a file."""
+    with open(file_name, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+    return RunningStats(map(float, data.split()))
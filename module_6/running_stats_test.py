@@ -0,0 +1,104 @@
+import math
+import os
+import random
+import statistics
+import tempfile
+import unittest
+from decimal import Decimal
+
+from main_m6 import calculate_statistics
+from running_stats import RunningStats, file_statistics, plan_chunks
+
+
+class TestRunningStats(unittest.TestCase):
+
+    def test_matches_list_statistics(self):
+        """Test that one pass gives the same lowest, highest, total and average as the list functions."""
+        result = RunningStats([10, 5, 20, 15, 30]).as_statistics()
+        self.assertEqual(result, {'lowest': 5, 'highest': 30, 'total': 80, 'average': 16})
+
+    def test_int_total_is_exact(self):
+        """Test that a total of ints stays an exact int."""
+        stats = RunningStats([2 ** 60, 1, -(2 ** 60)])
+        self.assertEqual(stats.total, 1)
+        self.assertIsInstance(stats.total, int)
+
+    def test_float_total_is_compensated(self):
+        """Test that the float total does not lose small numbers next to large ones."""
+        numbers = [1e16, 1.0, -1e16] * 1000
+        self.assertEqual(RunningStats(numbers).total, math.fsum(numbers))
+
+    def test_variance(self):
+        """Test the mean and variances against the statistics module."""
+        generator = random.Random(0)
+        numbers = [generator.uniform(1e9, 1e9 + 1) for _ in range(1000)]
+        stats = RunningStats(numbers)
+        self.assertAlmostEqual(stats.mean / statistics.fmean(numbers), 1, delta=1e-12)
+        self.assertAlmostEqual(stats.variance / statistics.pvariance(numbers), 1, delta=1e-5)
+        self.assertAlmostEqual(stats.sample_variance / statistics.variance(numbers), 1, delta=1e-5)
+
+    def test_chunks_and_merge(self):
+        """Test that chunks and merged accumulators give the same result as one pass."""
+        numbers = [random.uniform(-100, 100) for _ in range(1000)]
+        whole = RunningStats(numbers)
+        chunked = RunningStats().update_chunks(numbers[i:i + 64] for i in range(0, len(numbers), 64))
+        merged = RunningStats.combine(RunningStats(numbers[i:i + 300]) for i in range(0, len(numbers), 300))
+
+        for stats in (chunked, merged):
+            self.assertEqual(stats.count, whole.count)
+            self.assertEqual(stats.lowest, whole.lowest)
+            self.assertEqual(stats.highest, whole.highest)
+            self.assertAlmostEqual(stats.total, whole.total, places=9)
+            self.assertAlmostEqual(stats.variance, whole.variance, places=9)
+
+    def test_empty(self):
+        """Test that an empty accumulator raises ValueError like min of an empty list."""
+        stats = RunningStats()
+        self.assertEqual(stats.count, 0)
+        self.assertEqual(stats.variance, 0.0)
+        with self.assertRaises(ValueError):
+            stats.as_statistics()
+
+    def test_calculate_statistics_of_iterator(self):
+        """Test that calculate_statistics reads an iterator once and a list with the builtins."""
+        self.assertEqual(calculate_statistics(iter([10, 5, 20, 15, 30])),
+                         {'lowest': 5, 'highest': 30, 'total': 80, 'average': 16})
+        numbers = [Decimal('1.10'), Decimal('2.20')]
+        self.assertEqual(calculate_statistics(numbers)['total'], Decimal('3.30'))
+
+
+class TestFileStatistics(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.temp_dir.name, "numbers.txt")
+        self.numbers = [round(random.uniform(-1000, 1000), 3) for _ in range(2000)]
+        with open(self.file_name, 'w') as file:
+            file.write('\n'.join(map(str, self.numbers)))
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_chunks_end_on_line_breaks(self):
+        """Test that the chunks cover the file and no number is split between two chunks."""
+        chunks = plan_chunks(self.file_name, 100)
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], os.path.getsize(self.file_name))
+        with open(self.file_name, 'rb') as file:
+            data = file.read()
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b'\n')
+
+    def test_file_statistics(self):
+        """Test that the statistics of a file split across workers match the list."""
+        for workers in (1, 2):
+            stats = file_statistics(self.file_name, workers=workers, chunk_bytes=1000)
+            self.assertEqual(stats.count, len(self.numbers))
+            self.assertEqual(stats.lowest, min(self.numbers))
+            self.assertEqual(stats.highest, max(self.numbers))
+            self.assertAlmostEqual(stats.total, math.fsum(self.numbers), places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()